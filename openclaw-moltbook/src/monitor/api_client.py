@@ -10,19 +10,88 @@ Key features:
 - Rate limit header tracking
 - Configurable User-Agent
 - Support for all public Moltbook API endpoints
+- Async HTTP/2 variants for concurrent comment fetches
+- Keep-alive connection pool shared across client instances
 """
 
+import asyncio
+import atexit
 import os
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from enum import Enum
-from typing import Any
+from enum import StrEnum
+from threading import Lock
+from typing import Any, TypeVar
 
 import httpx
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads  # type: ignore[assignment]
 
-class PostSort(str, Enum):
-    """Sort options for posts endpoint."""
+# Connection pool limits for the sync and async HTTP clients
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Pooled sync clients keyed by (proxy_base_url, user_agent, timeout), so that
+# MoltbookClient instances in the same process reuse one keep-alive pool.
+# _shared_client_users counts the instances holding each pooled client; both
+# dicts are guarded by _shared_clients_lock.
+_shared_clients: dict[tuple[str, str, float], httpx.Client] = {}
+_shared_client_users: dict[tuple[str, str, float], int] = {}
+_shared_clients_lock = Lock()
+
+
+def close_shared_clients() -> None:
+    """Close all pooled sync HTTP clients.
+
+    Registered with atexit so pooled sockets are released on interpreter exit
+    even when an instance was never closed.
+    """
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+        _shared_client_users.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_shared_clients)
+
+
+_T = TypeVar("_T")
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an API timestamp into an aware datetime.
+
+    The API may return ISO 8601 strings or Unix timestamps. Since Python 3.11
+    datetime.fromisoformat is implemented in C and accepts a trailing "Z", so
+    strings are parsed directly without rewriting the suffix.
+
+    Args:
+        value: Raw "created_at" value from the API
+
+    Returns:
+        Parsed datetime, or the current time if the value is missing
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if isinstance(value, int | float):
+        return datetime.fromtimestamp(value, tz=UTC)
+    return datetime.now(UTC)
+
+
+class PostSort(StrEnum):
+    """Sort options for posts endpoint.
+
+    Members are plain strings, so they can be passed as query params directly.
+    """
 
     NEW = "new"
     HOT = "hot"
@@ -30,7 +99,7 @@ class PostSort(str, Enum):
     RISING = "rising"
 
 
-class CommentSort(str, Enum):
+class CommentSort(StrEnum):
     """Sort options for comments endpoint."""
 
     TOP = "top"
@@ -38,7 +107,13 @@ class CommentSort(str, Enum):
     CONTROVERSIAL = "controversial"
 
 
-@dataclass
+# Lowercased raw header names read by RateLimitInfo.from_headers
+_LIMIT_HEADER = b"x-ratelimit-limit"
+_REMAINING_HEADER = b"x-ratelimit-remaining"
+_RESET_HEADER = b"x-ratelimit-reset"
+
+
+@dataclass(slots=True)
 class RateLimitInfo:
     """Rate limit information from API response headers."""
 
@@ -48,10 +123,21 @@ class RateLimitInfo:
 
     @classmethod
     def from_headers(cls, headers: httpx.Headers) -> "RateLimitInfo":
-        """Parse rate limit info from response headers."""
-        limit = headers.get("X-RateLimit-Limit")
-        remaining = headers.get("X-RateLimit-Remaining")
-        reset = headers.get("X-RateLimit-Reset")
+        """Parse rate limit info from response headers.
+
+        Headers.get() scans every header per lookup, so the three values are
+        collected in one pass over the raw (bytes) headers instead; int() and
+        float() accept the bytes values directly.
+        """
+        limit = remaining = reset = None
+        for key, value in headers.raw:
+            key = key.lower()
+            if key == _LIMIT_HEADER:
+                limit = value
+            elif key == _REMAINING_HEADER:
+                remaining = value
+            elif key == _RESET_HEADER:
+                reset = value
 
         return cls(
             limit=int(limit) if limit else None,
@@ -60,7 +146,7 @@ class RateLimitInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Moltbook post data model."""
 
@@ -77,31 +163,63 @@ class Post:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> "Post":
         """Create Post from API response data."""
-        # Handle timestamps - API may return ISO format or Unix timestamp
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            # ISO format
-            created_at_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        elif isinstance(created_at, int | float):
-            # Unix timestamp
-            created_at_dt = datetime.fromtimestamp(created_at, tz=UTC)
-        else:
-            created_at_dt = datetime.now(UTC)
+        return cls(*_post_values(data))
 
-        return cls(
-            id=str(data.get("id", "")),
-            title=data.get("title", ""),
-            content=data.get("content"),
-            url=data.get("url"),
-            submolt=data.get("submolt", ""),
-            agent_id=str(data.get("agent_id", data.get("author_id", ""))),
-            score=data.get("score", 0),
-            created_at=created_at_dt,
-            comment_count=data.get("comment_count", data.get("num_comments", 0)),
-        )
 
+def _post_values(data: dict[str, Any]) -> tuple[Any, ...]:
+    """Resolve raw post data to Post field values, in field order.
+
+    Shared by Post.from_api_response, which passes the values positionally
+    instead of building a keyword dict, and normalize_post.
+
+    Args:
+        data: Raw post dict from the API
+
+    Returns:
+        Tuple of values for the Post fields
+    """
+    return (
+        str(data.get("id", "")),
+        data.get("title", ""),
+        data.get("content"),
+        data.get("url"),
+        data.get("submolt", ""),
+        str(data["agent_id"] if "agent_id" in data else data.get("author_id", "")),
+        data.get("score", 0),
+        _parse_timestamp(data.get("created_at")),
+        data["comment_count"] if "comment_count" in data else data.get("num_comments", 0),
+    )
+
+
+def normalize_post(data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize raw post data to Post field names and types.
+
+    Resolves alternative field names (author_id, num_comments) and parses
+    the created_at timestamp, without building a Post object.
+
+    Args:
+        data: Raw post dict from the API
 
-@dataclass
+    Returns:
+        Dict with exactly the Post fields as keys
+    """
+    (post_id, title, content, url, submolt, agent_id, score, created_at, comment_count) = (
+        _post_values(data)
+    )
+    return {
+        "id": post_id,
+        "title": title,
+        "content": content,
+        "url": url,
+        "submolt": submolt,
+        "agent_id": agent_id,
+        "score": score,
+        "created_at": created_at,
+        "comment_count": comment_count,
+    }
+
+
+@dataclass(slots=True)
 class Comment:
     """Moltbook comment data model."""
 
@@ -116,26 +234,19 @@ class Comment:
     @classmethod
     def from_api_response(cls, data: dict[str, Any], post_id: str) -> "Comment":
         """Create Comment from API response data."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        elif isinstance(created_at, int | float):
-            created_at_dt = datetime.fromtimestamp(created_at, tz=UTC)
-        else:
-            created_at_dt = datetime.now(UTC)
-
+        parent_id = data.get("parent_id")
         return cls(
             id=str(data.get("id", "")),
             post_id=post_id,
-            parent_id=str(data.get("parent_id")) if data.get("parent_id") else None,
-            content=data.get("content", data.get("body", "")),
-            agent_id=str(data.get("agent_id", data.get("author_id", ""))),
+            parent_id=str(parent_id) if parent_id else None,
+            content=data["content"] if "content" in data else data.get("body", ""),
+            agent_id=str(data["agent_id"] if "agent_id" in data else data.get("author_id", "")),
             score=data.get("score", 0),
-            created_at=created_at_dt,
+            created_at=_parse_timestamp(data.get("created_at")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Moltbook agent (user) profile data model."""
 
@@ -148,24 +259,16 @@ class Agent:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> "Agent":
         """Create Agent from API response data."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        elif isinstance(created_at, int | float):
-            created_at_dt = datetime.fromtimestamp(created_at, tz=UTC)
-        else:
-            created_at_dt = datetime.now(UTC)
-
         return cls(
-            id=str(data.get("id", data.get("name", ""))),
-            name=data.get("name", data.get("username", "")),
-            description=data.get("description", data.get("bio")),
-            karma=data.get("karma", data.get("total_karma", 0)),
-            created_at=created_at_dt,
+            id=str(data["id"] if "id" in data else data.get("name", "")),
+            name=data["name"] if "name" in data else data.get("username", ""),
+            description=data["description"] if "description" in data else data.get("bio"),
+            karma=data["karma"] if "karma" in data else data.get("total_karma", 0),
+            created_at=_parse_timestamp(data.get("created_at")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Submolt:
     """Moltbook community (submolt) data model."""
 
@@ -178,24 +281,22 @@ class Submolt:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> "Submolt":
         """Create Submolt from API response data."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        elif isinstance(created_at, int | float):
-            created_at_dt = datetime.fromtimestamp(created_at, tz=UTC)
-        else:
-            created_at_dt = datetime.now(UTC)
-
         return cls(
             name=data.get("name", ""),
-            display_name=data.get("display_name", data.get("title", "")),
+            display_name=(
+                data["display_name"] if "display_name" in data else data.get("title", "")
+            ),
             description=data.get("description"),
-            subscriber_count=data.get("subscriber_count", data.get("subscribers", 0)),
-            created_at=created_at_dt,
+            subscriber_count=(
+                data["subscriber_count"]
+                if "subscriber_count" in data
+                else data.get("subscribers", 0)
+            ),
+            created_at=_parse_timestamp(data.get("created_at")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse:
     """Wrapper for API responses with rate limit info."""
 
@@ -206,7 +307,63 @@ class APIResponse:
     error_message: str | None = None
 
 
-@dataclass
+def _extract_items(response: APIResponse, key: str) -> list[Any]:
+    """Extract the list of raw items from a successful list response.
+
+    Handles both a bare list and a dict wrapping it under `key` or "data".
+    """
+    if not (response.success and response.data):
+        return []
+    if isinstance(response.data, list):
+        return response.data
+    items: list[Any] = response.data.get(key, response.data.get("data", []))
+    return items
+
+
+def _parse_items(parse: Callable[[Any], _T], items: Iterable[Any]) -> list[_T]:
+    """Parse raw API items, skipping malformed ones.
+
+    Args:
+        parse: Constructor turning one raw item into a model instance
+        items: Raw items from the API response
+
+    Returns:
+        Parsed model instances, in input order
+    """
+    parsed: list[_T] = []
+    append = parsed.append
+    for item in items:
+        try:
+            append(parse(item))
+        except Exception:
+            # Skip malformed items
+            continue
+    return parsed
+
+
+async def _gather_limited(
+    fetch: Callable[[str], Awaitable[_T]], keys: Iterable[str], concurrency: int
+) -> list[_T]:
+    """Run fetch for every key concurrently, with at most concurrency in flight.
+
+    Args:
+        fetch: Coroutine function issuing one request for a key
+        keys: Keys to fetch
+        concurrency: Maximum number of concurrent requests
+
+    Returns:
+        One result per key, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(key: str) -> _T:
+        async with semaphore:
+            return await fetch(key)
+
+    return list(await asyncio.gather(*(fetch_one(key) for key in keys)))
+
+
+@dataclass(slots=True)
 class MoltbookClient:
     """Read-only client for the Moltbook API.
 
@@ -230,21 +387,85 @@ class MoltbookClient:
     timeout: float = 30.0
     last_rate_limit: RateLimitInfo = field(default_factory=RateLimitInfo)
     _client: httpx.Client | None = field(default=None, repr=False)
+    _aclient: httpx.AsyncClient | None = field(default=None, repr=False)
+    _url_prefix: str = field(default="", init=False, repr=False)
+    _pool_key: tuple[str, str, float] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the proxied API URL prefix shared by every request."""
+        self._url_prefix = (
+            f"{self.proxy_base_url}/proxy/{self.api_host}/api/{self.api_version}/"
+        )
 
     def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client."""
+        """Get or create HTTP client.
+
+        The client is taken from the process-wide pool when another
+        MoltbookClient already uses the same proxy and settings. Transport
+        retries are disabled so retrying stays under BackoffHandler control.
+        httpx advertises every content encoding it can decode (gzip, deflate
+        and, with the brotli extra installed, br) in Accept-Encoding.
+        """
         if self._client is None:
-            self._client = httpx.Client(
+            key = (self.proxy_base_url, self.user_agent, self.timeout)
+            with _shared_clients_lock:
+                client = _shared_clients.get(key)
+                if client is None or client.is_closed:
+                    client = httpx.Client(
+                        timeout=self.timeout,
+                        headers={"User-Agent": self.user_agent},
+                        transport=httpx.HTTPTransport(
+                            http2=True,
+                            retries=0,
+                            limits=CONNECTION_LIMITS,
+                        ),
+                    )
+                    _shared_clients[key] = client
+                    _shared_client_users[key] = 0
+                _shared_client_users[key] += 1
+            self._client = client
+            self._pool_key = key
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get or create the async HTTP/2 client."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                http2=True,
                 timeout=self.timeout,
                 headers={"User-Agent": self.user_agent},
+                limits=CONNECTION_LIMITS,
             )
-        return self._client
+        return self._aclient
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """Close the sync HTTP client.
+
+        A pooled client is closed only once no other instance still holds
+        it; a client passed in directly is always closed.
+        """
+        client, key = self._client, self._pool_key
+        self._client = None
+        self._pool_key = None
+        if client is None:
+            return
+        if key is not None:
+            with _shared_clients_lock:
+                if _shared_clients.get(key) is client:
+                    users = _shared_client_users[key] - 1
+                    if users > 0:
+                        _shared_client_users[key] = users
+                        return
+                    del _shared_clients[key]
+                    del _shared_client_users[key]
+        client.close()
+
+    async def aclose(self) -> None:
+        """Close both the sync and async HTTP clients."""
+        self.close()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
 
     def __enter__(self) -> "MoltbookClient":
         """Context manager entry."""
@@ -254,14 +475,64 @@ class MoltbookClient:
         """Context manager exit."""
         self.close()
 
+    async def __aenter__(self) -> "MoltbookClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
     def _build_url(self, path: str) -> str:
         """Build full URL routing through proxy.
 
         The proxy expects URLs in format: /proxy/{host}/{path}
         """
         # Remove leading slash if present
-        path = path.lstrip("/")
-        return f"{self.proxy_base_url}/proxy/{self.api_host}/api/{self.api_version}/{path}"
+        return self._url_prefix + path.lstrip("/")
+
+    def _build_response(self, response: httpx.Response) -> APIResponse:
+        """Convert an HTTP response into an APIResponse.
+
+        Updates the tracked rate limit info from the response headers.
+        """
+        self.last_rate_limit = RateLimitInfo.from_headers(response.headers)
+
+        if response.status_code == 200:
+            return APIResponse(
+                data=json_loads(response.content),
+                rate_limit=self.last_rate_limit,
+                status_code=response.status_code,
+                success=True,
+            )
+
+        error_msg = f"API returned status {response.status_code}"
+        try:
+            error_data = json_loads(response.content)
+            if "error" in error_data:
+                error_msg = error_data["error"]
+            elif "message" in error_data:
+                error_msg = error_data["message"]
+        except Exception:
+            error_msg = response.text[:200] if response.text else error_msg
+
+        return APIResponse(
+            data=None,
+            rate_limit=self.last_rate_limit,
+            status_code=response.status_code,
+            success=False,
+            error_message=error_msg,
+        )
+
+    def _error_response(self, error_message: str) -> APIResponse:
+        """Build an APIResponse for a request that never got a response."""
+        return APIResponse(
+            data=None,
+            rate_limit=self.last_rate_limit,
+            status_code=0,
+            success=False,
+            error_message=error_message,
+        )
 
     def _request(self, path: str, params: dict[str, Any] | None = None) -> APIResponse:
         """Make a GET request through the proxy.
@@ -278,60 +549,43 @@ class MoltbookClient:
 
         try:
             response = client.get(url, params=params)
+            return self._build_response(response)
+        except httpx.TimeoutException as e:
+            return self._error_response(f"Request timeout: {e}")
+        except httpx.ConnectError as e:
+            return self._error_response(f"Connection error: {e}")
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+            # Other transport failures, a malformed URL, or a non-JSON success body
+            return self._error_response(f"Request error: {e}")
 
-            # Update rate limit info
-            self.last_rate_limit = RateLimitInfo.from_headers(response.headers)
+    async def _arequest(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> APIResponse:
+        """Make an async GET request through the proxy.
 
-            if response.status_code == 200:
-                return APIResponse(
-                    data=response.json(),
-                    rate_limit=self.last_rate_limit,
-                    status_code=response.status_code,
-                    success=True,
-                )
-            else:
-                error_msg = f"API returned status {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_msg = error_data["error"]
-                    elif "message" in error_data:
-                        error_msg = error_data["message"]
-                except Exception:
-                    error_msg = response.text[:200] if response.text else error_msg
-
-                return APIResponse(
-                    data=None,
-                    rate_limit=self.last_rate_limit,
-                    status_code=response.status_code,
-                    success=False,
-                    error_message=error_msg,
-                )
+        Async counterpart of _request; concurrent calls share the
+        multiplexed connection of the async client.
+
+        Args:
+            path: API path (e.g., "posts")
+            params: Query parameters
+
+        Returns:
+            APIResponse with data and rate limit info
+        """
+        url = self._build_url(path)
+        client = self._get_async_client()
 
+        try:
+            response = await client.get(url, params=params)
+            return self._build_response(response)
         except httpx.TimeoutException as e:
-            return APIResponse(
-                data=None,
-                rate_limit=self.last_rate_limit,
-                status_code=0,
-                success=False,
-                error_message=f"Request timeout: {e}",
-            )
+            return self._error_response(f"Request timeout: {e}")
         except httpx.ConnectError as e:
-            return APIResponse(
-                data=None,
-                rate_limit=self.last_rate_limit,
-                status_code=0,
-                success=False,
-                error_message=f"Connection error: {e}",
-            )
-        except Exception as e:
-            return APIResponse(
-                data=None,
-                rate_limit=self.last_rate_limit,
-                status_code=0,
-                success=False,
-                error_message=f"Request error: {e}",
-            )
+            return self._error_response(f"Connection error: {e}")
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+            # Other transport failures, a malformed URL, or a non-JSON success body
+            return self._error_response(f"Request error: {e}")
 
     def get_posts(
         self,
@@ -350,7 +604,7 @@ class MoltbookClient:
             APIResponse with list of post data
         """
         params: dict[str, Any] = {
-            "sort": sort.value,
+            "sort": sort,
             "limit": min(limit, 25),
         }
         if after:
@@ -386,11 +640,33 @@ class MoltbookClient:
             APIResponse with list of comment data
         """
         params: dict[str, Any] = {
-            "sort": sort.value,
+            "sort": sort,
             "limit": min(limit, 100),
         }
         return self._request(f"posts/{post_id}/comments", params)
 
+    async def aget_comments(
+        self,
+        post_id: str,
+        sort: CommentSort = CommentSort.TOP,
+        limit: int = 25,
+    ) -> APIResponse:
+        """Fetch comments for a post without blocking the event loop.
+
+        Args:
+            post_id: The post ID to get comments for
+            sort: Sort order (top, new, controversial)
+            limit: Number of comments to fetch
+
+        Returns:
+            APIResponse with list of comment data
+        """
+        params: dict[str, Any] = {
+            "sort": sort,
+            "limit": min(limit, 100),
+        }
+        return await self._arequest(f"posts/{post_id}/comments", params)
+
     def get_submolts(self) -> APIResponse:
         """Fetch list of all submolts (communities).
 
@@ -410,6 +686,34 @@ class MoltbookClient:
         """
         return self._request(f"submolts/{name}")
 
+    async def aget_submolt(self, name: str) -> APIResponse:
+        """Fetch details for a specific submolt without blocking the event loop.
+
+        Args:
+            name: The submolt name
+
+        Returns:
+            APIResponse with submolt data
+        """
+        return await self._arequest(f"submolts/{name}")
+
+    async def aget_submolts_many(
+        self, names: list[str], concurrency: int = 16
+    ) -> list[APIResponse]:
+        """Fetch details for several submolts concurrently.
+
+        Requests are issued together over the async client, with at most
+        `concurrency` in flight at once.
+
+        Args:
+            names: Submolt names to fetch
+            concurrency: Maximum number of concurrent requests
+
+        Returns:
+            One APIResponse per name, in the same order as names
+        """
+        return await _gather_limited(self.aget_submolt, names, concurrency)
+
     def get_agent_profile(self, name: str) -> APIResponse:
         """Fetch an agent's profile.
 
@@ -451,23 +755,32 @@ class MoltbookClient:
             Tuple of (list of Post objects, raw APIResponse)
         """
         response = self.get_posts(sort=sort, limit=limit, after=after)
-        posts: list[Post] = []
+        posts = _parse_items(Post.from_api_response, _extract_items(response, "posts"))
+        return posts, response
 
-        if response.success and response.data:
-            # Handle both list and dict with 'posts' key
-            post_list = (
-                response.data
-                if isinstance(response.data, list)
-                else response.data.get("posts", response.data.get("data", []))
-            )
-            for post_data in post_list:
-                try:
-                    posts.append(Post.from_api_response(post_data))
-                except Exception:
-                    # Skip malformed posts
-                    continue
+    def iter_posts_raw(
+        self,
+        sort: PostSort = PostSort.NEW,
+        limit: int = 25,
+        after: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch posts and yield normalized dicts instead of Post objects.
 
-        return posts, response
+        For bulk ingestion that forwards posts to a downstream store and has
+        no use for the dataclasses. Malformed posts are skipped; rate limit
+        info is available on last_rate_limit after the first item.
+
+        Yields:
+            Normalized post dicts (see normalize_post)
+        """
+        response = self.get_posts(sort=sort, limit=limit, after=after)
+        for post_data in _extract_items(response, "posts"):
+            try:
+                normalized = normalize_post(post_data)
+            except Exception:
+                # Skip malformed posts
+                continue
+            yield normalized
 
     def fetch_post(self, post_id: str) -> tuple[Post | None, APIResponse]:
         """Fetch and parse a single post.
@@ -502,21 +815,80 @@ class MoltbookClient:
             Tuple of (list of Comment objects, raw APIResponse)
         """
         response = self.get_comments(post_id=post_id, sort=sort, limit=limit)
-        comments: list[Comment] = []
+        return self._parse_comments(response, post_id), response
 
-        if response.success and response.data:
-            comment_list = (
-                response.data
-                if isinstance(response.data, list)
-                else response.data.get("comments", response.data.get("data", []))
-            )
-            for comment_data in comment_list:
-                try:
-                    comments.append(Comment.from_api_response(comment_data, post_id))
-                except Exception:
-                    continue
+    def iter_comments(
+        self,
+        post_id: str,
+        sort: CommentSort = CommentSort.TOP,
+        limit: int = 25,
+    ) -> Iterator[Comment]:
+        """Fetch comments for a post and yield them one at a time.
+
+        Comment objects are built lazily as the caller consumes them, so only
+        the decoded response and the current Comment are alive at once.
+        Malformed comments are skipped.
+
+        Yields:
+            Comment objects in response order
+        """
+        response = self.get_comments(post_id=post_id, sort=sort, limit=limit)
+        for comment_data in _extract_items(response, "comments"):
+            try:
+                comment = Comment.from_api_response(comment_data, post_id)
+            except Exception:
+                continue
+            yield comment
+
+    async def afetch_comments(
+        self,
+        post_id: str,
+        sort: CommentSort = CommentSort.TOP,
+        limit: int = 25,
+    ) -> tuple[list[Comment], APIResponse]:
+        """Async variant of fetch_comments.
+
+        Returns:
+            Tuple of (list of Comment objects, raw APIResponse)
+        """
+        response = await self.aget_comments(post_id=post_id, sort=sort, limit=limit)
+        return self._parse_comments(response, post_id), response
+
+    async def afetch_comments_many(
+        self,
+        post_ids: list[str],
+        sort: CommentSort = CommentSort.TOP,
+        limit: int = 25,
+        concurrency: int = 16,
+    ) -> list[tuple[list[Comment], APIResponse]]:
+        """Fetch comments for several posts concurrently.
+
+        Requests are issued together over the async client, with at most
+        `concurrency` in flight at once.
+
+        Args:
+            post_ids: Post IDs to fetch comments for
+            sort: Sort order (top, new, controversial)
+            limit: Number of comments to fetch per post
+            concurrency: Maximum number of concurrent requests
+
+        Returns:
+            One (list of Comment objects, raw APIResponse) tuple per post ID,
+            in the same order as post_ids
+        """
+
+        async def fetch_one(post_id: str) -> tuple[list[Comment], APIResponse]:
+            return await self.afetch_comments(post_id, sort=sort, limit=limit)
 
-        return comments, response
+        return await _gather_limited(fetch_one, post_ids, concurrency)
+
+    def _parse_comments(self, response: APIResponse, post_id: str) -> list[Comment]:
+        """Parse a comments response into Comment objects."""
+        from_api_response = Comment.from_api_response
+        return _parse_items(
+            lambda data: from_api_response(data, post_id),
+            _extract_items(response, "comments"),
+        )
 
     def fetch_submolts(self) -> tuple[list[Submolt], APIResponse]:
         """Fetch and parse all submolts.
@@ -525,20 +897,7 @@ class MoltbookClient:
             Tuple of (list of Submolt objects, raw APIResponse)
         """
         response = self.get_submolts()
-        submolts: list[Submolt] = []
-
-        if response.success and response.data:
-            submolt_list = (
-                response.data
-                if isinstance(response.data, list)
-                else response.data.get("submolts", response.data.get("data", []))
-            )
-            for submolt_data in submolt_list:
-                try:
-                    submolts.append(Submolt.from_api_response(submolt_data))
-                except Exception:
-                    continue
-
+        submolts = _parse_items(Submolt.from_api_response, _extract_items(response, "submolts"))
         return submolts, response
 
     def fetch_agent(self, name: str) -> tuple[Agent | None, APIResponse]:
@@ -13,13 +13,18 @@ Maximum delay: 5 minutes (300 seconds)
 
 import logging
 import random
+import time
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Number of precomputed jitter samples per handler (power of two for masking)
+JITTER_TABLE_SIZE = 1024
+
 
 class ErrorType(str, Enum):
     """Types of errors for backoff handling."""
@@ -32,7 +37,28 @@ class ErrorType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Enum members are singletons, so hot-path checks compare by identity
+_CLIENT_ERROR = ErrorType.CLIENT_ERROR
+_TIMEOUT = ErrorType.TIMEOUT
+
+
+def _monotonic_to_datetime(value: float, offset: float | None = None) -> datetime:
+    """Convert a time.monotonic() reading to an aware UTC datetime.
+
+    Args:
+        value: Monotonic clock reading in seconds
+        offset: Precomputed wall-clock minus monotonic offset, so callers
+            converting many values can snapshot it once
+
+    Returns:
+        The corresponding wall-clock datetime
+    """
+    if offset is None:
+        offset = time.time() - time.monotonic()
+    return datetime.fromtimestamp(offset + value, tz=UTC)
+
+
+@dataclass(slots=True)
 class BackoffConfig:
     """Configuration for backoff behavior."""
 
@@ -53,25 +79,76 @@ class BackoffConfig:
     timeout_multiplier: float = 2.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BackoffState:
-    """Current backoff state for an endpoint or operation."""
+    """Current backoff state for an endpoint or operation.
+
+    Timestamps are time.monotonic() readings in seconds; they are only
+    converted to datetimes at the public API boundary.
+    """
 
     error_count: int = 0
-    last_error_at: datetime | None = None
+    last_error_at: float | None = None
     last_error_type: ErrorType | None = None
-    retry_after: datetime | None = None
+    retry_after: float | None = None
     consecutive_successes: int = 0
+    _iso_cache: tuple[float | None, float | None, str | None, str | None] = field(
+        default=(None, None, None, None), init=False, repr=False, compare=False
+    )
 
-    def record_error(self, error_type: ErrorType, retry_after_seconds: float | None = None) -> None:
-        """Record an error occurrence."""
+    def isoformat_timestamps(self, offset: float) -> tuple[str | None, str | None]:
+        """Get last_error_at and retry_after as wall-clock ISO strings.
+
+        The formatted strings are cached until either timestamp changes, so
+        repeated status reads of idle endpoints do no formatting work.
+
+        Args:
+            offset: Wall-clock minus monotonic offset for the conversion
+
+        Returns:
+            Tuple of (last_error_at, retry_after) ISO strings or None
+        """
+        last_error_at = self.last_error_at
+        retry_after = self.retry_after
+        cached = self._iso_cache
+        if cached[0] == last_error_at and cached[1] == retry_after:
+            return cached[2], cached[3]
+
+        last_error_iso = (
+            _monotonic_to_datetime(last_error_at, offset).isoformat()
+            if last_error_at is not None
+            else None
+        )
+        retry_after_iso = (
+            _monotonic_to_datetime(retry_after, offset).isoformat()
+            if retry_after is not None
+            else None
+        )
+        self._iso_cache = (last_error_at, retry_after, last_error_iso, retry_after_iso)
+        return last_error_iso, retry_after_iso
+
+    def record_error(
+        self,
+        error_type: ErrorType,
+        retry_after_seconds: float | None = None,
+        now: float | None = None,
+    ) -> None:
+        """Record an error occurrence.
+
+        Args:
+            error_type: Type of error encountered
+            retry_after_seconds: Retry-After header value if present
+            now: Monotonic clock reading to use, if the caller already has one
+        """
+        if now is None:
+            now = time.monotonic()
         self.error_count += 1
-        self.last_error_at = datetime.now(UTC)
+        self.last_error_at = now
         self.last_error_type = error_type
         self.consecutive_successes = 0
 
         if retry_after_seconds is not None:
-            self.retry_after = datetime.now(UTC) + timedelta(seconds=retry_after_seconds)
+            self.retry_after = now + retry_after_seconds
         else:
             self.retry_after = None
 
@@ -93,7 +170,7 @@ class BackoffState:
         self.consecutive_successes = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BackoffHandler:
     """Handles error backoff calculations and state management.
 
@@ -106,16 +183,58 @@ class BackoffHandler:
 
     config: BackoffConfig = field(default_factory=BackoffConfig)
     endpoint_states: dict[str, BackoffState] = field(default_factory=dict)
+    _rng: random.Random = field(
+        default_factory=random.Random, init=False, repr=False, compare=False
+    )
+    _jitter_table: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _jitter_range: tuple[float, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _jitter_index: int = field(default=0, init=False, repr=False, compare=False)
+    _exp_delays: tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+    _timeout_base: float = field(default=0.0, init=False, repr=False, compare=False)
+    _delay_params: tuple[float, int, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _refresh_delay_table(self) -> None:
+        """Precompute the backoff delay curve for the current config.
+
+        Exponential delays are base_delay * 2^n for n in 0..max_exponent; the
+        table is rebuilt only when the relevant config values change.
+        """
+        config = self.config
+        params = (config.base_delay, config.max_exponent, config.timeout_multiplier)
+        if self._delay_params == params:
+            return
+
+        self._exp_delays = tuple(
+            config.base_delay * (1 << exponent) for exponent in range(config.max_exponent + 1)
+        )
+        self._timeout_base = config.base_delay * config.timeout_multiplier
+        self._delay_params = params
 
     def _get_state(self, endpoint: str) -> BackoffState:
         """Get or create state for an endpoint."""
-        if endpoint not in self.endpoint_states:
-            self.endpoint_states[endpoint] = BackoffState()
-        return self.endpoint_states[endpoint]
+        state = self.endpoint_states.get(endpoint)
+        if state is None:
+            state = self.endpoint_states[endpoint] = BackoffState()
+        return state
 
     def _apply_jitter(self, delay: float) -> float:
-        """Apply jitter to a delay value."""
-        jitter = random.uniform(self.config.jitter_min, self.config.jitter_max)
+        """Apply jitter to a delay value.
+
+        Jitter factors are drawn from a table of uniform samples generated by
+        a per-handler RNG; the table is rebuilt if the jitter range changes.
+        """
+        jitter_range = (self.config.jitter_min, self.config.jitter_max)
+        if self._jitter_range != jitter_range:
+            uniform = self._rng.uniform
+            self._jitter_table = [uniform(*jitter_range) for _ in range(JITTER_TABLE_SIZE)]
+            self._jitter_range = jitter_range
+
+        jitter = self._jitter_table[self._jitter_index & (JITTER_TABLE_SIZE - 1)]
+        self._jitter_index += 1
         return delay * jitter
 
     def calculate_delay(
@@ -137,7 +256,7 @@ class BackoffHandler:
         state = self._get_state(endpoint)
 
         # Client errors should not be retried
-        if error_type == ErrorType.CLIENT_ERROR:
+        if error_type is _CLIENT_ERROR:
             return 0.0
 
         # If Retry-After header is present, use it
@@ -145,13 +264,14 @@ class BackoffHandler:
             return min(retry_after_seconds, self.config.max_delay)
 
         # Calculate base delay based on error type
-        if error_type == ErrorType.TIMEOUT:
+        self._refresh_delay_table()
+        if error_type is _TIMEOUT:
             # Linear backoff for timeouts
-            delay = self.config.base_delay * self.config.timeout_multiplier * state.error_count
+            delay = self._timeout_base * state.error_count
         else:
             # Exponential backoff for rate limits and server errors
             exponent = min(state.error_count, self.config.max_exponent)
-            delay = self.config.base_delay * (2 ** exponent)
+            delay = self._exp_delays[exponent]
 
         # Apply jitter and cap at max delay
         delay = self._apply_jitter(delay)
@@ -162,6 +282,7 @@ class BackoffHandler:
         endpoint: str,
         error_type: ErrorType,
         retry_after_seconds: float | None = None,
+        now: float | None = None,
     ) -> float:
         """Record an error and return the calculated delay.
 
@@ -169,12 +290,13 @@ class BackoffHandler:
             endpoint: The endpoint that failed
             error_type: Type of error encountered
             retry_after_seconds: Retry-After header value if present
+            now: Monotonic clock reading to use, if the caller already has one
 
         Returns:
             Delay in seconds before next request should be attempted
         """
         state = self._get_state(endpoint)
-        state.record_error(error_type, retry_after_seconds)
+        state.record_error(error_type, retry_after_seconds, now=now)
 
         delay = self.calculate_delay(endpoint, error_type, retry_after_seconds)
 
@@ -208,7 +330,7 @@ class BackoffHandler:
             True if the request should be retried, False otherwise
         """
         # Never retry client errors (400-499 except 429)
-        if error_type == ErrorType.CLIENT_ERROR:
+        if error_type is _CLIENT_ERROR:
             return False
 
         state = self._get_state(endpoint)
@@ -234,9 +356,10 @@ class BackoffHandler:
             Datetime when next request is allowed, or None if allowed now
         """
         state = self._get_state(endpoint)
+        now = time.monotonic()
 
-        if state.retry_after is not None and datetime.now(UTC) < state.retry_after:
-            return state.retry_after
+        if state.retry_after is not None and now < state.retry_after:
+            return _monotonic_to_datetime(state.retry_after, time.time() - now)
 
         if state.last_error_at is None:
             return None
@@ -246,10 +369,10 @@ class BackoffHandler:
             endpoint,
             state.last_error_type or ErrorType.UNKNOWN,
         )
-        next_allowed = state.last_error_at + timedelta(seconds=delay)
+        next_allowed = state.last_error_at + delay
 
-        if datetime.now(UTC) < next_allowed:
-            return next_allowed
+        if now < next_allowed:
+            return _monotonic_to_datetime(next_allowed, time.time() - now)
 
         return None
 
@@ -259,8 +382,9 @@ class BackoffHandler:
         Args:
             endpoint: The endpoint to reset
         """
-        if endpoint in self.endpoint_states:
-            self.endpoint_states[endpoint].reset()
+        state = self.endpoint_states.get(endpoint)
+        if state is not None:
+            state.reset()
 
     def reset_all(self) -> None:
         """Reset backoff state for all endpoints."""
@@ -272,33 +396,44 @@ class BackoffHandler:
         Returns:
             Dict with endpoint states and config
         """
+        offset = time.time() - time.monotonic()
+        endpoints: dict[str, Any] = {}
+        for endpoint, state in self.endpoint_states.items():
+            last_error_at, retry_after = state.isoformat_timestamps(offset)
+            endpoints[endpoint] = {
+                "error_count": state.error_count,
+                "last_error_at": last_error_at,
+                "last_error_type": (
+                    state.last_error_type.value if state.last_error_type else None
+                ),
+                "retry_after": retry_after,
+                "consecutive_successes": state.consecutive_successes,
+            }
+
         return {
             "config": {
                 "base_delay": self.config.base_delay,
                 "max_delay": self.config.max_delay,
                 "max_exponent": self.config.max_exponent,
             },
-            "endpoints": {
-                endpoint: {
-                    "error_count": state.error_count,
-                    "last_error_at": (
-                        state.last_error_at.isoformat()
-                        if state.last_error_at
-                        else None
-                    ),
-                    "last_error_type": (
-                        state.last_error_type.value if state.last_error_type else None
-                    ),
-                    "retry_after": (
-                        state.retry_after.isoformat() if state.retry_after else None
-                    ),
-                    "consecutive_successes": state.consecutive_successes,
-                }
-                for endpoint, state in self.endpoint_states.items()
-            },
+            "endpoints": endpoints,
         }
 
 
+def _build_status_table() -> tuple[ErrorType, ...]:
+    """Build the status code -> ErrorType lookup used by classify_http_error."""
+    table = [ErrorType.UNKNOWN] * _STATUS_TABLE_SIZE
+    table[400:500] = [ErrorType.CLIENT_ERROR] * 100
+    table[500:600] = [ErrorType.SERVER_ERROR] * 100
+    table[429] = ErrorType.RATE_LIMITED
+    return tuple(table)
+
+
+# Status codes 0-599 map to an ErrorType by index; anything else is UNKNOWN
+_STATUS_TABLE_SIZE = 600
+_STATUS_ERROR_TYPES = _build_status_table()
+
+
 def classify_http_error(status_code: int) -> ErrorType:
     """Classify an HTTP status code into an error type.
 
@@ -308,14 +443,9 @@ def classify_http_error(status_code: int) -> ErrorType:
     Returns:
         ErrorType for the status code
     """
-    if status_code == 429:
-        return ErrorType.RATE_LIMITED
-    elif 400 <= status_code < 500:
-        return ErrorType.CLIENT_ERROR
-    elif 500 <= status_code < 600:
-        return ErrorType.SERVER_ERROR
-    else:
-        return ErrorType.UNKNOWN
+    if 0 <= status_code < _STATUS_TABLE_SIZE:
+        return _STATUS_ERROR_TYPES[status_code]
+    return ErrorType.UNKNOWN
 
 
 def parse_retry_after(header_value: str | None) -> float | None:
@@ -334,17 +464,16 @@ def parse_retry_after(header_value: str | None) -> float | None:
     if header_value is None:
         return None
 
-    # Try parsing as seconds
-    try:
-        return float(header_value)
-    except ValueError:
-        pass
+    value = header_value.strip()
+
+    # Delay-seconds: digits with an optional fractional part. Checked up
+    # front so HTTP-date values don't pay for a failed float() conversion.
+    if value.isascii() and value.replace(".", "", 1).isdigit():
+        return float(value)
 
     # Try parsing as HTTP-date
     try:
-        from email.utils import parsedate_to_datetime
-
-        retry_datetime = parsedate_to_datetime(header_value)
+        retry_datetime = parsedate_to_datetime(value)
         delta = retry_datetime - datetime.now(UTC)
         return max(0.0, delta.total_seconds())
     except (ValueError, TypeError):
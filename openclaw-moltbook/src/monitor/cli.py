@@ -6,13 +6,15 @@ All operations run through the reverse proxy for security.
 
 import json
 from datetime import UTC, datetime
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from monitor.health import HealthChecker
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
 app = typer.Typer(
     name="monitor",
@@ -23,6 +25,24 @@ app = typer.Typer(
 console = Console()
 
 
+def dumps_json(data: dict[str, Any]) -> str:
+    """Render data as indented JSON, using orjson when it is installed.
+
+    Print the result with typer.echo rather than console.print: rich would
+    parse it for markup, highlight it and wrap long lines, which is slow on
+    large payloads and can corrupt the JSON.
+
+    Args:
+        data: JSON-serializable dict; other values are rendered with str()
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
 def get_output_format(format_type: str) -> str:
     """Validate and return output format."""
     valid_formats = ["text", "json"]
@@ -43,6 +63,18 @@ def main(
         console.print("[dim]Verbose mode enabled[/dim]")
 
 
+async def _run_health_checks() -> dict[str, Any]:
+    """Run all health checks concurrently and release the HTTP clients."""
+    # Deferred so commands that never touch the network skip loading httpx
+    from monitor.health import HealthChecker
+
+    checker = HealthChecker()
+    try:
+        return await checker.check_all_async()
+    finally:
+        await checker.aclose()
+
+
 @app.command()
 def health(
     format_type: Annotated[
@@ -54,12 +86,16 @@ def health(
 
     Verifies database connectivity, proxy connectivity, and overall system health.
     """
-    checker = HealthChecker()
-    status = checker.check_all()
+    # asyncio (and the ssl/socket modules it loads) is only needed here
+    import asyncio
+
+    status = asyncio.run(_run_health_checks())
 
     if format_type == "json":
-        console.print(json.dumps(status, indent=2, default=str))
+        typer.echo(dumps_json(status))
     else:
+        from rich.table import Table
+
         table = Table(title="Health Status")
         table.add_column("Component", style="cyan")
         table.add_column("Status", style="green")
@@ -103,7 +139,7 @@ def status(
     }
 
     if format_type == "json":
-        console.print(json.dumps(status_data, indent=2))
+        typer.echo(dumps_json(status_data))
     else:
         console.print("[yellow]Status command not yet fully implemented[/yellow]")
         console.print("This will show poll state, rate limits, and database stats.")
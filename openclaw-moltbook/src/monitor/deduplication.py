@@ -2,27 +2,31 @@
 
 Implements deduplication to avoid processing the same content multiple times:
 - Post ID tracking (primary key)
-- Content hash tracking (SHA-256 of id:agent_id:title:submolt)
+- Content hash tracking (128-bit BLAKE2b of id:agent_id:title:submolt)
 
 The deduplication check happens before processing to skip already-seen content.
 """
 
 import hashlib
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Marks a key absent from a post dict, as distinct from an explicit None
+_MISSING: Any = object()
+
 
 def calculate_content_hash(
     post_id: str,
     agent_id: str,
     title: str,
     submolt: str,
-) -> str:
-    """Calculate SHA-256 content hash for a post.
+) -> bytes:
+    """Calculate the content hash for a post.
 
     The hash is calculated from: {id}:{agent_id}:{title}:{submolt}
 
@@ -36,18 +40,44 @@ def calculate_content_hash(
         submolt: The submolt (community) name
 
     Returns:
-        Hex-encoded SHA-256 hash string
+        Raw 16-byte BLAKE2b digest, used directly as a dict key
     """
-    content = f"{post_id}:{agent_id}:{title}:{submolt}"
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    # An f-string, not str.join, so a None or non-string title/submolt from
+    # the API hashes as its str() instead of raising TypeError
+    content = f"{post_id}:{agent_id}:{title}:{submolt}".encode()
+    return hashlib.blake2b(content, digest_size=16).digest()
 
 
-@dataclass
+def _post_fields(post: dict[str, Any]) -> tuple[str, str, str, str]:
+    """Extract the (id, agent_id, title, submolt) fields used for hashing.
+
+    Args:
+        post: Post dict from the API
+
+    Returns:
+        Tuple of hash input fields
+    """
+    get = post.get
+    post_id = get("id", "")
+    # author_id only when the key is absent; an explicit None hashes as "None"
+    agent_id = get("agent_id", _MISSING)
+    if agent_id is _MISSING:
+        agent_id = get("author_id", "")
+    # Only coerce non-string IDs; API payloads are almost always str already
+    return (
+        post_id if type(post_id) is str else str(post_id),
+        agent_id if type(agent_id) is str else str(agent_id),
+        get("title", ""),
+        get("submolt", ""),
+    )
+
+
+@dataclass(slots=True)
 class SeenPost:
     """Record of a previously seen post."""
 
     post_id: str
-    content_hash: str
+    content_hash: bytes
     first_seen_at: datetime
     last_seen_at: datetime
     seen_count: int = 1
@@ -61,22 +91,51 @@ class DeduplicationTracker:
     - By post ID (primary)
     - By content hash (for cross-post detection)
 
-    Supports TTL-based expiration of old entries.
+    Supports TTL-based expiration of old entries and a size cap that evicts
+    the least recently seen entries. by_id is kept in last_seen_at order so
+    both only have to look at the front.
 
     Attributes:
         ttl: Time-to-live for entries (default: 90 days)
-        by_id: Dict mapping post IDs to SeenPost records
+        max_entries: Maximum number of tracked posts (default: 1,000,000)
+        by_id: Ordered dict mapping post IDs to SeenPost records
         by_hash: Dict mapping content hashes to post IDs
     """
 
     ttl: timedelta = field(default_factory=lambda: timedelta(days=90))
-    by_id: dict[str, SeenPost] = field(default_factory=dict)
-    by_hash: dict[str, str] = field(default_factory=dict)
+    max_entries: int = 1_000_000
+    by_id: OrderedDict[str, SeenPost] = field(default_factory=OrderedDict)
+    by_hash: dict[bytes, str] = field(default_factory=dict)
+    _oldest_first_seen: datetime | None = field(default=None, init=False, repr=False)
+    _oldest_stale: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Order any pre-populated records and seed the oldest-entry cache."""
+        if self.by_id:
+            self.by_id = OrderedDict(
+                sorted(self.by_id.items(), key=lambda item: item[1].last_seen_at)
+            )
+        self._refresh_oldest()
+
+    def _refresh_oldest(self) -> None:
+        """Recompute the cached oldest first_seen_at with a full scan."""
+        self._oldest_first_seen = min(
+            (record.first_seen_at for record in self.by_id.values()),
+            default=None,
+        )
+        self._oldest_stale = False
+
+    def _forget(self, record: SeenPost) -> None:
+        """Drop a record already popped from by_id from the other indexes."""
+        self.by_hash.pop(record.content_hash, None)
+        # Rescan lazily in get_stats rather than once per removal
+        if record.first_seen_at == self._oldest_first_seen:
+            self._oldest_stale = True
 
     def is_duplicate(
         self,
         post_id: str,
-        content_hash: str | None = None,
+        content_hash: bytes | None = None,
     ) -> bool:
         """Check if a post has been seen before.
 
@@ -105,7 +164,7 @@ class DeduplicationTracker:
         """
         return post_id in self.by_id
 
-    def has_hash(self, content_hash: str) -> bool:
+    def has_hash(self, content_hash: bytes) -> bool:
         """Check if a content hash has been seen.
 
         Args:
@@ -119,7 +178,8 @@ class DeduplicationTracker:
     def mark_seen(
         self,
         post_id: str,
-        content_hash: str,
+        content_hash: bytes,
+        now: datetime | None = None,
     ) -> SeenPost:
         """Mark a post as seen.
 
@@ -129,17 +189,20 @@ class DeduplicationTracker:
         Args:
             post_id: The post ID
             content_hash: The content hash
+            now: Current time to record, if the caller already has one
 
         Returns:
             The SeenPost record (new or updated)
         """
-        now = datetime.now(UTC)
+        if now is None:
+            now = datetime.now(UTC)
 
         if post_id in self.by_id:
             # Update existing record
             record = self.by_id[post_id]
             record.last_seen_at = now
             record.seen_count += 1
+            self.by_id.move_to_end(post_id)
             logger.debug(
                 "Updated seen record for post %s (seen %d times)",
                 post_id,
@@ -156,6 +219,12 @@ class DeduplicationTracker:
             )
             self.by_id[post_id] = record
             self.by_hash[content_hash] = post_id
+            if self._oldest_first_seen is None or now < self._oldest_first_seen:
+                self._oldest_first_seen = now
+            while len(self.by_id) > self.max_entries:
+                _, evicted = self.by_id.popitem(last=False)
+                self._forget(evicted)
+                logger.debug("Evicted post %s (max_entries reached)", evicted.post_id)
             logger.debug("Marked post %s as seen", post_id)
 
         return record
@@ -171,7 +240,7 @@ class DeduplicationTracker:
         """
         return self.by_id.get(post_id)
 
-    def get_by_hash(self, content_hash: str) -> SeenPost | None:
+    def get_by_hash(self, content_hash: bytes) -> SeenPost | None:
         """Get the SeenPost record for a content hash.
 
         Args:
@@ -195,16 +264,14 @@ class DeduplicationTracker:
         cutoff = now - self.ttl
         removed = 0
 
-        # Find expired entries
-        expired_ids: list[str] = []
-        for post_id, record in self.by_id.items():
-            if record.last_seen_at < cutoff:
-                expired_ids.append(post_id)
-
-        # Remove expired entries
-        for post_id in expired_ids:
-            record = self.by_id.pop(post_id)
-            self.by_hash.pop(record.content_hash, None)
+        # Entries are in last_seen_at order, so stop at the first live one
+        by_id = self.by_id
+        while by_id:
+            record = by_id[next(iter(by_id))]
+            if record.last_seen_at >= cutoff:
+                break
+            by_id.popitem(last=False)
+            self._forget(record)
             removed += 1
 
         if removed > 0:
@@ -218,10 +285,12 @@ class DeduplicationTracker:
         Returns:
             Dict with counts and oldest entry
         """
+        if self._oldest_stale:
+            self._refresh_oldest()
+
         oldest_seen = None
-        if self.by_id:
-            oldest_record = min(self.by_id.values(), key=lambda r: r.first_seen_at)
-            oldest_seen = oldest_record.first_seen_at.isoformat()
+        if self._oldest_first_seen is not None:
+            oldest_seen = self._oldest_first_seen.isoformat()
 
         return {
             "total_posts": len(self.by_id),
@@ -234,6 +303,8 @@ class DeduplicationTracker:
         """Clear all deduplication data."""
         self.by_id.clear()
         self.by_hash.clear()
+        self._oldest_first_seen = None
+        self._oldest_stale = False
 
 
 @dataclass
@@ -265,22 +336,30 @@ class DeduplicationFilter:
         new_posts: list[dict[str, Any]] = []
         skipped = 0
 
+        # Locally bound lookups keep the per-post loop small
+        by_id = self.tracker.by_id
+        by_hash = self.tracker.by_hash
+        tracker_mark_seen = self.tracker.mark_seen
+        now = datetime.now(UTC)
+
         for post in posts:
-            post_id = str(post.get("id", ""))
-            agent_id = str(post.get("agent_id", post.get("author_id", "")))
-            title = post.get("title", "")
-            submolt = post.get("submolt", "")
+            row = _post_fields(post)
+            post_id = row[0]
 
-            content_hash = calculate_content_hash(post_id, agent_id, title, submolt)
+            # ID hits are the common duplicate case; skip hashing them entirely
+            if post_id in by_id:
+                skipped += 1
+                continue
 
-            if self.tracker.is_duplicate(post_id, content_hash):
+            content_hash = calculate_content_hash(*row)
+            if content_hash in by_hash:
                 skipped += 1
                 continue
 
             new_posts.append(post)
 
             if mark_seen:
-                self.tracker.mark_seen(post_id, content_hash)
+                tracker_mark_seen(post_id, content_hash, now)
 
         logger.info(
             "Deduplication: %d new, %d skipped (total: %d)",
@@ -300,14 +379,12 @@ class DeduplicationFilter:
         Returns:
             True if the post is new
         """
-        post_id = str(post.get("id", ""))
-        agent_id = str(post.get("agent_id", post.get("author_id", "")))
-        title = post.get("title", "")
-        submolt = post.get("submolt", "")
+        post_id, agent_id, title, submolt = _post_fields(post)
+        if self.tracker.has_id(post_id):
+            return False
 
         content_hash = calculate_content_hash(post_id, agent_id, title, submolt)
-
-        return not self.tracker.is_duplicate(post_id, content_hash)
+        return not self.tracker.has_hash(content_hash)
 
     def mark_post_seen(self, post: dict[str, Any]) -> SeenPost:
         """Mark a post as seen after processing.
@@ -318,13 +395,14 @@ class DeduplicationFilter:
         Returns:
             The SeenPost record
         """
-        post_id = str(post.get("id", ""))
-        agent_id = str(post.get("agent_id", post.get("author_id", "")))
-        title = post.get("title", "")
-        submolt = post.get("submolt", "")
+        post_id, agent_id, title, submolt = _post_fields(post)
 
-        content_hash = calculate_content_hash(post_id, agent_id, title, submolt)
+        # Repeat sightings reuse the stored hash instead of rehashing
+        record = self.tracker.get_by_id(post_id)
+        if record is not None:
+            return self.tracker.mark_seen(post_id, record.content_hash)
 
+        content_hash = calculate_content_hash(post_id, agent_id, title, submolt)
         return self.tracker.mark_seen(post_id, content_hash)
 
     def cleanup(self) -> int:
@@ -340,14 +418,18 @@ class DeduplicationFilter:
         return self.tracker.get_stats()
 
 
-def create_deduplication_filter(ttl_days: int = 90) -> DeduplicationFilter:
-    """Create a deduplication filter with the specified TTL.
+def create_deduplication_filter(
+    ttl_days: int = 90,
+    max_entries: int = 1_000_000,
+) -> DeduplicationFilter:
+    """Create a deduplication filter with the specified TTL and size cap.
 
     Args:
         ttl_days: Time-to-live for entries in days (default: 90)
+        max_entries: Maximum number of tracked posts (default: 1,000,000)
 
     Returns:
         Configured DeduplicationFilter instance
     """
-    tracker = DeduplicationTracker(ttl=timedelta(days=ttl_days))
+    tracker = DeduplicationTracker(ttl=timedelta(days=ttl_days), max_entries=max_entries)
     return DeduplicationFilter(tracker=tracker)
@@ -8,13 +8,29 @@ Provides health checking functionality for:
 Used by both CLI commands and the HTTP health endpoint.
 """
 
+import asyncio
+import functools
 import os
+import ssl
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+if TYPE_CHECKING:
+    import duckdb
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Get the SSL context shared by all health check clients.
+
+    Building a context loads the CA bundle, which dominates httpx client
+    construction; every HealthChecker otherwise paid that twice.
+    """
+    return httpx.create_ssl_context()
+
 
 class HealthChecker:
     """Health checker for monitoring system components.
@@ -40,6 +56,60 @@ class HealthChecker:
         db_path_str = db_path or os.getenv("MONITOR_DB_PATH") or "/app/data/monitor.duckdb"
         self.db_path = Path(db_path_str)
         self.proxy_url: str = proxy_url or os.getenv("PROXY_HEALTH_URL") or "http://proxy:8080/health"
+        self._client: httpx.Client | None = None
+        self._aclient: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.Client:
+        """Get or create the HTTP client, kept alive across proxy probes."""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=8),
+                verify=_ssl_context(),
+            )
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get or create the async HTTP client."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=8),
+                verify=_ssl_context(),
+            )
+        return self._aclient
+
+    def _open_connection(self) -> "duckdb.DuckDBPyConnection":
+        """Open a DuckDB connection for a single check.
+
+        Health only reads, so an existing file is opened read-only; read-write
+        is used just to create a missing file. The caller must close the
+        connection, so the file lock is never held between checks.
+        """
+        import duckdb
+
+        return duckdb.connect(str(self.db_path), read_only=self.db_path.exists())
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close both the sync and async HTTP clients."""
+        self.close()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __enter__(self) -> "HealthChecker":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
 
     def check_database(self) -> dict[str, Any]:
         """Check database connectivity.
@@ -48,8 +118,6 @@ class HealthChecker:
             Dict with 'healthy' bool and status details.
         """
         try:
-            import duckdb
-
             # Check if database file exists or can be created
             db_dir = self.db_path.parent
             if not db_dir.exists():
@@ -58,12 +126,12 @@ class HealthChecker:
                     "message": f"Database directory does not exist: {db_dir}",
                 }
 
-            # Try to connect to the database
-            conn = duckdb.connect(str(self.db_path), read_only=False)
-
             # Simple query to verify connection
-            result = conn.execute("SELECT 1 AS health_check").fetchone()
-            conn.close()
+            conn = self._open_connection()
+            try:
+                result = conn.execute("SELECT 1 AS health_check").fetchone()
+            finally:
+                conn.close()
 
             if result and result[0] == 1:
                 return {
@@ -95,41 +163,58 @@ class HealthChecker:
             Dict with 'healthy' bool and status details.
         """
         try:
-            with httpx.Client(timeout=5.0) as client:
+            client = self._get_client()
+            # HEAD skips the response body; fall back for endpoints without it
+            response = client.head(self.proxy_url)
+            if response.status_code == 405:
                 response = client.get(self.proxy_url)
+        except Exception as e:
+            return self._proxy_error(e)
+        return self._proxy_result(response)
 
-                if response.status_code == 200:
-                    return {
-                        "healthy": True,
-                        "message": "Proxy is reachable",
-                        "url": self.proxy_url,
-                        "response_time_ms": response.elapsed.total_seconds() * 1000,
-                    }
-                else:
-                    return {
-                        "healthy": False,
-                        "message": f"Proxy returned status {response.status_code}",
-                        "url": self.proxy_url,
-                    }
-
-        except httpx.ConnectError:
-            return {
-                "healthy": False,
-                "message": "Cannot connect to proxy (connection refused)",
-                "url": self.proxy_url,
-            }
-        except httpx.TimeoutException:
-            return {
-                "healthy": False,
-                "message": "Proxy connection timed out",
-                "url": self.proxy_url,
-            }
+    async def check_proxy_async(self) -> dict[str, Any]:
+        """Check reverse proxy connectivity without blocking the event loop.
+
+        Returns:
+            Dict with 'healthy' bool and status details.
+        """
+        try:
+            aclient = self._get_async_client()
+            response = await aclient.head(self.proxy_url)
+            if response.status_code == 405:
+                response = await aclient.get(self.proxy_url)
         except Exception as e:
+            return self._proxy_error(e)
+        return self._proxy_result(response)
+
+    def _proxy_result(self, response: httpx.Response) -> dict[str, Any]:
+        """Build the proxy status for a received response."""
+        if response.status_code == 200:
             return {
-                "healthy": False,
-                "message": f"Proxy error: {e!s}",
+                "healthy": True,
+                "message": "Proxy is reachable",
                 "url": self.proxy_url,
+                "response_time_ms": response.elapsed.total_seconds() * 1000,
             }
+        return {
+            "healthy": False,
+            "message": f"Proxy returned status {response.status_code}",
+            "url": self.proxy_url,
+        }
+
+    def _proxy_error(self, error: Exception) -> dict[str, Any]:
+        """Build the proxy status for a failed request."""
+        if isinstance(error, httpx.ConnectError):
+            message = "Cannot connect to proxy (connection refused)"
+        elif isinstance(error, httpx.TimeoutException):
+            message = "Proxy connection timed out"
+        else:
+            message = f"Proxy error: {error!s}"
+        return {
+            "healthy": False,
+            "message": message,
+            "url": self.proxy_url,
+        }
 
     def check_all(self) -> dict[str, Any]:
         """Run all health checks.
@@ -137,9 +222,29 @@ class HealthChecker:
         Returns:
             Dict with status of all components and overall health.
         """
-        db_status = self.check_database()
-        proxy_status = self.check_proxy()
+        return self._summarize(self.check_database(), self.check_proxy())
+
+    async def check_all_async(self) -> dict[str, Any]:
+        """Run all health checks concurrently.
 
+        The blocking DuckDB check runs in a worker thread while the proxy
+        probe is awaited, so latency is the slower of the two, not the sum.
+
+        Returns:
+            Dict with status of all components and overall health.
+        """
+        db_status, proxy_status = await asyncio.gather(
+            asyncio.to_thread(self.check_database),
+            self.check_proxy_async(),
+        )
+        return self._summarize(db_status, proxy_status)
+
+    def _summarize(
+        self,
+        db_status: dict[str, Any],
+        proxy_status: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Combine component statuses into the overall health result."""
         # Overall health is true only if all components are healthy
         # Note: For development, we may relax proxy requirement
         overall_healthy = db_status["healthy"]
@@ -151,12 +256,16 @@ class HealthChecker:
             "proxy": proxy_status,
         }
 
-    def to_json_response(self) -> dict[str, Any]:
+    def to_json_response(self, status: dict[str, Any] | None = None) -> dict[str, Any]:
         """Get health status as JSON-serializable response.
 
         Suitable for HTTP health endpoint responses.
+
+        Args:
+            status: Result of an earlier check_all(); runs the checks if omitted
         """
-        status = self.check_all()
+        if status is None:
+            status = self.check_all()
         return {
             "status": "healthy" if status["healthy"] else "unhealthy",
             "timestamp": status["timestamp"],
@@ -1,6 +1,6 @@
 """Rate limiter for Moltbook API requests.
 
-Implements a sliding window rate limiter that tracks:
+Implements a token bucket rate limiter that tracks:
 - Requests per minute (primary limit: 100/min)
 - Requests per hour (secondary limit: 5,000/hr)
 - Requests per day (tertiary limit: 50,000/day)
@@ -17,12 +17,13 @@ Budget allocation:
 """
 
 import logging
+import math
 import time
-from collections import deque
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from threading import RLock
+from threading import Lock
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -48,7 +49,7 @@ BUDGET_ALLOCATION: dict[RequestBudget, float] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for rate limiting."""
 
@@ -65,14 +66,89 @@ class RateLimitConfig:
     hour_window: int = 3600  # seconds
     day_window: int = 86400  # seconds
 
+    # Memoized budget_caps, keyed on the requests_per_minute it was built from
+    _budget_caps: dict[RequestBudget, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _budget_caps_key: int | None = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    # Memoized warning_counts, keyed on the limits and threshold it was built from
+    _warning_counts: tuple[int, int, int] = field(
+        default=(0, 0, 0), init=False, repr=False, compare=False
+    )
+    _warning_counts_key: tuple[int, int, int, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def budget_caps(self) -> dict[RequestBudget, int]:
+        """Per-minute request cap for each budget, derived from BUDGET_ALLOCATION.
+
+        The caps are rebuilt only when requests_per_minute changes.
+        """
+        if self._budget_caps_key != self.requests_per_minute:
+            self._budget_caps = {
+                budget: int(self.requests_per_minute * allocation)
+                for budget, allocation in BUDGET_ALLOCATION.items()
+            }
+            self._budget_caps_key = self.requests_per_minute
+        return self._budget_caps
+
+    @property
+    def warning_counts(self) -> tuple[int, int, int]:
+        """(minute, hour, day) request counts at which warning_threshold is reached.
+
+        The counts are rebuilt only when a limit or the threshold changes.
+        """
+        key = (
+            self.requests_per_minute,
+            self.requests_per_hour,
+            self.requests_per_day,
+            self.warning_threshold,
+        )
+        if self._warning_counts_key != key:
+            self._warning_counts = (
+                _warning_count(self.requests_per_minute, self.warning_threshold),
+                _warning_count(self.requests_per_hour, self.warning_threshold),
+                _warning_count(self.requests_per_day, self.warning_threshold),
+            )
+            self._warning_counts_key = key
+        return self._warning_counts
+
+
+def _warning_count(limit: int, threshold: float) -> int:
+    """Find the smallest request count whose share of limit reaches threshold.
+
+    limit * threshold alone can land a rounding error above the boundary
+    (10 * 0.7 is 7.000000000000001), so the count is settled against the
+    same count / limit >= threshold test the warning messages report.
+
+    Args:
+        limit: Request limit for the window
+        threshold: Warning threshold as a fraction of the limit
+
+    Returns:
+        Smallest count with count / limit >= threshold, or 0 for a
+        non-positive limit
+    """
+    if limit <= 0:
+        return 0
+    count = max(0, math.ceil(limit * threshold))
+    while count > 0 and (count - 1) / limit >= threshold:
+        count -= 1
+    while count / limit < threshold:
+        count += 1
+    return count
+
+
+@dataclass(slots=True)
 class RateLimitState:
     """Current state of rate limits from API headers."""
 
     limit: int | None = None
     remaining: int | None = None
     reset_at: datetime | None = None
+    reset_at_mono: float | None = None
     last_updated: datetime | None = None
 
     def update_from_headers(
@@ -87,62 +163,150 @@ class RateLimitState:
         if remaining is not None:
             self.remaining = remaining
         if reset_timestamp is not None:
+            # Convert the wall-clock reset once, for comparisons against time.monotonic()
+            self.reset_at_mono = time.monotonic() + (reset_timestamp - time.time())
             self.reset_at = datetime.fromtimestamp(reset_timestamp, tz=UTC)
         self.last_updated = datetime.now(UTC)
 
 
+@dataclass(slots=True)
+class TokenBucket:
+    """Token bucket holding up to `capacity` requests per `window` seconds.
+
+    Tokens refill continuously at capacity/window per second, so state is
+    just a token count and the time of the last refill.
+
+    Attributes:
+        capacity: Maximum tokens (the request limit for the window)
+        window: Window length in seconds
+        tokens: Tokens currently available
+        last_refill: time.monotonic() of the last refill
+    """
+
+    capacity: int
+    window: float
+    tokens: float = field(init=False)
+    last_refill: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self.tokens = float(self.capacity)
+
+    def refill(self, now: float) -> float:
+        """Add tokens accrued since the last refill.
+
+        Args:
+            now: Current time.monotonic() reading
+
+        Returns:
+            Tokens available after refilling
+        """
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(
+                float(self.capacity),
+                self.tokens + elapsed * self.capacity / self.window,
+            )
+            self.last_refill = now
+        return self.tokens
+
+    def resize(self, capacity: int, window: float) -> None:
+        """Apply a changed limit, keeping the requests already counted.
+
+        Args:
+            capacity: New maximum tokens
+            window: New window length in seconds
+        """
+        if capacity == self.capacity and window == self.window:
+            return
+        self.tokens += capacity - self.capacity
+        self.capacity = capacity
+        self.window = window
+
+    def used(self) -> int:
+        """Requests currently counted against the window (as of last refill)."""
+        return round(self.capacity - self.tokens)
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available (as of last refill)."""
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) * self.window / self.capacity
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitStatus:
+    """Point-in-time snapshot of rate limiter usage.
+
+    Attributes:
+        minute_used: Requests counted against the minute window
+        hour_used: Requests counted against the hour window
+        day_used: Requests counted against the day window
+        can_request: Whether a request can be made now
+        wait_time: Seconds until the next request is allowed
+    """
+
+    minute_used: int
+    hour_used: int
+    day_used: int
+    can_request: bool
+    wait_time: float
+
+
 @dataclass
 class RateLimiter:
-    """Sliding window rate limiter for API requests.
+    """Token bucket rate limiter for API requests.
 
-    Tracks requests across minute, hour, and day windows.
+    Tracks requests across minute, hour, and day buckets.
     Provides methods to check if a request can be made and
     calculate wait times when rate limited.
 
     Attributes:
         config: Rate limit configuration
-        minute_requests: Deque of timestamps for minute window
-        hour_requests: Deque of timestamps for hour window
-        day_requests: Deque of timestamps for day window
+        minute_bucket: Token bucket for the minute window
+        hour_bucket: Token bucket for the hour window
+        day_bucket: Token bucket for the day window
         api_state: Rate limit state from API headers
         budget_usage: Per-category request counts
     """
 
     config: RateLimitConfig = field(default_factory=RateLimitConfig)
-    minute_requests: deque[float] = field(default_factory=deque)
-    hour_requests: deque[float] = field(default_factory=deque)
-    day_requests: deque[float] = field(default_factory=deque)
+    minute_bucket: TokenBucket = field(init=False)
+    hour_bucket: TokenBucket = field(init=False)
+    day_bucket: TokenBucket = field(init=False)
     api_state: RateLimitState = field(default_factory=RateLimitState)
-    budget_usage: dict[RequestBudget, int] = field(default_factory=dict)
-    _lock: RLock = field(default_factory=RLock, repr=False)
+    budget_usage: Counter[RequestBudget] = field(default_factory=Counter)
+    _lock: Lock = field(default_factory=Lock, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize budget usage tracking."""
+        """Initialize token buckets and budget usage tracking."""
+        self.minute_bucket = TokenBucket(self.config.requests_per_minute, self.config.minute_window)
+        self.hour_bucket = TokenBucket(self.config.requests_per_hour, self.config.hour_window)
+        self.day_bucket = TokenBucket(self.config.requests_per_day, self.config.day_window)
         for budget in RequestBudget:
             self.budget_usage.setdefault(budget, 0)
 
-    def _cleanup_old_requests(self, now: float) -> None:
-        """Remove requests outside the tracking windows."""
-        minute_cutoff = now - self.config.minute_window
-        hour_cutoff = now - self.config.hour_window
-        day_cutoff = now - self.config.day_window
-
-        while self.minute_requests and self.minute_requests[0] < minute_cutoff:
-            self.minute_requests.popleft()
+    def _refill(self, now: float) -> None:
+        """Refill all buckets up to the current time.
 
-        while self.hour_requests and self.hour_requests[0] < hour_cutoff:
-            self.hour_requests.popleft()
-
-        while self.day_requests and self.day_requests[0] < day_cutoff:
-            self.day_requests.popleft()
+        Buckets then pick up any limits reassigned on config since the last
+        refill, so checks always see the configured limits.
+        """
+        config = self.config
+        self.minute_bucket.refill(now)
+        self.minute_bucket.resize(config.requests_per_minute, config.minute_window)
+        self.hour_bucket.refill(now)
+        self.hour_bucket.resize(config.requests_per_hour, config.hour_window)
+        self.day_bucket.refill(now)
+        self.day_bucket.resize(config.requests_per_day, config.day_window)
 
     def _get_counts(self, now: float) -> tuple[int, int, int]:
         """Get current request counts for each window."""
-        self._cleanup_old_requests(now)
+        self._refill(now)
         return (
-            len(self.minute_requests),
-            len(self.hour_requests),
-            len(self.day_requests),
+            self.minute_bucket.used(),
+            self.hour_bucket.used(),
+            self.day_bucket.used(),
         )
 
     def can_request(self, budget: RequestBudget | None = None) -> bool:
@@ -155,40 +319,41 @@ class RateLimiter:
             True if request is allowed, False otherwise
         """
         with self._lock:
-            now = time.time()
-            minute_count, hour_count, day_count = self._get_counts(now)
-
-            # Check hard limits
-            if minute_count >= self.config.requests_per_minute:
-                return False
-            if hour_count >= self.config.requests_per_hour:
-                return False
-            if day_count >= self.config.requests_per_day:
-                return False
-
-            # Check API-reported remaining (if available)
-            if (
-                self.api_state.remaining is not None
-                and self.api_state.remaining <= 0
-                and self.api_state.reset_at
-                and datetime.now(UTC) < self.api_state.reset_at
-            ):
-                return False
-
-            # Check budget allocation if specified
-            if budget is not None:
-                allocation = BUDGET_ALLOCATION.get(budget, 0.0)
-                max_for_budget = int(self.config.requests_per_minute * allocation)
-                if self.budget_usage.get(budget, 0) >= max_for_budget:
-                    # Budget exhausted, but allow if reserve available
-                    reserve_remaining = int(
-                        self.config.requests_per_minute
-                        * BUDGET_ALLOCATION[RequestBudget.RESERVE]
-                    ) - self.budget_usage.get(RequestBudget.RESERVE, 0)
-                    if reserve_remaining <= 0:
-                        return False
-
-            return True
+            return self._can_request_locked(time.monotonic(), budget)
+
+    def _can_request_locked(self, now: float, budget: RequestBudget | None) -> bool:
+        """can_request body; the caller must hold _lock."""
+        self._refill(now)
+
+        # Check hard limits
+        if self.minute_bucket.tokens < 1.0:
+            return False
+        if self.hour_bucket.tokens < 1.0:
+            return False
+        if self.day_bucket.tokens < 1.0:
+            return False
+
+        # Check API-reported remaining (if available)
+        if (
+            self.api_state.remaining is not None
+            and self.api_state.remaining <= 0
+            and self.api_state.reset_at_mono is not None
+            and now < self.api_state.reset_at_mono
+        ):
+            return False
+
+        # Check budget allocation if specified
+        if budget is not None:
+            caps = self.config.budget_caps
+            if self.budget_usage[budget] >= caps.get(budget, 0):
+                # Budget exhausted, but allow if reserve available
+                reserve_remaining = (
+                    caps[RequestBudget.RESERVE] - self.budget_usage[RequestBudget.RESERVE]
+                )
+                if reserve_remaining <= 0:
+                    return False
+
+        return True
 
     def record_request(self, budget: RequestBudget = RequestBudget.RESERVE) -> None:
         """Record that a request was made.
@@ -196,12 +361,23 @@ class RateLimiter:
         Args:
             budget: Budget category this request belongs to
         """
+        self.record_requests(1, budget)
+
+    def record_requests(self, n: int, budget: RequestBudget = RequestBudget.RESERVE) -> None:
+        """Record several requests made at once.
+
+        Takes the lock and refills the buckets once for the whole batch.
+
+        Args:
+            n: Number of requests made
+            budget: Budget category the requests belong to
+        """
         with self._lock:
-            now = time.time()
-            self.minute_requests.append(now)
-            self.hour_requests.append(now)
-            self.day_requests.append(now)
-            self.budget_usage[budget] = self.budget_usage.get(budget, 0) + 1
+            self._refill(time.monotonic())
+            self.minute_bucket.tokens -= n
+            self.hour_bucket.tokens -= n
+            self.day_bucket.tokens -= n
+            self.budget_usage[budget] += n
 
     def update_from_response(
         self,
@@ -237,44 +413,56 @@ class RateLimiter:
             Seconds to wait (0.0 if request can be made immediately)
         """
         with self._lock:
-            now = time.time()
-            minute_count, hour_count, day_count = self._get_counts(now)
-
-            # Check minute limit
-            if minute_count >= self.config.requests_per_minute:
-                # Wait until oldest request exits the minute window
-                oldest = self.minute_requests[0] if self.minute_requests else now
-                wait = (oldest + self.config.minute_window) - now
-                if wait > 0:
-                    return wait
-
-            # Check hour limit
-            if hour_count >= self.config.requests_per_hour:
-                oldest = self.hour_requests[0] if self.hour_requests else now
-                wait = (oldest + self.config.hour_window) - now
-                if wait > 0:
-                    return wait
-
-            # Check day limit
-            if day_count >= self.config.requests_per_day:
-                oldest = self.day_requests[0] if self.day_requests else now
-                wait = (oldest + self.config.day_window) - now
-                if wait > 0:
-                    return wait
-
-            # Check API-reported reset time
-            if (
-                self.api_state.remaining is not None
-                and self.api_state.remaining <= 0
-                and self.api_state.reset_at
-            ):
-                reset_wait = (
-                    self.api_state.reset_at - datetime.now(UTC)
-                ).total_seconds()
-                if reset_wait > 0:
-                    return reset_wait
+            return self._wait_time_locked(time.monotonic())
 
-            return 0.0
+    def _wait_time_locked(self, now: float) -> float:
+        """wait_time body; the caller must hold _lock."""
+        self._refill(now)
+
+        # Wait until every bucket has a token again
+        wait = max(
+            self.minute_bucket.wait_time(),
+            self.hour_bucket.wait_time(),
+            self.day_bucket.wait_time(),
+        )
+        if wait > 0:
+            return wait
+
+        # Check API-reported reset time
+        if (
+            self.api_state.remaining is not None
+            and self.api_state.remaining <= 0
+            and self.api_state.reset_at_mono is not None
+        ):
+            reset_wait = self.api_state.reset_at_mono - now
+            if reset_wait > 0:
+                return reset_wait
+
+        return 0.0
+
+    def snapshot(self) -> RateLimitStatus:
+        """Get current usage as an immutable snapshot.
+
+        Cheaper than get_status() for callers that only need the counts.
+
+        Returns:
+            RateLimitStatus for the current time
+        """
+        with self._lock:
+            return self._snapshot_locked(time.monotonic())
+
+    def _snapshot_locked(self, now: float) -> RateLimitStatus:
+        """snapshot body; the caller must hold _lock."""
+        minute_count, hour_count, day_count = self._get_counts(now)
+        # Without a budget, a request is allowed exactly when there is no wait
+        wait = self._wait_time_locked(now)
+        return RateLimitStatus(
+            minute_used=minute_count,
+            hour_used=hour_count,
+            day_used=day_count,
+            can_request=wait == 0.0,
+            wait_time=wait,
+        )
 
     def get_status(self) -> dict[str, Any]:
         """Get current rate limit status.
@@ -283,8 +471,10 @@ class RateLimiter:
             Dict with current counts, limits, and usage
         """
         with self._lock:
-            now = time.time()
-            minute_count, hour_count, day_count = self._get_counts(now)
+            status = self._snapshot_locked(time.monotonic())
+            minute_count = status.minute_used
+            hour_count = status.hour_used
+            day_count = status.day_used
 
             return {
                 "minute": {
@@ -312,8 +502,8 @@ class RateLimiter:
                     ),
                 },
                 "budget_usage": dict(self.budget_usage),
-                "can_request": self.can_request(),
-                "wait_time_seconds": self.wait_time(),
+                "can_request": status.can_request,
+                "wait_time_seconds": status.wait_time,
             }
 
     def reset_budget(self) -> None:
@@ -331,32 +521,31 @@ class RateLimiter:
         Returns:
             List of warning messages for limits approaching threshold
         """
-        warnings: list[str] = []
         with self._lock:
-            now = time.time()
-            minute_count, hour_count, day_count = self._get_counts(now)
-
-            # Check each limit against threshold
-            minute_pct = minute_count / self.config.requests_per_minute
-            if minute_pct >= self.config.warning_threshold:
-                warnings.append(
-                    f"Minute limit at {minute_pct:.0%} "
-                    f"({minute_count}/{self.config.requests_per_minute})"
-                )
+            minute_count, hour_count, day_count = self._get_counts(time.monotonic())
 
-            hour_pct = hour_count / self.config.requests_per_hour
-            if hour_pct >= self.config.warning_threshold:
-                warnings.append(
-                    f"Hour limit at {hour_pct:.0%} "
-                    f"({hour_count}/{self.config.requests_per_hour})"
-                )
+        config = self.config
+        minute_warn, hour_warn, day_warn = config.warning_counts
+        # Common case: every window is below its threshold
+        if minute_count < minute_warn and hour_count < hour_warn and day_count < day_warn:
+            return []
 
-            day_pct = day_count / self.config.requests_per_day
-            if day_pct >= self.config.warning_threshold:
-                warnings.append(
-                    f"Day limit at {day_pct:.0%} "
-                    f"({day_count}/{self.config.requests_per_day})"
-                )
+        warnings: list[str] = []
+        if minute_count >= minute_warn:
+            minute_pct = minute_count / config.requests_per_minute
+            warnings.append(
+                f"Minute limit at {minute_pct:.0%} ({minute_count}/{config.requests_per_minute})"
+            )
+
+        if hour_count >= hour_warn:
+            hour_pct = hour_count / config.requests_per_hour
+            warnings.append(
+                f"Hour limit at {hour_pct:.0%} ({hour_count}/{config.requests_per_hour})"
+            )
+
+        if day_count >= day_warn:
+            day_pct = day_count / config.requests_per_day
+            warnings.append(f"Day limit at {day_pct:.0%} ({day_count}/{config.requests_per_day})")
 
         return warnings
 
@@ -10,11 +10,15 @@ Implements robots.txt parsing and compliance:
 Reference: https://www.robotstxt.org/robotstxt.html
 """
 
+import atexit
 import contextlib
 import logging
 import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from threading import Lock
 from typing import Any
 from urllib.parse import urlparse
 
@@ -22,38 +26,119 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Per-site cap on memoized is_allowed() decisions
+_MAX_ALLOW_DECISIONS = 4096
 
-@dataclass
+# Connection pool limits for the robots.txt HTTP client
+CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Pooled clients keyed by user-agent, so that RobotsChecker instances in the
+# same process reuse one keep-alive pool, with the number of checkers holding
+# each one; both are guarded by _shared_clients_lock
+_shared_clients: dict[str, httpx.Client] = {}
+_shared_client_users: dict[str, int] = {}
+_shared_clients_lock = Lock()
+
+# One "key: value" line of robots.txt. The value stops at a comment; lines
+# with any other key are skipped by the scan.
+_DIRECTIVE_RE = re.compile(
+    r"^[ \t]*(user-agent|disallow|allow|crawl-delay|sitemap)[ \t]*:([^\n#]*)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def close_shared_clients() -> None:
+    """Close all pooled robots.txt HTTP clients.
+
+    Runs at interpreter exit to release checkers that were never closed.
+    """
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+        _shared_client_users.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_shared_clients)
+
+
+# Characters that are regex metacharacters outside a character class
+_NEEDS_ESCAPE = frozenset(".^$+?{}[]|()\\")
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a robots.txt path pattern into a regex in one pass.
+
+    * matches any sequence and a trailing $ anchors the end; every other
+    character is literal. Runs of * collapse into one .*.
+
+    Args:
+        pattern: Path pattern from an Allow/Disallow line
+
+    Returns:
+        Regex source anchored at the start of the path
+    """
+    anchored = pattern.endswith("$")
+    if anchored:
+        pattern = pattern[:-1]
+
+    parts = ["^"]
+    prev = ""
+    for ch in pattern:
+        if ch == "*":
+            if prev != "*":
+                parts.append(".*")
+        elif ch in _NEEDS_ESCAPE:
+            parts.append("\\" + ch)
+        else:
+            parts.append(ch)
+        prev = ch
+
+    if anchored:
+        parts.append("$")
+    return "".join(parts)
+
+
+@dataclass(slots=True)
 class RobotsRule:
-    """A single rule from robots.txt."""
+    """A single rule from robots.txt.
+
+    The path pattern is compiled once at construction; matches() only runs
+    the compiled regex, or a plain prefix check for paths without * or $.
+    """
 
     path: str
     allow: bool
+    _pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    _literal: bool = field(init=False, repr=False, compare=False)
 
-    def matches(self, path: str) -> bool:
-        """Check if this rule matches the given path.
+    def __post_init__(self) -> None:
+        """Compile the path pattern.
 
         Supports * wildcard and $ end anchor.
         """
-        pattern = self.path
-
-        # Escape regex special characters except * and $
-        pattern = re.escape(pattern)
-
-        # Convert * wildcard to regex
-        pattern = pattern.replace(r"\*", ".*")
-
-        # Handle $ end anchor - if ends with \$, replace with actual $, else prefix with ^
-        pattern = pattern[:-2] + "$" if pattern.endswith(r"\$") else "^" + pattern
+        self._literal = "*" not in self.path and "$" not in self.path
 
         try:
-            return bool(re.match(pattern, path))
+            self._pattern = re.compile(_glob_to_regex(self.path))
         except re.error:
-            # If regex fails, try simple prefix match
+            # If regex fails, matches() falls back to a simple prefix match
+            self._pattern = None
+
+    def matches(self, path: str) -> bool:
+        """Check if this rule matches the given path.
+
+        Supports * wildcard and $ end anchor.
+        """
+        if self._literal:
+            return path.startswith(self.path)
+        if self._pattern is None:
             return path.startswith(self.path.rstrip("*$"))
+        return self._pattern.match(path) is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotsDirectives:
     """Parsed directives for a user-agent from robots.txt."""
 
@@ -61,6 +146,29 @@ class RobotsDirectives:
     rules: list[RobotsRule] = field(default_factory=list)
     crawl_delay: float | None = None
     sitemaps: list[str] = field(default_factory=list)
+    _matcher: re.Pattern[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _matcher_size: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def _get_matcher(self) -> re.Pattern[str] | None:
+        """Get one regex alternating over all rules, in rule order.
+
+        The regex engine tries alternatives left to right, so the group that
+        matches is the first matching rule. Rebuilt when rules are added;
+        None if any rule fell back to prefix matching.
+        """
+        if self._matcher_size != len(self.rules):
+            patterns = [rule._pattern for rule in self.rules]
+            self._matcher = None
+            if all(pattern is not None for pattern in patterns):
+                self._matcher = re.compile(
+                    "|".join(
+                        f"(?P<r{i}>{pattern.pattern})"
+                        for i, pattern in enumerate(patterns)
+                        if pattern is not None
+                    )
+                )
+            self._matcher_size = len(self.rules)
+        return self._matcher
 
     def is_allowed(self, path: str) -> bool:
         """Check if a path is allowed by these directives.
@@ -68,25 +176,56 @@ class RobotsDirectives:
         Rules are processed in order; first match wins.
         If no rule matches, access is allowed by default.
         """
-        for rule in self.rules:
-            if rule.matches(path):
-                return rule.allow
-        # Default: allowed
-        return True
+        if not self.rules:
+            return True
+
+        matcher = self._get_matcher()
+        if matcher is None:
+            for rule in self.rules:
+                if rule.matches(path):
+                    return rule.allow
+            # Default: allowed
+            return True
 
+        match = matcher.match(path)
+        if match is None or match.lastgroup is None:
+            # Default: allowed
+            return True
+        return self.rules[int(match.lastgroup[1:])].allow
 
-@dataclass
+
+@dataclass(slots=True)
 class RobotsCache:
-    """Cached robots.txt content with expiration."""
+    """Cached robots.txt content with expiration.
+
+    matched_directives memoizes the directives selected for the owning
+    checker's user-agent, so per-URL checks skip the user-agent scan.
+    allow_decisions memoizes is_allowed() results by path; both are dropped
+    with the entry when robots.txt is refetched. Expiry is checked against a
+    monotonic deadline derived from expires_at, which is kept for reporting.
+    """
 
     content: str
     fetched_at: datetime
     expires_at: datetime
     directives: list[RobotsDirectives] = field(default_factory=list)
+    matched_directives: RobotsDirectives | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _matched: bool = field(default=False, init=False, repr=False, compare=False)
+    allow_decisions: dict[str, bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    expires_at_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Convert expires_at to a monotonic deadline."""
+        remaining = (self.expires_at - datetime.now(UTC)).total_seconds()
+        self.expires_at_ts = time.monotonic() + remaining
 
     def is_expired(self) -> bool:
         """Check if the cache has expired."""
-        return datetime.now(UTC) > self.expires_at
+        return time.monotonic() > self.expires_at_ts
 
 
 @dataclass
@@ -99,28 +238,88 @@ class RobotsChecker:
     Attributes:
         user_agent: User-Agent string to match against robots.txt
         cache_duration: How long to cache robots.txt (default: 24 hours)
-        cache: Dict mapping base URLs to cached robots.txt data
+        negative_cache_duration: How long to skip refetching after a failed
+            fetch (default: 60 seconds)
+        cache: Dict mapping base URLs to cached robots.txt data, least
+            recently used first
+        max_entries: Number of sites kept in the cache; the least recently
+            used site is evicted beyond that (default: 1024)
     """
 
     user_agent: str = "OpenClawMonitor"
     cache_duration: timedelta = field(default_factory=lambda: timedelta(hours=24))
-    cache: dict[str, RobotsCache] = field(default_factory=dict)
+    negative_cache_duration: timedelta = field(default_factory=lambda: timedelta(seconds=60))
+    cache: OrderedDict[str, RobotsCache] = field(default_factory=OrderedDict)
+    max_entries: int = 1024
+    _failed_until: dict[str, float] = field(default_factory=dict, repr=False)
     _client: httpx.Client | None = field(default=None, repr=False)
+    _aclient: httpx.AsyncClient | None = field(default=None, repr=False)
+    _ua_lower: str = field(init=False, repr=False)
+    _pool_key: str | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the lowercased user-agent used for matching."""
+        self._ua_lower = self.user_agent.lower()
 
     def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client."""
+        """Get or create HTTP client.
+
+        The client is taken from the process-wide pool when another
+        RobotsChecker already uses the same user-agent.
+        """
         if self._client is None:
-            self._client = httpx.Client(
+            key = self.user_agent
+            with _shared_clients_lock:
+                client = _shared_clients.get(key)
+                if client is None or client.is_closed:
+                    client = httpx.Client(
+                        http2=True,
+                        timeout=10.0,
+                        headers={"User-Agent": f"{self.user_agent}/1.0 (research purposes)"},
+                        limits=CONNECTION_LIMITS,
+                    )
+                    _shared_clients[key] = client
+                    _shared_client_users[key] = 0
+                _shared_client_users[key] += 1
+            self._client = client
+            self._pool_key = key
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get or create the async HTTP/2 client."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                http2=True,
                 timeout=10.0,
                 headers={"User-Agent": f"{self.user_agent}/1.0 (research purposes)"},
+                limits=CONNECTION_LIMITS,
             )
-        return self._client
+        return self._aclient
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """Close the sync HTTP client once no other checker shares it."""
+        client, key = self._client, self._pool_key
+        self._client = None
+        self._pool_key = None
+        if client is None:
+            return
+        if key is not None:
+            with _shared_clients_lock:
+                if _shared_clients.get(key) is client:
+                    users = _shared_client_users[key] - 1
+                    if users > 0:
+                        _shared_client_users[key] = users
+                        return
+                    del _shared_clients[key]
+                    del _shared_client_users[key]
+        client.close()
+
+    async def aclose(self) -> None:
+        """Release the sync client and close the async HTTP client."""
+        self.close()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
 
     def __enter__(self) -> "RobotsChecker":
         """Context manager entry."""
@@ -130,6 +329,14 @@ class RobotsChecker:
         """Context manager exit."""
         self.close()
 
+    async def __aenter__(self) -> "RobotsChecker":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
     def _parse_robots_txt(self, content: str) -> list[RobotsDirectives]:
         """Parse robots.txt content into directives.
 
@@ -143,19 +350,10 @@ class RobotsChecker:
         current_directives: RobotsDirectives | None = None
         sitemaps: list[str] = []
 
-        for line in content.splitlines():
-            # Remove comments and whitespace
-            line = line.split("#", 1)[0].strip()
-            if not line:
-                continue
-
-            # Parse key: value
-            if ":" not in line:
-                continue
-
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
+        # Lone carriage returns end a line too, but "^" only matches after "\n"
+        for match in _DIRECTIVE_RE.finditer(content.replace("\r", "\n")):
+            key = match[1].lower()
+            value = match[2].strip()
 
             if key == "user-agent":
                 # Start new directives block
@@ -202,7 +400,7 @@ class RobotsChecker:
         partial_match: RobotsDirectives | None = None
         wildcard_match: RobotsDirectives | None = None
 
-        ua_lower = self.user_agent.lower()
+        ua_lower = self._ua_lower
 
         for directives in directives_list:
             agent = directives.user_agent.lower()
@@ -216,6 +414,107 @@ class RobotsChecker:
 
         return exact_match or partial_match or wildcard_match
 
+    def _cached_directives(self, cache_entry: RobotsCache) -> RobotsDirectives | None:
+        """Get the directives matching our user-agent, memoized on the entry."""
+        if not cache_entry._matched:
+            cache_entry.matched_directives = self._find_matching_directives(
+                cache_entry.directives
+            )
+            cache_entry._matched = True
+        return cache_entry.matched_directives
+
+    def _robots_url(self, base_url: str, proxy_url: str | None) -> tuple[str, str]:
+        """Build the cache key and robots.txt URL for a site.
+
+        Args:
+            base_url: Base URL of the site
+            proxy_url: Optional proxy URL to route request through
+
+        Returns:
+            Tuple of (cache key, robots.txt URL)
+        """
+        parsed = urlparse(base_url)
+        cache_key = f"{parsed.scheme}://{parsed.netloc}"
+
+        # If proxy URL provided, route through it
+        if proxy_url:
+            return cache_key, f"{proxy_url}/proxy/{parsed.netloc}/robots.txt"
+        return cache_key, f"{cache_key}/robots.txt"
+
+    def _store_response(
+        self, cache_key: str, robots_url: str, response: httpx.Response
+    ) -> RobotsCache:
+        """Parse a robots.txt response and store it in the cache.
+
+        Args:
+            cache_key: Cache key of the site
+            robots_url: URL the response was fetched from
+            response: HTTP response for robots.txt
+
+        Returns:
+            The new RobotsCache entry
+        """
+        if response.status_code == 200:
+            content = response.text
+        elif response.status_code == 404:
+            # No robots.txt means everything is allowed
+            content = "User-agent: *\nAllow: /"
+        else:
+            logger.warning(
+                "Failed to fetch robots.txt from %s: status %d",
+                robots_url,
+                response.status_code,
+            )
+            # On error, assume everything is allowed
+            content = "User-agent: *\nAllow: /"
+
+        now = datetime.now(UTC)
+        directives = self._parse_robots_txt(content)
+
+        cache_entry = RobotsCache(
+            content=content,
+            fetched_at=now,
+            expires_at=now + self.cache_duration,
+            directives=directives,
+        )
+
+        # Store in cache, evicting the least recently used site when full
+        cache = self.cache
+        if cache_key in cache:
+            cache.move_to_end(cache_key)
+        elif len(cache) >= self.max_entries:
+            cache.popitem(last=False)
+        cache[cache_key] = cache_entry
+        self._failed_until.pop(cache_key, None)
+
+        logger.info(
+            "Fetched robots.txt from %s: %d directives",
+            robots_url,
+            len(directives),
+        )
+
+        return cache_entry
+
+    def _record_failure(self, cache_key: str, robots_url: str, error: Exception) -> None:
+        """Log a failed robots.txt fetch and negative-cache the site.
+
+        Args:
+            cache_key: Cache key of the site
+            robots_url: URL that failed
+            error: Exception raised by the fetch
+        """
+        if isinstance(error, httpx.TimeoutException):
+            logger.warning("Timeout fetching robots.txt from %s", robots_url)
+        elif isinstance(error, httpx.ConnectError):
+            logger.warning("Connection error fetching robots.txt from %s", robots_url)
+        else:
+            logger.error("Error fetching robots.txt from %s: %s", robots_url, error, exc_info=error)
+
+        # Remember the failure so callers don't re-pay the timeout per URL
+        self._failed_until[cache_key] = (
+            time.monotonic() + self.negative_cache_duration.total_seconds()
+        )
+
     def fetch_robots_txt(
         self, base_url: str, proxy_url: str | None = None
     ) -> RobotsCache | None:
@@ -228,64 +527,119 @@ class RobotsChecker:
         Returns:
             RobotsCache with parsed directives, or None on error
         """
-        parsed = urlparse(base_url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-
-        # If proxy URL provided, route through it
-        if proxy_url:
-            host = parsed.netloc
-            robots_url = f"{proxy_url}/proxy/{host}/robots.txt"
-
+        cache_key, robots_url = self._robots_url(base_url, proxy_url)
         client = self._get_client()
 
         try:
             response = client.get(robots_url)
+        except Exception as e:
+            self._record_failure(cache_key, robots_url, e)
+            return None
+        return self._store_response(cache_key, robots_url, response)
 
-            if response.status_code == 200:
-                content = response.text
-            elif response.status_code == 404:
-                # No robots.txt means everything is allowed
-                content = "User-agent: *\nAllow: /"
-            else:
-                logger.warning(
-                    "Failed to fetch robots.txt from %s: status %d",
-                    robots_url,
-                    response.status_code,
-                )
-                # On error, assume everything is allowed
-                content = "User-agent: *\nAllow: /"
-
-            now = datetime.now(UTC)
-            directives = self._parse_robots_txt(content)
-
-            cache_entry = RobotsCache(
-                content=content,
-                fetched_at=now,
-                expires_at=now + self.cache_duration,
-                directives=directives,
-            )
+    async def fetch_robots_txt_async(
+        self, base_url: str, proxy_url: str | None = None
+    ) -> RobotsCache | None:
+        """Fetch and parse robots.txt for a domain without blocking.
 
-            # Store in cache
-            cache_key = f"{parsed.scheme}://{parsed.netloc}"
-            self.cache[cache_key] = cache_entry
+        Lets callers fetch robots.txt for many hosts concurrently with
+        asyncio.gather.
 
-            logger.info(
-                "Fetched robots.txt from %s: %d directives",
-                robots_url,
-                len(directives),
-            )
+        Args:
+            base_url: Base URL of the site (e.g., https://www.moltbook.com)
+            proxy_url: Optional proxy URL to route request through
 
-            return cache_entry
+        Returns:
+            RobotsCache with parsed directives, or None on error
+        """
+        cache_key, robots_url = self._robots_url(base_url, proxy_url)
+        aclient = self._get_async_client()
 
-        except httpx.TimeoutException:
-            logger.warning("Timeout fetching robots.txt from %s", robots_url)
-            return None
-        except httpx.ConnectError:
-            logger.warning("Connection error fetching robots.txt from %s", robots_url)
-            return None
+        try:
+            response = await aclient.get(robots_url)
         except Exception as e:
-            logger.exception("Error fetching robots.txt from %s: %s", robots_url, e)
+            self._record_failure(cache_key, robots_url, e)
             return None
+        return self._store_response(cache_key, robots_url, response)
+
+    def _lookup_cache(self, base_url: str, refresh: bool) -> tuple[RobotsCache | None, bool]:
+        """Look up cached robots.txt for a site.
+
+        A site whose last fetch failed is not refetched until its negative
+        cache entry expires, unless refresh is set.
+
+        Args:
+            base_url: Base URL of the site
+            refresh: Force refresh of robots.txt cache
+
+        Returns:
+            Tuple of (live cache entry or None, whether to fetch robots.txt)
+        """
+        parsed = urlparse(base_url)
+        cache_key = f"{parsed.scheme}://{parsed.netloc}"
+
+        cache_entry = self.cache.get(cache_key)
+        if cache_entry is not None and not cache_entry.is_expired() and not refresh:
+            self.cache.move_to_end(cache_key)
+            return cache_entry, False
+
+        if not refresh:
+            failed_until = self._failed_until.get(cache_key)
+            if failed_until is not None and time.monotonic() < failed_until:
+                return None, False
+
+        return None, True
+
+    def _get_cache_entry(
+        self,
+        base_url: str,
+        proxy_url: str | None = None,
+        refresh: bool = False,
+    ) -> RobotsCache | None:
+        """Get cached robots.txt for a site, fetching it if missing or expired.
+
+        Args:
+            base_url: Base URL of the site
+            proxy_url: Optional proxy URL for fetching robots.txt
+            refresh: Force refresh of robots.txt cache
+
+        Returns:
+            RobotsCache, or None if robots.txt is unavailable
+        """
+        cache_entry, fetch = self._lookup_cache(base_url, refresh)
+        if fetch:
+            return self.fetch_robots_txt(base_url, proxy_url)
+        return cache_entry
+
+    def _check_path(self, cache_entry: RobotsCache | None, path: str) -> bool:
+        """Check a path against a site's robots.txt, memoizing the decision.
+
+        Args:
+            cache_entry: Cached robots.txt, or None if unavailable
+            path: URL path to check
+
+        Returns:
+            True if the path is allowed, False otherwise
+        """
+        if cache_entry is None:
+            # On error fetching robots.txt, allow by default
+            # This is the recommended behavior per robots.txt spec
+            return True
+
+        decisions = cache_entry.allow_decisions
+        allowed = decisions.get(path)
+        if allowed is not None:
+            return allowed
+
+        # Find matching directives; no matching user-agent allows everything
+        directives = self._cached_directives(cache_entry)
+        allowed = True if directives is None else directives.is_allowed(path)
+
+        if len(decisions) >= _MAX_ALLOW_DECISIONS:
+            # Evict the oldest decision (dicts keep insertion order)
+            del decisions[next(iter(decisions))]
+        decisions[path] = allowed
+        return allowed
 
     def is_allowed(
         self,
@@ -303,28 +657,29 @@ class RobotsChecker:
         Returns:
             True if the URL is allowed, False otherwise
         """
-        parsed = urlparse(url)
-        cache_key = f"{parsed.scheme}://{parsed.netloc}"
-        path = parsed.path or "/"
+        cache_entry = self._get_cache_entry(url, proxy_url, refresh)
+        return self._check_path(cache_entry, urlparse(url).path or "/")
 
-        # Check cache
-        cache_entry = self.cache.get(cache_key)
-        if cache_entry is None or cache_entry.is_expired() or refresh:
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            cache_entry = self.fetch_robots_txt(base_url, proxy_url)
-
-        if cache_entry is None:
-            # On error fetching robots.txt, allow by default
-            # This is the recommended behavior per robots.txt spec
-            return True
+    async def is_allowed_async(
+        self,
+        url: str,
+        proxy_url: str | None = None,
+        refresh: bool = False,
+    ) -> bool:
+        """Check if a URL is allowed by robots.txt, fetching it without blocking.
 
-        # Find matching directives
-        directives = self._find_matching_directives(cache_entry.directives)
-        if directives is None:
-            # No matching user-agent, allow everything
-            return True
+        Args:
+            url: Full URL to check
+            proxy_url: Optional proxy URL for fetching robots.txt
+            refresh: Force refresh of robots.txt cache
 
-        return directives.is_allowed(path)
+        Returns:
+            True if the URL is allowed, False otherwise
+        """
+        cache_entry, fetch = self._lookup_cache(url, refresh)
+        if fetch:
+            cache_entry = await self.fetch_robots_txt_async(url, proxy_url)
+        return self._check_path(cache_entry, urlparse(url).path or "/")
 
     def get_crawl_delay(
         self,
@@ -340,19 +695,13 @@ class RobotsChecker:
         Returns:
             Crawl delay in seconds, or None if not specified
         """
-        parsed = urlparse(base_url)
-        cache_key = f"{parsed.scheme}://{parsed.netloc}"
-
-        # Check cache
-        cache_entry = self.cache.get(cache_key)
-        if cache_entry is None or cache_entry.is_expired():
-            cache_entry = self.fetch_robots_txt(base_url, proxy_url)
+        cache_entry = self._get_cache_entry(base_url, proxy_url)
 
         if cache_entry is None:
             return None
 
         # Find matching directives
-        directives = self._find_matching_directives(cache_entry.directives)
+        directives = self._cached_directives(cache_entry)
         if directives is None:
             return None
 
@@ -372,13 +721,7 @@ class RobotsChecker:
         Returns:
             List of sitemap URLs
         """
-        parsed = urlparse(base_url)
-        cache_key = f"{parsed.scheme}://{parsed.netloc}"
-
-        # Check cache
-        cache_entry = self.cache.get(cache_key)
-        if cache_entry is None or cache_entry.is_expired():
-            cache_entry = self.fetch_robots_txt(base_url, proxy_url)
+        cache_entry = self._get_cache_entry(base_url, proxy_url)
 
         if cache_entry is None:
             return []
@@ -393,6 +736,7 @@ class RobotsChecker:
     def clear_cache(self) -> None:
         """Clear all cached robots.txt data."""
         self.cache.clear()
+        self._failed_until.clear()
 
     def get_cache_status(self) -> dict[str, Any]:
         """Get status of the robots.txt cache.
@@ -5,7 +5,8 @@ Implements adaptive polling with:
 - Adaptive intervals based on activity rate
 - Spike detection for increased polling frequency
 - Graceful shutdown with state persistence
-- APScheduler integration for job management
+- APScheduler integration for job management, or asyncio tasks
+  when run from async code
 
 Default intervals:
 - /posts?sort=new: 5 minutes
@@ -21,13 +22,17 @@ Adaptive behavior:
 """
 
 import asyncio
+import contextlib
 import logging
 import signal
 import threading
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from itertools import product
 from typing import Any
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -48,13 +53,48 @@ class EndpointType(str, Enum):
     AGENTS = "agents"  # On-demand
 
 
-@dataclass
+# Default-interval multiplier by (high activity, low activity)
+_ACTIVITY_MULTIPLIERS: dict[tuple[bool, bool], float] = {
+    (True, False): 0.5,
+    (False, True): 2.0,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PollingInterval:
-    """Polling interval configuration for an endpoint."""
+    """Polling interval configuration for an endpoint.
+
+    The adaptive interval for each activity level is clamped once at
+    construction; the class is frozen so it cannot go stale.
+    """
 
     default: timedelta
     minimum: timedelta
     maximum: timedelta
+    # Adaptive interval by (high activity, low activity)
+    _by_activity: dict[tuple[bool, bool], timedelta] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute the clamped interval for each activity level."""
+        by_activity = dict.fromkeys(product((True, False), (True, False)), self.default)
+        for key, multiplier in _ACTIVITY_MULTIPLIERS.items():
+            by_activity[key] = max(self.minimum, min(self.maximum, self.default * multiplier))
+        object.__setattr__(self, "_by_activity", by_activity)
+
+    def for_activity(self, high: bool, low: bool) -> timedelta:
+        """Get the clamped interval for an activity level.
+
+        Args:
+            high: Whether activity is above the high-activity rate
+            low: Whether activity is below the low-activity rate
+
+        Returns:
+            Half the default for high activity, double it for low activity,
+            clamped to [minimum, maximum]
+        """
+        return self._by_activity[(high, low)]
 
 
 # Default polling intervals per endpoint type
@@ -87,9 +127,42 @@ DEFAULT_INTERVALS: dict[EndpointType, PollingInterval] = {
 }
 
 
-@dataclass
+# Interval for endpoints without a configured PollingInterval
+_FALLBACK_INTERVAL = timedelta(minutes=5)
+
+# Default ActivityTracker sliding window (timedelta is immutable, so shared)
+_DEFAULT_WINDOW = timedelta(hours=1)
+
+# Default activity rate thresholds (posts per minute)
+_HIGH_ACTIVITY_RATE = 10.0
+_LOW_ACTIVITY_RATE = 1.0
+
+# Endpoint types polled on a schedule (the rest are on-demand)
+SCHEDULED_ENDPOINTS: tuple[EndpointType, ...] = (
+    EndpointType.NEW_POSTS,
+    EndpointType.HOT_POSTS,
+    EndpointType.TOP_POSTS,
+    EndpointType.RISING_POSTS,
+    EndpointType.SUBMOLTS,
+)
+
+# APScheduler job ID per endpoint type
+_JOB_IDS: dict[EndpointType, str] = {
+    endpoint_type: f"poll_{endpoint_type.value}" for endpoint_type in EndpointType
+}
+
+
+# Keys of PollState.to_status() that are saved for restarts as-is
+_PERSISTED_FIELDS = ("last_post_id", "error_count", "total_posts_fetched")
+
+
+@dataclass(slots=True)
 class PollState:
-    """State for a polling endpoint."""
+    """State for a polling endpoint.
+
+    to_status() caches its serialized form; the update methods below
+    invalidate it, so fields should be changed through them.
+    """
 
     endpoint: EndpointType
     last_post_id: str | None = None
@@ -100,6 +173,7 @@ class PollState:
     last_error: str | None = None
     posts_fetched_last: int = 0
     total_posts_fetched: int = 0
+    _status: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def record_poll(
         self,
@@ -114,18 +188,84 @@ class PollState:
         self.total_posts_fetched += posts_fetched
         self.error_count = 0
         self.last_error = None
+        self._status = None
 
         if last_post_id:
             self.last_post_id = last_post_id
 
         if interval:
-            self.current_interval = interval
-            self.next_poll_at = now + interval
+            self.schedule(interval, now)
 
     def record_error(self, error: str) -> None:
         """Record a poll error."""
         self.error_count += 1
         self.last_error = error
+        self._status = None
+
+    def schedule(self, interval: timedelta, now: datetime | None = None) -> None:
+        """Set the polling interval and the next poll time.
+
+        Args:
+            interval: New polling interval
+            now: Time the interval starts from (default: now)
+        """
+        self.current_interval = interval
+        self.next_poll_at = (now or datetime.now(UTC)) + interval
+        self._status = None
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore persisted fields saved from to_persisted().
+
+        Args:
+            data: Persisted state for this endpoint
+        """
+        self.last_post_id = data.get("last_post_id")
+        last_poll_at = data.get("last_poll_at")
+        if isinstance(last_poll_at, str):
+            # State saved before timestamps were persisted as epoch seconds
+            self.last_poll_at = datetime.fromisoformat(last_poll_at)
+        elif last_poll_at:
+            self.last_poll_at = datetime.fromtimestamp(last_poll_at, UTC)
+        self.error_count = data.get("error_count", 0)
+        self.total_posts_fetched = data.get("total_posts_fetched", 0)
+        self._status = None
+
+    def to_status(self) -> dict[str, Any]:
+        """Get this state as a JSON-serializable dict.
+
+        The dict is built once and reused until the state changes; treat it
+        as read-only.
+
+        Returns:
+            Dict of poll state fields with ISO timestamps
+        """
+        if self._status is None:
+            self._status = {
+                "last_post_id": self.last_post_id,
+                "last_poll_at": self.last_poll_at.isoformat() if self.last_poll_at else None,
+                "next_poll_at": self.next_poll_at.isoformat() if self.next_poll_at else None,
+                "current_interval": (
+                    self.current_interval.total_seconds() if self.current_interval else None
+                ),
+                "error_count": self.error_count,
+                "last_error": self.last_error,
+                "posts_fetched_last": self.posts_fetched_last,
+                "total_posts_fetched": self.total_posts_fetched,
+            }
+        return self._status
+
+    def to_persisted(self) -> dict[str, Any]:
+        """Get the subset of to_status() saved for restarts.
+
+        last_poll_at is saved as epoch seconds so restoring skips ISO parsing.
+
+        Returns:
+            Dict of persisted fields
+        """
+        status = self.to_status()
+        persisted = {key: status[key] for key in _PERSISTED_FIELDS}
+        persisted["last_poll_at"] = self.last_poll_at.timestamp() if self.last_poll_at else None
+        return persisted
 
 
 @dataclass
@@ -133,26 +273,70 @@ class ActivityTracker:
     """Tracks activity rates for adaptive polling.
 
     Maintains a sliding window of post counts to calculate
-    activity rates and detect spikes.
+    activity rates and detect spikes. A running total of the counts
+    in the window is kept so rates never re-sum the samples, and the
+    (rate, spiking) pair is memoized until the window changes. Pollers
+    record from several threads, so every access to the window and the
+    running total holds _lock.
 
     Attributes:
         window_size: Size of the sliding window (default: 1 hour)
-        samples: List of (timestamp, count) tuples
+        samples: Deque of (time.monotonic() timestamp, count) tuples, oldest first
     """
 
-    window_size: timedelta = field(default_factory=lambda: timedelta(hours=1))
-    samples: list[tuple[datetime, int]] = field(default_factory=list)
+    window_size: timedelta = _DEFAULT_WINDOW
+    samples: deque[tuple[float, int]] = field(default_factory=deque)
+    _total_count: int = field(default=0, init=False, repr=False, compare=False)
+    _snapshot_key: tuple[int, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _snapshot: tuple[float, bool] = field(
+        default=(0.0, False), init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Seed the running total from any pre-populated samples."""
+        self._total_count = sum(count for _, count in self.samples)
 
     def record_activity(self, count: int) -> None:
         """Record an activity sample."""
-        now = datetime.now(UTC)
-        self.samples.append((now, count))
-        self._cleanup_old_samples()
+        with self._lock:
+            now = time.monotonic()
+            self.samples.append((now, count))
+            self._total_count += count
+            self._cleanup_old_samples(now)
+
+    def record_activity_batch(self, counts: Iterable[int]) -> None:
+        """Record several activity samples at once.
+
+        The samples share one timestamp and the window is trimmed once,
+        rather than once per sample as repeated record_activity calls would.
+
+        Args:
+            counts: Post counts to record
+        """
+        batch_counts = list(counts)
+        with self._lock:
+            now = time.monotonic()
+            self._cleanup_old_samples(now)
+            self.samples.extend((now, count) for count in batch_counts)
+            self._total_count += sum(batch_counts)
+
+    def _cleanup_old_samples(self, now: float | None = None) -> None:
+        """Remove samples outside the window; the caller must hold _lock.
 
-    def _cleanup_old_samples(self) -> None:
-        """Remove samples outside the window."""
-        cutoff = datetime.now(UTC) - self.window_size
-        self.samples = [(ts, count) for ts, count in self.samples if ts > cutoff]
+        Args:
+            now: Current time.monotonic() reading, if the caller already has one
+        """
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self.window_size.total_seconds()
+        samples = self.samples
+        while samples and samples[0][0] <= cutoff:
+            self._total_count -= samples.popleft()[1]
 
     def get_rate(self) -> float:
         """Get the current activity rate (posts per minute).
@@ -160,22 +344,23 @@ class ActivityTracker:
         Returns:
             Average posts per minute over the window
         """
-        self._cleanup_old_samples()
+        with self._lock:
+            self._cleanup_old_samples()
+            return self._rate()
 
+    def _rate(self) -> float:
+        """get_rate body; assumes expired samples are already removed."""
         if not self.samples:
             return 0.0
 
-        total_count = sum(count for _, count in self.samples)
-        time_span = (
-            self.samples[-1][0] - self.samples[0][0]
-        ).total_seconds() / 60.0
+        time_span = (self.samples[-1][0] - self.samples[0][0]) / 60.0
 
         if time_span <= 0:
-            return float(total_count)
+            return float(self._total_count)
 
-        return total_count / time_span
+        return self._total_count / time_span
 
-    def is_high_activity(self, threshold: float = 10.0) -> bool:
+    def is_high_activity(self, threshold: float = _HIGH_ACTIVITY_RATE) -> bool:
         """Check if activity rate is high (above threshold).
 
         Args:
@@ -183,7 +368,7 @@ class ActivityTracker:
         """
         return self.get_rate() > threshold
 
-    def is_low_activity(self, threshold: float = 1.0) -> bool:
+    def is_low_activity(self, threshold: float = _LOW_ACTIVITY_RATE) -> bool:
         """Check if activity rate is low (below threshold).
 
         Args:
@@ -200,30 +385,54 @@ class ActivityTracker:
         Args:
             multiplier: How many times above normal to consider a spike
         """
-        self._cleanup_old_samples()
-
-        if len(self.samples) < 3:
+        with self._lock:
+            self._cleanup_old_samples()
+            return self._spiking(multiplier)
+
+    def _spiking(self, multiplier: float = 3.0) -> bool:
+        """is_spiking body; assumes expired samples are already removed."""
+        samples = self.samples
+        if len(samples) < 3:
             return False
 
+        # Get most recent rate
+        recent_count = samples[-1][1]
+
         # Calculate average rate (excluding most recent)
-        historical = self.samples[:-1]
-        historical_total = sum(count for _, count in historical)
-        historical_span = (
-            historical[-1][0] - historical[0][0]
-        ).total_seconds() / 60.0
+        historical_total = self._total_count - recent_count
+        historical_span = (samples[-2][0] - samples[0][0]) / 60.0
 
         if historical_span <= 0:
             return False
 
         historical_rate = historical_total / historical_span
 
-        # Get most recent rate
-        recent_count = self.samples[-1][1]
-
         # Compare with historical (use 10 as minimum baseline)
         baseline = max(historical_rate, 10)
         return recent_count > baseline * multiplier
 
+    def snapshot(self) -> tuple[float, bool]:
+        """Get the activity rate and spike flag from a single cleanup.
+
+        The result is memoized on (sample count, newest sample time), so
+        repeated calls between samples return the cached pair.
+
+        Returns:
+            Tuple of (posts per minute, whether activity is spiking)
+        """
+        with self._lock:
+            self._cleanup_old_samples()
+
+            samples = self.samples
+            if not samples:
+                return 0.0, False
+
+            key = (len(samples), samples[-1][0])
+            if key != self._snapshot_key:
+                self._snapshot = (self._rate(), self._spiking())
+                self._snapshot_key = key
+            return self._snapshot
+
 
 @dataclass
 class PollingScheduler:
@@ -248,6 +457,11 @@ class PollingScheduler:
     )
     shutdown_event: threading.Event = field(default_factory=threading.Event, repr=False)
     _running: bool = field(default=False, repr=False)
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, repr=False)
+    _async_stop: asyncio.Event | None = field(default=None, repr=False)
+    _job_intervals: dict[EndpointType, timedelta] = field(default_factory=dict, repr=False)
+    # Handlers start() replaced, restored by stop()
+    _prev_signal_handlers: dict[int, Any] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize poll states."""
@@ -255,35 +469,32 @@ class PollingScheduler:
             if endpoint_type not in self.poll_states:
                 self.poll_states[endpoint_type] = PollState(endpoint=endpoint_type)
 
-    def _get_adaptive_interval(self, endpoint_type: EndpointType) -> timedelta:
+    def _get_adaptive_interval(
+        self,
+        endpoint_type: EndpointType,
+        snapshot: tuple[float, bool] | None = None,
+    ) -> timedelta:
         """Calculate adaptive interval based on activity.
 
         Args:
             endpoint_type: The endpoint type
+            snapshot: (rate, spiking) from ActivityTracker.snapshot(), if the
+                caller already has one
 
         Returns:
             Adjusted polling interval
         """
         config = DEFAULT_INTERVALS.get(endpoint_type)
         if config is None:
-            return timedelta(minutes=5)
+            return _FALLBACK_INTERVAL
 
-        base_interval = config.default
-
-        # Adjust based on activity
-        if self.activity_tracker.is_spiking():
+        rate, spiking = snapshot or self.activity_tracker.snapshot()
+        if spiking:
             # During spikes, use minimum interval
             return config.minimum
-        elif self.activity_tracker.is_high_activity():
-            # High activity: reduce interval
-            reduced = base_interval * 0.5
-            return max(reduced, config.minimum)
-        elif self.activity_tracker.is_low_activity():
-            # Low activity: increase interval
-            increased = base_interval * 2
-            return min(increased, config.maximum)
 
-        return base_interval
+        # High activity halves the interval, low activity doubles it
+        return config.for_activity(rate > _HIGH_ACTIVITY_RATE, rate < _LOW_ACTIVITY_RATE)
 
     def _create_poll_job(self, endpoint_type: EndpointType) -> Callable[[], None]:
         """Create a poll job function for an endpoint.
@@ -294,21 +505,26 @@ class PollingScheduler:
         Returns:
             Job function to execute
         """
+        # Resolve attributes that never change once, outside the job;
+        # poll_callback is read per run since start() may rebind it
+        shutdown_is_set = self.shutdown_event.is_set
+        state = self.poll_states[endpoint_type]
+        update_interval = self._update_job_interval
 
         def job() -> None:
-            if self.shutdown_event.is_set():
+            if shutdown_is_set():
                 return
 
-            if self.poll_callback:
+            callback = self.poll_callback
+            if callback:
                 try:
-                    self.poll_callback(endpoint_type)
+                    callback(endpoint_type)
                 except Exception as e:
                     logger.exception("Error in poll callback for %s: %s", endpoint_type, e)
-                    state = self.poll_states[endpoint_type]
                     state.record_error(str(e))
 
             # Update interval based on activity
-            self._update_job_interval(endpoint_type)
+            update_interval(endpoint_type)
 
         return job
 
@@ -318,30 +534,36 @@ class PollingScheduler:
         Args:
             endpoint_type: The endpoint type
         """
-        if self.scheduler is None:
+        if self.scheduler is None and self._async_stop is None:
             return
 
-        job_id = f"poll_{endpoint_type.value}"
         new_interval = self._get_adaptive_interval(endpoint_type)
+        state = self.poll_states[endpoint_type]
 
-        # Reschedule with new interval
-        job = self.scheduler.get_job(job_id)
-        if job:
-            self.scheduler.reschedule_job(
-                job_id,
-                trigger=IntervalTrigger(seconds=new_interval.total_seconds()),
-            )
+        # Reschedule only when the trigger interval actually changes, which
+        # skips APScheduler's lock and job store update on the steady state;
+        # async loops read current_interval instead
+        scheduled = self._job_intervals
+        if self.scheduler is not None and scheduled.get(endpoint_type) != new_interval:
+            job_id = _JOB_IDS[endpoint_type]
+            job = self.scheduler.get_job(job_id)
+            if job:
+                self.scheduler.reschedule_job(
+                    job_id,
+                    trigger=IntervalTrigger(seconds=new_interval.total_seconds()),
+                )
+                scheduled[endpoint_type] = new_interval
 
         # Update state
-        state = self.poll_states[endpoint_type]
-        state.current_interval = new_interval
-        state.next_poll_at = datetime.now(UTC) + new_interval
+        state.schedule(new_interval)
 
-        logger.debug(
-            "Updated interval for %s: %s",
-            endpoint_type.value,
-            new_interval,
-        )
+        # Runs after every poll; skip building the log arguments when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updated interval for %s: %s",
+                endpoint_type.value,
+                new_interval,
+            )
 
     def start(self, poll_callback: Callable[[EndpointType], None]) -> None:
         """Start the polling scheduler.
@@ -360,15 +582,9 @@ class PollingScheduler:
         self.scheduler = BackgroundScheduler()
 
         # Schedule jobs for scheduled endpoint types (not on-demand)
-        for endpoint_type in [
-            EndpointType.NEW_POSTS,
-            EndpointType.HOT_POSTS,
-            EndpointType.TOP_POSTS,
-            EndpointType.RISING_POSTS,
-            EndpointType.SUBMOLTS,
-        ]:
+        for endpoint_type in SCHEDULED_ENDPOINTS:
             interval = DEFAULT_INTERVALS[endpoint_type].default
-            job_id = f"poll_{endpoint_type.value}"
+            job_id = _JOB_IDS[endpoint_type]
 
             self.scheduler.add_job(
                 self._create_poll_job(endpoint_type),
@@ -377,6 +593,7 @@ class PollingScheduler:
                 name=f"Poll {endpoint_type.value}",
                 replace_existing=True,
             )
+            self._job_intervals[endpoint_type] = interval
 
             logger.info(
                 "Scheduled %s polling every %s",
@@ -384,9 +601,10 @@ class PollingScheduler:
                 interval,
             )
 
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._handle_signal)
-        signal.signal(signal.SIGINT, self._handle_signal)
+        # Register signal handlers for graceful shutdown, keeping the
+        # previous ones so stop() can hand the signals back
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            self._prev_signal_handlers[sig] = signal.signal(sig, self._handle_signal)
 
         # Start scheduler
         self.scheduler.start()
@@ -406,21 +624,111 @@ class PollingScheduler:
         logger.info("Stopping polling scheduler...")
 
         # Signal shutdown
-        self.shutdown_event.set()
+        self._request_shutdown()
 
         # Shutdown scheduler
         if self.scheduler:
             self.scheduler.shutdown(wait=wait)
             self.scheduler = None
+            self._job_intervals.clear()
+
+        # A None handler was not installed from Python and cannot be restored
+        for sig, handler in self._prev_signal_handlers.items():
+            if handler is not None:
+                signal.signal(sig, handler)
+        self._prev_signal_handlers.clear()
 
         self._running = False
 
         logger.info("Polling scheduler stopped")
 
+    async def run_async(self, poll_callback: Callable[[EndpointType], None]) -> None:
+        """Run the polling loops as asyncio tasks until stopped.
+
+        Each scheduled endpoint gets one task that sleeps for its current
+        interval and then runs the poll job in a worker thread, so no
+        APScheduler thread or job store is involved.
+
+        Args:
+            poll_callback: Callback function to execute for each poll
+        """
+        if self._running:
+            logger.warning("Scheduler is already running")
+            return
+
+        self.poll_callback = poll_callback
+        self.shutdown_event.clear()
+        self._loop = asyncio.get_running_loop()
+        self._async_stop = asyncio.Event()
+        self._running = True
+
+        # Signal handlers only work on the main thread's loop
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+                self._loop.add_signal_handler(sig, self._request_shutdown)
+
+        logger.info("Polling scheduler started")
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                for endpoint_type in SCHEDULED_ENDPOINTS:
+                    tasks.create_task(self._run_endpoint_loop(endpoint_type))
+        finally:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+                    self._loop.remove_signal_handler(sig)
+            self.stop()
+            self._loop = None
+            self._async_stop = None
+
+    async def _run_endpoint_loop(self, endpoint_type: EndpointType) -> None:
+        """Poll one endpoint at its adaptive interval until stopped.
+
+        Args:
+            endpoint_type: The endpoint type
+        """
+        stop = self._async_stop
+        if stop is None:
+            return
+
+        job = self._create_poll_job(endpoint_type)
+        state = self.poll_states[endpoint_type]
+        interval = DEFAULT_INTERVALS[endpoint_type].default
+
+        logger.info("Scheduled %s polling every %s", endpoint_type.value, interval)
+
+        while not stop.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=interval.total_seconds())
+                return
+
+            try:
+                await asyncio.to_thread(job)
+            except Exception as e:
+                # An escaping error would make the TaskGroup cancel every loop
+                logger.exception("Error in poll job for %s: %s", endpoint_type, e)
+            interval = state.current_interval or interval
+
+    def _request_shutdown(self) -> None:
+        """Signal shutdown without tearing anything down.
+
+        Sets shutdown_event, so jobs stop polling, and wakes the async
+        polling loops. Safe to call from signal handlers and other threads;
+        stop() does the actual teardown.
+        """
+        self.shutdown_event.set()
+        if self._loop is not None and self._async_stop is not None:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                self._loop.call_soon_threadsafe(self._async_stop.set)
+
     def _handle_signal(self, signum: int, frame: Any) -> None:  # noqa: ARG002
-        """Handle shutdown signals."""
-        logger.info("Received signal %d, initiating graceful shutdown", signum)
-        self.stop()
+        """Handle shutdown signals.
+
+        Only requests shutdown: blocking on APScheduler or taking the logging
+        lock inside a signal handler can deadlock. Callers of start() should
+        wait on shutdown_event and then call stop(); run_async stops itself.
+        """
+        self._request_shutdown()
 
     def record_poll_result(
         self,
@@ -435,12 +743,29 @@ class PollingScheduler:
             posts_fetched: Number of posts fetched
             last_post_id: ID of the last post fetched
         """
+        # Update activity tracker first so the interval reflects this poll
+        self.activity_tracker.record_activity(posts_fetched)
+
         state = self.poll_states[endpoint_type]
-        interval = self._get_adaptive_interval(endpoint_type)
+        interval = self._get_adaptive_interval(endpoint_type, self.activity_tracker.snapshot())
         state.record_poll(posts_fetched, last_post_id, interval)
 
-        # Update activity tracker
-        self.activity_tracker.record_activity(posts_fetched)
+    def record_poll_results(self, results: list[tuple[EndpointType, int, str | None]]) -> None:
+        """Record the results of several polls at once.
+
+        Args:
+            results: (endpoint_type, posts_fetched, last_post_id) per poll
+        """
+        if not results:
+            return
+
+        # Record all activity first so every interval reflects the whole batch
+        self.activity_tracker.record_activity_batch(count for _, count, _ in results)
+        snapshot = self.activity_tracker.snapshot()
+
+        for endpoint_type, posts_fetched, last_post_id in results:
+            interval = self._get_adaptive_interval(endpoint_type, snapshot)
+            self.poll_states[endpoint_type].record_poll(posts_fetched, last_post_id, interval)
 
     def record_poll_error(self, endpoint_type: EndpointType, error: str) -> None:
         """Record a poll error.
@@ -474,29 +799,13 @@ class PollingScheduler:
         Returns:
             Dict with scheduler state and poll states
         """
+        activity_rate, is_spiking = self.activity_tracker.snapshot()
         return {
             "running": self._running,
-            "activity_rate": self.activity_tracker.get_rate(),
-            "is_spiking": self.activity_tracker.is_spiking(),
+            "activity_rate": activity_rate,
+            "is_spiking": is_spiking,
             "poll_states": {
-                endpoint_type.value: {
-                    "last_post_id": state.last_post_id,
-                    "last_poll_at": (
-                        state.last_poll_at.isoformat() if state.last_poll_at else None
-                    ),
-                    "next_poll_at": (
-                        state.next_poll_at.isoformat() if state.next_poll_at else None
-                    ),
-                    "current_interval": (
-                        state.current_interval.total_seconds()
-                        if state.current_interval
-                        else None
-                    ),
-                    "error_count": state.error_count,
-                    "last_error": state.last_error,
-                    "posts_fetched_last": state.posts_fetched_last,
-                    "total_posts_fetched": state.total_posts_fetched,
-                }
+                endpoint_type.value: dict(state.to_status())
                 for endpoint_type, state in self.poll_states.items()
             },
         }
@@ -508,14 +817,7 @@ class PollingScheduler:
             Dict with poll states to save
         """
         return {
-            endpoint_type.value: {
-                "last_post_id": state.last_post_id,
-                "last_poll_at": (
-                    state.last_poll_at.isoformat() if state.last_poll_at else None
-                ),
-                "error_count": state.error_count,
-                "total_posts_fetched": state.total_posts_fetched,
-            }
+            endpoint_type.value: state.to_persisted()
             for endpoint_type, state in self.poll_states.items()
         }
 
@@ -530,13 +832,7 @@ class PollingScheduler:
                 endpoint_type = EndpointType(endpoint_name)
                 state = self.poll_states.get(endpoint_type)
                 if state:
-                    state.last_post_id = data.get("last_post_id")
-                    if data.get("last_poll_at"):
-                        state.last_poll_at = datetime.fromisoformat(
-                            data["last_poll_at"]
-                        )
-                    state.error_count = data.get("error_count", 0)
-                    state.total_posts_fetched = data.get("total_posts_fetched", 0)
+                    state.restore(data)
             except (ValueError, KeyError) as e:
                 logger.warning("Error restoring state for %s: %s", endpoint_name, e)
 
@@ -558,18 +854,11 @@ async def run_scheduler_async(
 ) -> None:
     """Run the scheduler in an async context.
 
-    This allows integration with async code while the scheduler
-    runs its background threads.
+    Polls run as asyncio tasks on the current event loop until the
+    scheduler is stopped.
 
     Args:
         scheduler: The scheduler instance
         poll_callback: Callback function for polls
     """
-    scheduler.start(poll_callback)
-
-    try:
-        # Keep running until shutdown
-        while not scheduler.shutdown_event.is_set():
-            await asyncio.sleep(1.0)
-    finally:
-        scheduler.stop()
+    await scheduler.run_async(poll_callback)
@@ -6,26 +6,134 @@ Provides:
 - Future: Web dashboard for non-technical users
 """
 
-from fastapi import FastAPI
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Annotated, Any
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from monitor.health import HealthChecker
 
+# Seconds a health result is reused, so bursts of orchestrator probes
+# share one round of database and proxy checks
+HEALTH_CACHE_TTL = 2.0
+
+
+@dataclass
+class HealthCache:
+    """Most recent check_all() result, reused for HEALTH_CACHE_TTL seconds.
+
+    Kept per app on app.state, so the lock belongs to the app's event loop
+    and results never leak between apps.
+
+    Attributes:
+        checked_at: time.monotonic() of the cached check
+        status: Cached check_all() result, or None before the first check
+    """
+
+    checked_at: float = 0.0
+    status: dict[str, Any] | None = None
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def _fresh(self) -> dict[str, Any] | None:
+        """Get the cached result if it is younger than HEALTH_CACHE_TTL."""
+        if self.status is not None and time.monotonic() - self.checked_at < HEALTH_CACHE_TTL:
+            return self.status
+        return None
+
+    async def get(self, checker: HealthChecker) -> dict[str, Any]:
+        """Run the health checks, reusing a result younger than HEALTH_CACHE_TTL.
+
+        Args:
+            checker: HealthChecker to run the checks with
+
+        Returns:
+            check_all() result
+        """
+        status = self._fresh()
+        if status is not None:
+            return status
+
+        async with self._lock:
+            # Another request may have refreshed the cache while we waited
+            status = self._fresh()
+            if status is None:
+                status = await checker.check_all_async()
+                self.checked_at = time.monotonic()
+                self.status = status
+            return status
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the shared HealthChecker and result cache at startup.
+
+    The checker opens the database only for the duration of each check, so
+    sharing it does not hold the DuckDB file lock between requests.
+    """
+    app.state.health = HealthChecker()
+    app.state.health_cache = HealthCache()
+    try:
+        yield
+    finally:
+        checker = app.state.health
+        app.state.health = None
+        app.state.health_cache = None
+        if checker is not None:
+            await checker.aclose()
+
+
 app = FastAPI(
     title="OpenClaw Moltbook Monitor",
     description="Monitor and analyze the Moltbook platform",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
+def get_health_checker(request: Request) -> HealthChecker:
+    """Get the app's shared HealthChecker.
+
+    Created by the lifespan handler; created on first use if the app was
+    started without it (e.g. a TestClient used outside a with block).
+    """
+    checker: HealthChecker | None = getattr(request.app.state, "health", None)
+    if checker is None:
+        checker = HealthChecker()
+        request.app.state.health = checker
+    return checker
+
+
+HealthCheckerDep = Annotated[HealthChecker, Depends(get_health_checker)]
+
+
+def get_health_cache(request: Request) -> HealthCache:
+    """Get the app's health result cache.
+
+    Created by the lifespan handler; created on first use if the app was
+    started without it.
+    """
+    cache: HealthCache | None = getattr(request.app.state, "health_cache", None)
+    if cache is None:
+        cache = HealthCache()
+        request.app.state.health_cache = cache
+    return cache
+
+
+HealthCacheDep = Annotated[HealthCache, Depends(get_health_cache)]
+
+
 @app.get("/health")
-async def health_check() -> JSONResponse:
+async def health_check(checker: HealthCheckerDep, cache: HealthCacheDep) -> JSONResponse:
     """Simple health check endpoint for container orchestration.
 
     Returns 200 if healthy, 503 if unhealthy.
     """
-    checker = HealthChecker()
-    status = checker.check_all()
+    status = await cache.get(checker)
 
     if status["healthy"]:
         return JSONResponse(
@@ -40,13 +148,13 @@ async def health_check() -> JSONResponse:
 
 
 @app.get("/api/health")
-async def detailed_health() -> JSONResponse:
+async def detailed_health(checker: HealthCheckerDep, cache: HealthCacheDep) -> JSONResponse:
     """Detailed health check with component status.
 
     Returns full health information for debugging.
     """
-    checker = HealthChecker()
-    return JSONResponse(content=checker.to_json_response())
+    status = await cache.get(checker)
+    return JSONResponse(content=checker.to_json_response(status))
 
 
 @app.get("/")
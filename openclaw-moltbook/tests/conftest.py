@@ -1,12 +1,22 @@
-"""Pytest configuration and shared fixtures."""
+"""Pytest configuration and shared fixtures.
 
+FastAPI and the web app are imported inside the web fixtures, so test runs
+that never request them do not pay for loading FastAPI.
+"""
+
+import inspect
 import os
 import tempfile
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import httpx
 import pytest
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 
 @pytest.fixture
 def temp_db_path() -> Generator[Path, None, None]:
@@ -16,6 +26,60 @@ def temp_db_path() -> Generator[Path, None, None]:
         yield db_path
 
 
+@pytest.fixture(scope="session")
+def app() -> "FastAPI":
+    """The monitor web application, imported on first use.
+
+    The OpenAPI schema is built here, once, so no test's first request to
+    /openapi.json or /docs pays for the schema walk.
+    """
+    from monitor.web import app
+
+    app.openapi()
+    return app
+
+
+@pytest.fixture
+async def aclient(app: "FastAPI") -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Async client that drives the web app in-process on the test's event loop.
+
+    Requests go straight through ASGITransport, with no portal thread. The
+    app lifespan is not run; enter a TestClient for that.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def stub_health(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Replace HealthChecker checks with plain functions returning fixed results.
+
+    Call the returned function with check names as keywords, e.g.
+    stub_health(check_proxy_async={"healthy": True, "message": "OK"}).
+    Async checks are replaced with coroutine functions. No mocks are
+    created, and monkeypatch restores the originals after the test.
+    """
+    from monitor.health import HealthChecker
+
+    def stub(**results: dict[str, Any]) -> None:
+        for name, result in results.items():
+            check: Callable[..., Any]
+            if inspect.iscoroutinefunction(getattr(HealthChecker, name)):
+
+                async def check(_self: Any, _result: dict[str, Any] = result) -> dict[str, Any]:
+                    return _result
+
+            else:
+
+                def check(_self: Any, _result: dict[str, Any] = result) -> dict[str, Any]:
+                    return _result
+
+            monkeypatch.setattr(HealthChecker, name, check)
+
+    return stub
+
+
 @pytest.fixture
 def mock_proxy_url() -> str:
     """Return mock proxy URL for testing."""
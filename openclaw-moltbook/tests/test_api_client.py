@@ -1,8 +1,9 @@
 """Tests for the Moltbook API client."""
 
 import json
+import threading
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -17,6 +18,9 @@ from monitor.api_client import (
     PostSort,
     RateLimitInfo,
     Submolt,
+    _parse_timestamp,
+    close_shared_clients,
+    normalize_post,
 )
 
 
@@ -48,6 +52,21 @@ class TestRateLimitInfo:
         assert info.remaining is None
         assert info.reset is None
 
+    def test_from_headers_case_insensitive(self) -> None:
+        """Header names are matched regardless of case."""
+        headers = httpx.Headers(
+            [
+                ("content-type", "application/json"),
+                ("x-ratelimit-limit", "100"),
+                ("X-RATELIMIT-REMAINING", "7"),
+            ]
+        )
+        info = RateLimitInfo.from_headers(headers)
+
+        assert info.limit == 100
+        assert info.remaining == 7
+        assert info.reset is None
+
 
 class TestPost:
     """Tests for Post data model."""
@@ -104,6 +123,41 @@ class TestPost:
         assert post.agent_id == "agent1"
         assert post.comment_count == 10
 
+    def test_primary_field_wins_over_alternative(self) -> None:
+        """A primary field present in the data is used even when falsy."""
+        data = {
+            "id": "abc123",
+            "agent_id": "agent1",
+            "author_id": "agent2",
+            "comment_count": 0,
+            "num_comments": 10,
+        }
+        post = Post.from_api_response(data)
+
+        assert post.agent_id == "agent1"
+        assert post.comment_count == 0
+
+
+    def test_matches_normalize_post(self) -> None:
+        """from_api_response and normalize_post resolve the same field values."""
+        data = {
+            "id": "abc123",
+            "title": "Test Post",
+            "submolt": "test",
+            "author_id": "agent1",
+            "score": 7,
+            "num_comments": 3,
+            "created_at": "2024-01-15T10:30:00Z",
+        }
+
+        assert Post.from_api_response(data) == Post(**normalize_post(data))
+
+    def test_instances_are_slotted(self) -> None:
+        """Parsed models do not carry a per-instance __dict__."""
+        post = Post.from_api_response({"id": "abc123", "title": "Test Post"})
+
+        assert not hasattr(post, "__dict__")
+
 
 class TestComment:
     """Tests for Comment data model."""
@@ -240,16 +294,18 @@ class TestMoltbookClient:
         """Successful posts fetch."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "id": "post1",
-                "title": "Test",
-                "submolt": "test",
-                "agent_id": "agent1",
-                "score": 0,
-                "created_at": "2024-01-15T00:00:00Z",
-            }
-        ]
+        mock_response.content = json.dumps(
+            [
+                {
+                    "id": "post1",
+                    "title": "Test",
+                    "submolt": "test",
+                    "agent_id": "agent1",
+                    "score": 0,
+                    "created_at": "2024-01-15T00:00:00Z",
+                }
+            ]
+        ).encode()
         mock_response.headers = httpx.Headers({"X-RateLimit-Remaining": "99"})
         mock_get.return_value = mock_response
 
@@ -265,7 +321,7 @@ class TestMoltbookClient:
         """Handle rate limiting response."""
         mock_response = MagicMock()
         mock_response.status_code = 429
-        mock_response.json.return_value = {"error": "Rate limited"}
+        mock_response.content = json.dumps({"error": "Rate limited"}).encode()
         mock_response.headers = httpx.Headers(
             {"X-RateLimit-Remaining": "0", "Retry-After": "60"}
         )
@@ -278,6 +334,59 @@ class TestMoltbookClient:
         assert response.status_code == 429
         assert response.rate_limit.remaining == 0
 
+    @patch.object(httpx.Client, "get")
+    def test_get_posts_non_json_error_body(self, mock_get: MagicMock) -> None:
+        """Fall back to the response text when the error body is not JSON."""
+        mock_response = MagicMock()
+        mock_response.status_code = 502
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_response.text = "<html>Bad Gateway</html>"
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        with MoltbookClient() as client:
+            response = client.get_posts()
+
+        assert not response.success
+        assert response.status_code == 502
+        assert response.error_message == "<html>Bad Gateway</html>"
+
+    @patch.object(httpx.Client, "get")
+    def test_get_posts_invalid_json_success_body(self, mock_get: MagicMock) -> None:
+        """A 200 response with an undecodable body becomes an error response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"{not json"
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        with MoltbookClient() as client:
+            response = client.get_posts()
+
+        assert not response.success
+        assert response.status_code == 0
+        assert response.error_message.startswith("Request error")
+
+    @patch.object(httpx.Client, "get")
+    def test_get_posts_other_http_error(self, mock_get: MagicMock) -> None:
+        """Other httpx transport errors are reported, not raised."""
+        mock_get.side_effect = httpx.RemoteProtocolError("Server disconnected")
+
+        with MoltbookClient() as client:
+            response = client.get_posts()
+
+        assert not response.success
+        assert "Server disconnected" in response.error_message
+
+    def test_get_posts_invalid_url(self) -> None:
+        """A malformed proxy URL is reported, not raised."""
+        with MoltbookClient(proxy_base_url="http://proxy:notaport") as client:
+            response = client.get_posts()
+
+        assert not response.success
+        assert response.status_code == 0
+        assert response.error_message.startswith("Request error")
+
     @patch.object(httpx.Client, "get")
     def test_get_posts_timeout(self, mock_get: MagicMock) -> None:
         """Handle request timeout."""
@@ -307,18 +416,20 @@ class TestMoltbookClient:
         """fetch_posts returns parsed Post objects."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "posts": [
-                {
-                    "id": "post1",
-                    "title": "Test Post",
-                    "submolt": "test",
-                    "agent_id": "agent1",
-                    "score": 10,
-                    "created_at": "2024-01-15T00:00:00Z",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "posts": [
+                    {
+                        "id": "post1",
+                        "title": "Test Post",
+                        "submolt": "test",
+                        "agent_id": "agent1",
+                        "score": 10,
+                        "created_at": "2024-01-15T00:00:00Z",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.headers = httpx.Headers({})
         mock_get.return_value = mock_response
 
@@ -331,19 +442,75 @@ class TestMoltbookClient:
         assert posts[0].title == "Test Post"
 
     @patch.object(httpx.Client, "get")
-    def test_get_comments(self, mock_get: MagicMock) -> None:
-        """Fetch comments for a post."""
+    def test_fetch_posts_skips_malformed(self, mock_get: MagicMock) -> None:
+        """fetch_posts drops malformed items and keeps the rest."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps(
+            [
+                {"id": "post1", "title": "Good", "created_at": "not-a-date"},
+                "not-a-dict",
+                {"id": "post2", "title": "Also good"},
+            ]
+        ).encode()
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        with MoltbookClient() as client:
+            posts, response = client.fetch_posts()
+
+        assert response.success
+        assert [post.id for post in posts] == ["post2"]
+
+    @patch.object(httpx.Client, "get")
+    def test_iter_posts_raw_yields_normalized_dicts(self, mock_get: MagicMock) -> None:
+        """iter_posts_raw yields dicts with Post field names and parsed timestamps."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
             {
-                "id": "comment1",
-                "content": "Test comment",
-                "agent_id": "agent1",
-                "score": 5,
-                "created_at": "2024-01-15T00:00:00Z",
+                "posts": [
+                    {
+                        "id": 7,
+                        "title": "Raw Post",
+                        "submolt": "test",
+                        "author_id": "agent1",
+                        "num_comments": 3,
+                        "created_at": "2024-01-15T00:00:00Z",
+                    },
+                    {"id": "bad", "created_at": "not-a-date"},
+                ]
             }
-        ]
+        ).encode()
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        with MoltbookClient() as client:
+            posts = list(client.iter_posts_raw())
+
+        assert len(posts) == 1
+        assert posts[0]["id"] == "7"
+        assert posts[0]["agent_id"] == "agent1"
+        assert posts[0]["comment_count"] == 3
+        assert posts[0]["created_at"] == datetime(2024, 1, 15, tzinfo=UTC)
+        assert Post(**posts[0]).title == "Raw Post"
+
+    @patch.object(httpx.Client, "get")
+    def test_get_comments(self, mock_get: MagicMock) -> None:
+        """Fetch comments for a post."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            [
+                {
+                    "id": "comment1",
+                    "content": "Test comment",
+                    "agent_id": "agent1",
+                    "score": 5,
+                    "created_at": "2024-01-15T00:00:00Z",
+                }
+            ]
+        ).encode()
         mock_response.headers = httpx.Headers({})
         mock_get.return_value = mock_response
 
@@ -359,18 +526,62 @@ class TestMoltbookClient:
         assert "sort" in str(call_args) or call_args[1].get("params", {}).get("sort")
 
     @patch.object(httpx.Client, "get")
-    def test_get_submolts(self, mock_get: MagicMock) -> None:
-        """Fetch list of submolts."""
+    def test_sort_param_encodes_as_value(self, mock_get: MagicMock) -> None:
+        """Sort enums are sent as their plain string value."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = b"[]"
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        with MoltbookClient() as client:
+            client.get_posts(sort=PostSort.HOT)
+
+        params = mock_get.call_args[1]["params"]
+        request = httpx.Request("GET", "http://proxy/posts", params=params)
+        assert request.url.params["sort"] == "hot"
+
+    @patch.object(httpx.Client, "get")
+    def test_iter_comments_yields_lazily(self, mock_get: MagicMock) -> None:
+        """iter_comments yields Comment objects and skips malformed ones."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
             {
-                "name": "test",
-                "display_name": "Test",
-                "subscriber_count": 100,
-                "created_at": "2024-01-01T00:00:00Z",
+                "comments": [
+                    {"id": "c1", "content": "First", "agent_id": "a1", "score": 1},
+                    {"id": "c2", "created_at": "not-a-date"},
+                    {"id": "c3", "content": "Third", "agent_id": "a2", "score": 2},
+                ]
             }
-        ]
+        ).encode()
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        with MoltbookClient() as client:
+            comments = client.iter_comments(post_id="post1")
+            first = next(comments)
+            rest = list(comments)
+
+        assert first.id == "c1"
+        assert first.post_id == "post1"
+        assert [comment.id for comment in rest] == ["c3"]
+
+    @patch.object(httpx.Client, "get")
+    def test_get_submolts(self, mock_get: MagicMock) -> None:
+        """Fetch list of submolts."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            [
+                {
+                    "name": "test",
+                    "display_name": "Test",
+                    "subscriber_count": 100,
+                    "created_at": "2024-01-01T00:00:00Z",
+                }
+            ]
+        ).encode()
         mock_response.headers = httpx.Headers({})
         mock_get.return_value = mock_response
 
@@ -384,11 +595,13 @@ class TestMoltbookClient:
         """Fetch agent profile."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "name": "TestAgent",
-            "karma": 1000,
-            "created_at": "2023-01-01T00:00:00Z",
-        }
+        mock_response.content = json.dumps(
+            {
+                "name": "TestAgent",
+                "karma": 1000,
+                "created_at": "2023-01-01T00:00:00Z",
+            }
+        ).encode()
         mock_response.headers = httpx.Headers({})
         mock_get.return_value = mock_response
 
@@ -402,7 +615,7 @@ class TestMoltbookClient:
         """Search for posts."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = []
+        mock_response.content = json.dumps([]).encode()
         mock_response.headers = httpx.Headers({})
         mock_get.return_value = mock_response
 
@@ -415,3 +628,258 @@ class TestMoltbookClient:
         params = call_args[1].get("params", {})
         assert params.get("q") == "test query"
         assert params.get("limit") == 10
+
+
+class TestMoltbookClientAsync:
+    """Tests for the async MoltbookClient request path."""
+
+    @patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock)
+    async def test_afetch_comments_parses_response(self, mock_get: AsyncMock) -> None:
+        """afetch_comments returns parsed Comment objects."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {
+                "comments": [
+                    {
+                        "id": "comment1",
+                        "content": "Test comment",
+                        "agent_id": "agent1",
+                        "score": 5,
+                        "created_at": "2024-01-15T00:00:00Z",
+                    }
+                ]
+            }
+        ).encode()
+        mock_response.headers = httpx.Headers({})
+        mock_get.return_value = mock_response
+
+        async with MoltbookClient() as client:
+            comments, response = await client.afetch_comments(post_id="post1")
+
+        assert response.success
+        assert len(comments) == 1
+        assert comments[0].post_id == "post1"
+
+    @patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock)
+    async def test_afetch_comments_many_preserves_order(self, mock_get: AsyncMock) -> None:
+        """afetch_comments_many returns one result per post, in order."""
+
+        def make_response(url: str, params: dict[str, object]) -> MagicMock:
+            post_id = url.rstrip("/").split("/")[-2]
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps(
+                [{"id": f"c-{post_id}", "content": "x", "agent_id": "a1", "score": 0}]
+            ).encode()
+            response.headers = httpx.Headers({})
+            return response
+
+        mock_get.side_effect = make_response
+
+        async with MoltbookClient() as client:
+            results = await client.afetch_comments_many(
+                ["p1", "p2", "p3"], concurrency=2
+            )
+
+        assert mock_get.call_count == 3
+        assert [comments[0].id for comments, _ in results] == ["c-p1", "c-p2", "c-p3"]
+        assert all(response.success for _, response in results)
+
+    @patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock)
+    async def test_aget_submolts_many_preserves_order(self, mock_get: AsyncMock) -> None:
+        """aget_submolts_many returns one response per submolt, in order."""
+
+        def make_response(url: str, params: dict[str, object] | None) -> MagicMock:
+            name = url.rstrip("/").split("/")[-1]
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({"name": name}).encode()
+            response.headers = httpx.Headers({})
+            return response
+
+        mock_get.side_effect = make_response
+
+        async with MoltbookClient() as client:
+            results = await client.aget_submolts_many(["tech", "art", "news"], concurrency=2)
+
+        assert mock_get.call_count == 3
+        assert [response.data["name"] for response in results] == ["tech", "art", "news"]
+
+    @patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock)
+    async def test_aget_comments_timeout(self, mock_get: AsyncMock) -> None:
+        """Async path handles request timeout."""
+        mock_get.side_effect = httpx.TimeoutException("Request timed out")
+
+        async with MoltbookClient() as client:
+            response = await client.aget_comments(post_id="post1")
+
+        assert not response.success
+        assert response.status_code == 0
+        assert "timeout" in response.error_message.lower()
+
+
+    async def test_aget_comments_invalid_url(self) -> None:
+        """Async path reports a malformed proxy URL instead of raising."""
+        async with MoltbookClient(proxy_base_url="http://proxy:notaport") as client:
+            response = await client.aget_comments(post_id="post1")
+
+        assert not response.success
+        assert response.error_message.startswith("Request error")
+
+
+class TestMockTransport:
+    """End-to-end tests through real httpx responses.
+
+    The client is given an httpx client backed by httpx.MockTransport, so
+    header parsing, JSON decoding and model parsing all run on genuine
+    httpx.Response objects rather than MagicMock stand-ins.
+    """
+
+    @staticmethod
+    def _handler(request: httpx.Request) -> httpx.Response:
+        """Serve a posts listing with rate limit headers."""
+        assert request.url.path == "/proxy/www.moltbook.com/api/v1/posts"
+        payload = {
+            "posts": [
+                {
+                    "id": "post1",
+                    "title": "Test Post",
+                    "submolt": "test",
+                    "author_id": "agent1",
+                    "score": 10,
+                    "created_at": "2024-01-15T00:00:00Z",
+                }
+            ]
+        }
+        return httpx.Response(
+            200,
+            content=json.dumps(payload).encode(),
+            headers={"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "99"},
+        )
+
+    def test_fetch_posts(self) -> None:
+        """fetch_posts parses a real response and its rate limit headers."""
+        http_client = httpx.Client(transport=httpx.MockTransport(self._handler))
+        client = MoltbookClient(proxy_base_url="http://proxy:8080", _client=http_client)
+
+        with http_client:
+            posts, response = client.fetch_posts(sort=PostSort.HOT)
+
+        assert response.success
+        assert [post.agent_id for post in posts] == ["agent1"]
+        assert client.last_rate_limit.limit == 100
+        assert client.last_rate_limit.remaining == 99
+
+    async def test_async_request(self) -> None:
+        """The async path parses a real response the same way."""
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+
+        async with MoltbookClient(proxy_base_url="http://proxy:8080", _aclient=http_client) as c:
+            response = await c._arequest("posts")
+
+        assert response.success
+        assert response.data["posts"][0]["id"] == "post1"
+        assert response.rate_limit.remaining == 99
+
+
+class TestSharedConnectionPool:
+    """Tests for the process-wide sync client pool."""
+
+    def test_clients_share_pool_for_same_proxy(self) -> None:
+        """Instances with identical settings reuse one httpx.Client."""
+        client_a = MoltbookClient(proxy_base_url="http://pool-test:8080")
+        client_b = MoltbookClient(proxy_base_url="http://pool-test:8080")
+        client_c = MoltbookClient(proxy_base_url="http://other-proxy:8080")
+
+        assert client_a._get_client() is client_b._get_client()
+        assert client_a._get_client() is not client_c._get_client()
+
+        close_shared_clients()
+        assert client_a._get_client().is_closed
+
+    def test_client_accepts_compressed_responses(self) -> None:
+        """The pooled client advertises gzip and brotli encodings."""
+        client = MoltbookClient(proxy_base_url="http://pool-test:8080")
+
+        accept_encoding = client._get_client().headers["Accept-Encoding"]
+
+        assert "gzip" in accept_encoding
+        assert "br" in accept_encoding
+        close_shared_clients()
+
+    def test_close_keeps_pool_open_for_other_users(self) -> None:
+        """close() only closes the pooled client once its last user closes."""
+        client_a = MoltbookClient(proxy_base_url="http://pool-test:8080")
+        client_b = MoltbookClient(proxy_base_url="http://pool-test:8080")
+        shared = client_b._get_client()
+
+        client_a._get_client()
+        client_a.close()
+
+        assert client_a._client is None
+        assert not shared.is_closed
+
+        client_b.close()
+
+        assert shared.is_closed
+        assert client_a._get_client() is not shared
+        client_a.close()
+
+    def test_close_closes_injected_client(self) -> None:
+        """A client passed in directly is closed rather than detached."""
+        http_client = httpx.Client()
+        client = MoltbookClient(_client=http_client)
+
+        client.close()
+
+        assert http_client.is_closed
+
+    def test_concurrent_get_client_creates_one_client(self) -> None:
+        """Racing threads get the same pooled client."""
+        barrier = threading.Barrier(8)
+        clients = [MoltbookClient(proxy_base_url="http://race-test:8080") for _ in range(8)]
+        seen: list[httpx.Client] = []
+
+        def get(client: MoltbookClient) -> None:
+            barrier.wait()
+            seen.append(client._get_client())
+
+        threads = [threading.Thread(target=get, args=(c,)) for c in clients]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in seen}) == 1
+        for client in clients:
+            client.close()
+        assert seen[0].is_closed
+
+
+class TestParseTimestamp:
+    """Tests for API timestamp parsing."""
+
+    def test_iso_with_z_suffix(self) -> None:
+        """ISO strings with a trailing Z parse as UTC."""
+        parsed = _parse_timestamp("2024-01-15T10:30:00Z")
+
+        assert parsed == datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+
+    def test_iso_with_offset(self) -> None:
+        """ISO strings with an explicit offset keep it."""
+        parsed = _parse_timestamp("2024-01-15T10:30:00+00:00")
+
+        assert parsed == datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+
+    def test_unix_timestamp(self) -> None:
+        """Numeric values are treated as Unix timestamps."""
+        parsed = _parse_timestamp(1705315800)
+
+        assert parsed == datetime(2024, 1, 15, 10, 50, tzinfo=UTC)
+
+    def test_missing_defaults_to_now(self) -> None:
+        """Missing values fall back to the current time."""
+        parsed = _parse_timestamp(None)
+
+        assert abs((parsed - datetime.now(UTC)).total_seconds()) < 2
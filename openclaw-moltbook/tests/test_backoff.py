@@ -1,5 +1,6 @@
 """Tests for the backoff module."""
 
+import time
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -39,6 +40,12 @@ class TestErrorType:
         assert classify_http_error(200) == ErrorType.UNKNOWN
         assert classify_http_error(301) == ErrorType.UNKNOWN
 
+    def test_classify_out_of_range(self) -> None:
+        """Codes outside 0-599 are unknown rather than an index error."""
+        assert classify_http_error(-1) == ErrorType.UNKNOWN
+        assert classify_http_error(600) == ErrorType.UNKNOWN
+        assert classify_http_error(999) == ErrorType.UNKNOWN
+
 
 class TestParseRetryAfter:
     """Tests for Retry-After header parsing."""
@@ -49,6 +56,25 @@ class TestParseRetryAfter:
         assert parse_retry_after("60") == 60.0
         assert parse_retry_after("0") == 0.0
 
+    def test_parse_fractional_and_padded_seconds(self) -> None:
+        """Parse fractional seconds and tolerate surrounding whitespace."""
+        assert parse_retry_after("1.5") == 1.5
+        assert parse_retry_after(" 30 ") == 30.0
+
+    def test_parse_http_date(self) -> None:
+        """Parse an HTTP-date into seconds from now."""
+        future = datetime.now(UTC) + timedelta(seconds=120)
+        header = future.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+        seconds = parse_retry_after(header)
+
+        assert seconds is not None
+        assert 115 <= seconds <= 121
+
+    def test_parse_http_date_in_past(self) -> None:
+        """HTTP-dates in the past clamp to zero."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
     def test_parse_none(self) -> None:
         """Return None for missing header."""
         assert parse_retry_after(None) is None
@@ -111,9 +137,17 @@ class TestBackoffState:
         state.record_error(ErrorType.RATE_LIMITED, retry_after_seconds=60.0)
 
         assert state.retry_after is not None
-        # Should be about 60 seconds from now
-        delta = state.retry_after - datetime.now(UTC)
-        assert 59 <= delta.total_seconds() <= 61
+        # Should be about 60 seconds from now (monotonic clock)
+        delta = state.retry_after - time.monotonic()
+        assert 59 <= delta <= 61
+
+    def test_record_error_with_explicit_now(self) -> None:
+        """A caller-supplied clock reading is used for both timestamps."""
+        state = BackoffState()
+        state.record_error(ErrorType.RATE_LIMITED, retry_after_seconds=30.0, now=100.0)
+
+        assert state.last_error_at == 100.0
+        assert state.retry_after == 130.0
 
     def test_record_success(self) -> None:
         """Recording success increments consecutive count."""
@@ -137,6 +171,33 @@ class TestBackoffState:
         assert state.error_count == 0
         assert state.last_error_type is None
 
+    def test_isoformat_timestamps_cached_until_change(self) -> None:
+        """Formatted timestamps are reused until the state changes."""
+        state = BackoffState()
+        assert state.isoformat_timestamps(0.0) == (None, None)
+
+        state.record_error(ErrorType.RATE_LIMITED, retry_after_seconds=30.0, now=100.0)
+        first = state.isoformat_timestamps(0.0)
+        assert first[0] == datetime.fromtimestamp(100.0, tz=UTC).isoformat()
+        assert first[1] == datetime.fromtimestamp(130.0, tz=UTC).isoformat()
+        assert state.isoformat_timestamps(0.0)[0] is first[0]
+
+        state.record_error(ErrorType.SERVER_ERROR, now=200.0)
+        last_error_at, retry_after = state.isoformat_timestamps(0.0)
+        assert last_error_at == datetime.fromtimestamp(200.0, tz=UTC).isoformat()
+        assert retry_after is None
+
+    def test_equality_ignores_iso_cache(self) -> None:
+        """Formatting timestamps does not make equal states compare unequal."""
+        state = BackoffState()
+        state.record_error(ErrorType.SERVER_ERROR, now=100.0)
+        other = BackoffState()
+        other.record_error(ErrorType.SERVER_ERROR, now=100.0)
+
+        state.isoformat_timestamps(0.0)
+
+        assert state == other
+
     def test_reset(self) -> None:
         """Reset clears all state."""
         state = BackoffState()
@@ -152,6 +213,14 @@ class TestBackoffState:
 class TestBackoffHandler:
     """Tests for BackoffHandler."""
 
+    def test_equality_ignores_rng_and_tables(self) -> None:
+        """Handlers with the same config and states compare equal."""
+        handler = BackoffHandler()
+        handler.calculate_delay("test", ErrorType.SERVER_ERROR)
+
+        assert BackoffHandler() == BackoffHandler()
+        assert handler == BackoffHandler(endpoint_states=handler.endpoint_states)
+
     def test_calculate_delay_client_error(self) -> None:
         """Client errors have zero delay (no retry)."""
         handler = BackoffHandler()
@@ -179,6 +248,38 @@ class TestBackoffHandler:
         # delay1 max = 2.4, delay3 min = 6.4, so delay3 > delay1 always
         assert delay3 > delay1
 
+    def test_calculate_delay_follows_exponential_curve(self) -> None:
+        """Exponential delays match base_delay * 2^error_count within jitter."""
+        handler = BackoffHandler(config=BackoffConfig(base_delay=0.5))
+
+        for error_count in range(1, 10):
+            handler.record_error("test", ErrorType.SERVER_ERROR)
+            expected = 0.5 * 2 ** min(error_count, 8)
+            delay = handler.calculate_delay("test", ErrorType.SERVER_ERROR)
+            assert expected * 0.8 <= delay <= expected * 1.2
+
+    def test_calculate_delay_timeout_is_linear(self) -> None:
+        """Timeout delays grow linearly with the error count."""
+        handler = BackoffHandler()
+
+        for _ in range(3):
+            handler.record_error("test", ErrorType.TIMEOUT)
+
+        delay = handler.calculate_delay("test", ErrorType.TIMEOUT)
+        # base_delay * timeout_multiplier * error_count = 1.0 * 2.0 * 3
+        assert 6.0 * 0.8 <= delay <= 6.0 * 1.2
+
+    def test_calculate_delay_tracks_config_changes(self) -> None:
+        """Changing base_delay after construction updates the delay curve."""
+        handler = BackoffHandler()
+        handler.record_error("test", ErrorType.SERVER_ERROR)
+        handler.calculate_delay("test", ErrorType.SERVER_ERROR)
+
+        handler.config.base_delay = 10.0
+        delay = handler.calculate_delay("test", ErrorType.SERVER_ERROR)
+
+        assert 16.0 <= delay <= 24.0
+
     def test_calculate_delay_respects_max(self) -> None:
         """Delay is capped at max_delay."""
         config = BackoffConfig(max_delay=10.0)
@@ -200,6 +301,25 @@ class TestBackoffHandler:
 
         assert delay == 30.0
 
+    def test_jitter_within_configured_range(self) -> None:
+        """Jittered delays stay within the configured jitter range."""
+        handler = BackoffHandler()
+
+        factors = [handler._apply_jitter(1.0) for _ in range(2048)]
+
+        assert all(0.8 <= factor <= 1.2 for factor in factors)
+        assert len(set(factors)) > 1
+
+    def test_jitter_table_follows_config_changes(self) -> None:
+        """Changing the jitter range regenerates the jitter samples."""
+        handler = BackoffHandler()
+        handler._apply_jitter(1.0)
+
+        handler.config.jitter_min = 2.0
+        handler.config.jitter_max = 3.0
+
+        assert 2.0 <= handler._apply_jitter(1.0) <= 3.0
+
     def test_record_error_returns_delay(self) -> None:
         """record_error returns the calculated delay."""
         handler = BackoffHandler()
@@ -284,6 +404,18 @@ class TestBackoffHandler:
         assert "test" in status["endpoints"]
         assert status["endpoints"]["test"]["error_count"] == 1
 
+    def test_get_status_formats_timestamps(self) -> None:
+        """Monotonic timestamps are reported as wall-clock ISO strings."""
+        handler = BackoffHandler()
+        handler.record_error("test", ErrorType.RATE_LIMITED, retry_after_seconds=60.0)
+
+        endpoint = handler.get_status()["endpoints"]["test"]
+
+        last_error_at = datetime.fromisoformat(endpoint["last_error_at"])
+        retry_after = datetime.fromisoformat(endpoint["retry_after"])
+        assert abs((last_error_at - datetime.now(UTC)).total_seconds()) < 2
+        assert 58 <= (retry_after - last_error_at).total_seconds() <= 62
+
 
 class TestCreateBackoffHandler:
     """Tests for create_backoff_handler factory function."""
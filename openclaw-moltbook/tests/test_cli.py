@@ -6,16 +6,22 @@ Tests cover:
 - Health command functionality
 """
 
+import json
+import subprocess
+import sys
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import httpx
 from typer.testing import CliRunner
 
-from monitor.cli import app
+from monitor.cli import app, dumps_json
 
 runner = CliRunner()
 
+PROXY_OK = {"healthy": True, "message": "Proxy OK"}
+
 
 class TestCLIBasics:
     """Tests for basic CLI functionality."""
@@ -38,42 +44,78 @@ class TestCLIBasics:
         assert result.exit_code == 0
         assert "Verbose mode enabled" in result.stdout
 
+    def test_import_defers_health_module(self) -> None:
+        """Importing the CLI does not load the health checker, httpx or asyncio."""
+        code = (
+            "import sys, monitor.cli; "
+            "print('monitor.health' in sys.modules, 'httpx' in sys.modules, "
+            "'asyncio' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.split() == ["False", "False", "False"]
+
+
+class TestDumpsJson:
+    """Tests for JSON rendering."""
+
+    def test_matches_stdlib_output(self) -> None:
+        """orjson and the stdlib fallback render the same text."""
+        data = {"status": "ok", "count": 2, "nested": {"items": [1, 2]}}
+
+        with patch("monitor.cli.orjson", None):
+            fallback = dumps_json(data)
+
+        assert dumps_json(data) == fallback
+
+    def test_non_json_values_use_str(self) -> None:
+        """Values JSON cannot represent are rendered with str()."""
+        assert dumps_json({"path": Path("/tmp/x")}) == '{\n  "path": "/tmp/x"\n}'
+
 
 class TestHealthCommand:
     """Tests for health command."""
 
-    def test_health_text_output(self, temp_db_path: Path) -> None:
+    def test_health_text_output(self, stub_health: Callable[..., None], temp_db_path: Path) -> None:
         """Test health command with text output."""
-        with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-            mock_proxy.return_value = {"healthy": True, "message": "Proxy OK"}
+        stub_health(check_proxy_async=PROXY_OK)
 
-            result = runner.invoke(app, ["health"])
+        result = runner.invoke(app, ["health"])
 
-            assert result.exit_code == 0
-            assert "Health Status" in result.stdout
+        assert result.exit_code == 0
+        assert "Health Status" in result.stdout
 
-    def test_health_json_output(self, temp_db_path: Path) -> None:
+    def test_health_json_output(self, stub_health: Callable[..., None], temp_db_path: Path) -> None:
         """Test health command with JSON output."""
-        with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-            mock_proxy.return_value = {"healthy": True, "message": "Proxy OK"}
+        stub_health(check_proxy_async=PROXY_OK)
 
-            result = runner.invoke(app, ["health", "--format", "json"])
+        result = runner.invoke(app, ["health", "--format", "json"])
 
-            assert result.exit_code == 0
-            assert '"timestamp"' in result.stdout
-            assert '"database"' in result.stdout
+        assert result.exit_code == 0
+        assert '"timestamp"' in result.stdout
+        assert '"database"' in result.stdout
 
-    def test_health_unhealthy_exit_code(self) -> None:
-        """Test health command returns exit code 1 when unhealthy."""
-        with patch("monitor.health.HealthChecker.check_database") as mock_db:
-            mock_db.return_value = {"healthy": False, "message": "DB error"}
+    def test_health_json_output_is_verbatim(self, stub_health: Callable[..., None]) -> None:
+        """JSON output is not wrapped or stripped of bracketed text."""
+        message = "[bold]" + "x" * 200
+        stub_health(check_proxy_async={"healthy": True, "message": message})
 
-            with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-                mock_proxy.return_value = {"healthy": False, "message": "Proxy error"}
+        result = runner.invoke(app, ["health", "--format", "json"])
 
-                result = runner.invoke(app, ["health"])
+        assert json.loads(result.stdout)["proxy"]["message"] == message
 
-                assert result.exit_code == 1
+    def test_health_unhealthy_exit_code(self, stub_health: Callable[..., None]) -> None:
+        """Test health command returns exit code 1 when unhealthy."""
+        stub_health(
+            check_database={"healthy": False, "message": "DB error"},
+            check_proxy_async={"healthy": False, "message": "Proxy error"},
+        )
+
+        result = runner.invoke(app, ["health"])
+
+        assert result.exit_code == 1
 
 
 class TestStatusCommand:
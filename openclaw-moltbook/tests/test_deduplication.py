@@ -1,6 +1,8 @@
 """Tests for the deduplication module."""
 
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -8,10 +10,15 @@ from monitor.deduplication import (
     DeduplicationFilter,
     DeduplicationTracker,
     SeenPost,
+    _post_fields,
     calculate_content_hash,
     create_deduplication_filter,
 )
 
+# (post_id, agent_id, title, submolt) baseline for the hash variation tests
+_BASE_FIELDS = ("id1", "agent1", "Title", "submolt")
+_BASE_HASH = calculate_content_hash(*_BASE_FIELDS)
+
 
 class TestCalculateContentHash:
     """Tests for content hash calculation."""
@@ -23,40 +30,23 @@ class TestCalculateContentHash:
 
         assert hash1 == hash2
 
-    def test_different_id_different_hash(self) -> None:
-        """Different post ID produces different hash."""
-        hash1 = calculate_content_hash("id1", "agent1", "Title", "submolt")
-        hash2 = calculate_content_hash("id2", "agent1", "Title", "submolt")
-
-        assert hash1 != hash2
-
-    def test_different_agent_different_hash(self) -> None:
-        """Different agent ID produces different hash."""
-        hash1 = calculate_content_hash("id1", "agent1", "Title", "submolt")
-        hash2 = calculate_content_hash("id1", "agent2", "Title", "submolt")
-
-        assert hash1 != hash2
+    @pytest.mark.parametrize(
+        ("index", "value"),
+        [(0, "id2"), (1, "agent2"), (2, "Title 2"), (3, "submolt2")],
+        ids=["post_id", "agent_id", "title", "submolt"],
+    )
+    def test_single_field_change_changes_hash(self, index: int, value: str) -> None:
+        """Changing any one input field produces a different hash."""
+        variant = _BASE_FIELDS[:index] + (value,) + _BASE_FIELDS[index + 1 :]
 
-    def test_different_title_different_hash(self) -> None:
-        """Different title produces different hash."""
-        hash1 = calculate_content_hash("id1", "agent1", "Title 1", "submolt")
-        hash2 = calculate_content_hash("id1", "agent1", "Title 2", "submolt")
+        assert calculate_content_hash(*variant) != _BASE_HASH
 
-        assert hash1 != hash2
-
-    def test_different_submolt_different_hash(self) -> None:
-        """Different submolt produces different hash."""
-        hash1 = calculate_content_hash("id1", "agent1", "Title", "submolt1")
-        hash2 = calculate_content_hash("id1", "agent1", "Title", "submolt2")
-
-        assert hash1 != hash2
-
-    def test_hash_is_sha256(self) -> None:
-        """Hash is 64 character hex string (SHA-256)."""
+    def test_hash_is_raw_128_bit_digest(self) -> None:
+        """Hash is a raw 16-byte digest."""
         hash_value = calculate_content_hash("id", "agent", "title", "submolt")
 
-        assert len(hash_value) == 64
-        assert all(c in "0123456789abcdef" for c in hash_value)
+        assert isinstance(hash_value, bytes)
+        assert len(hash_value) == 16
 
 
 class TestSeenPost:
@@ -64,21 +54,25 @@ class TestSeenPost:
 
     def test_create_seen_post(self) -> None:
         """Create SeenPost record."""
-        from datetime import UTC, datetime
-
         now = datetime.now(UTC)
         post = SeenPost(
             post_id="id1",
-            content_hash="hash1",
+            content_hash=b"hash1",
             first_seen_at=now,
             last_seen_at=now,
             seen_count=1,
         )
 
         assert post.post_id == "id1"
-        assert post.content_hash == "hash1"
+        assert post.content_hash == b"hash1"
         assert post.seen_count == 1
 
+    def test_seen_post_is_slotted(self) -> None:
+        """Records do not carry a per-instance __dict__."""
+        record = DeduplicationTracker().mark_seen("id1", b"hash1")
+
+        assert not hasattr(record, "__dict__")
+
 
 class TestDeduplicationTracker:
     """Tests for DeduplicationTracker."""
@@ -88,46 +82,56 @@ class TestDeduplicationTracker:
         tracker = DeduplicationTracker()
 
         assert not tracker.is_duplicate("id1")
-        assert not tracker.is_duplicate("id1", "hash1")
+        assert not tracker.is_duplicate("id1", b"hash1")
 
     def test_is_duplicate_by_id(self) -> None:
         """Post is duplicate if ID was seen."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
 
         assert tracker.is_duplicate("id1")
-        assert tracker.is_duplicate("id1", "different_hash")
+        assert tracker.is_duplicate("id1", b"different_hash")
 
     def test_is_duplicate_by_hash(self) -> None:
         """Post is duplicate if content hash was seen."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
 
         # Different ID but same hash
-        assert tracker.is_duplicate("id2", "hash1")
+        assert tracker.is_duplicate("id2", b"hash1")
 
     def test_mark_seen_creates_record(self) -> None:
         """mark_seen creates a SeenPost record."""
         tracker = DeduplicationTracker()
-        record = tracker.mark_seen("id1", "hash1")
+        record = tracker.mark_seen("id1", b"hash1")
 
         assert record.post_id == "id1"
-        assert record.content_hash == "hash1"
+        assert record.content_hash == b"hash1"
         assert record.seen_count == 1
 
     def test_mark_seen_updates_existing(self) -> None:
         """mark_seen updates existing record."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
-        record = tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
+        record = tracker.mark_seen("id1", b"hash1")
 
         assert record.seen_count == 2
         assert record.last_seen_at >= record.first_seen_at
 
+    def test_mark_seen_explicit_now(self) -> None:
+        """mark_seen records a caller-supplied timestamp."""
+        tracker = DeduplicationTracker()
+        now = datetime(2024, 1, 1, tzinfo=UTC)
+
+        record = tracker.mark_seen("id1", b"hash1", now=now)
+
+        assert record.first_seen_at == now
+        assert record.last_seen_at == now
+
     def test_has_id(self) -> None:
         """has_id checks ID index."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
 
         assert tracker.has_id("id1")
         assert not tracker.has_id("id2")
@@ -135,15 +139,15 @@ class TestDeduplicationTracker:
     def test_has_hash(self) -> None:
         """has_hash checks hash index."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
 
-        assert tracker.has_hash("hash1")
-        assert not tracker.has_hash("hash2")
+        assert tracker.has_hash(b"hash1")
+        assert not tracker.has_hash(b"hash2")
 
     def test_get_by_id(self) -> None:
         """get_by_id retrieves record by ID."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
 
         record = tracker.get_by_id("id1")
         assert record is not None
@@ -154,22 +158,20 @@ class TestDeduplicationTracker:
     def test_get_by_hash(self) -> None:
         """get_by_hash retrieves record by content hash."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
+        tracker.mark_seen("id1", b"hash1")
 
-        record = tracker.get_by_hash("hash1")
+        record = tracker.get_by_hash(b"hash1")
         assert record is not None
-        assert record.content_hash == "hash1"
+        assert record.content_hash == b"hash1"
 
-        assert tracker.get_by_hash("hash2") is None
+        assert tracker.get_by_hash(b"hash2") is None
 
     def test_cleanup_expired(self) -> None:
         """cleanup_expired removes old entries."""
-        from datetime import UTC, datetime
-
         tracker = DeduplicationTracker(ttl=timedelta(days=1))
 
         # Add entry with old last_seen_at
-        record = tracker.mark_seen("id1", "hash1")
+        record = tracker.mark_seen("id1", b"hash1")
         # Manually backdate it
         record.last_seen_at = datetime.now(UTC) - timedelta(days=2)
 
@@ -177,13 +179,40 @@ class TestDeduplicationTracker:
 
         assert removed == 1
         assert not tracker.has_id("id1")
-        assert not tracker.has_hash("hash1")
+        assert not tracker.has_hash(b"hash1")
+
+    def test_cleanup_expired_keeps_refreshed_entries(self) -> None:
+        """Re-seen entries move behind newer ones and survive cleanup."""
+        tracker = DeduplicationTracker(ttl=timedelta(days=1))
+        first = tracker.mark_seen("id1", b"hash1")
+        second = tracker.mark_seen("id2", b"hash2")
+        first.last_seen_at = second.last_seen_at = datetime.now(UTC) - timedelta(days=2)
+
+        tracker.mark_seen("id1", b"hash1")
+
+        assert list(tracker.by_id) == ["id2", "id1"]
+        assert tracker.cleanup_expired() == 1
+        assert tracker.has_id("id1")
+        assert not tracker.has_id("id2")
+
+    def test_max_entries_evicts_least_recently_seen(self) -> None:
+        """Inserting past max_entries evicts the least recently seen post."""
+        tracker = DeduplicationTracker(max_entries=2)
+        tracker.mark_seen("id1", b"hash1")
+        tracker.mark_seen("id2", b"hash2")
+        tracker.mark_seen("id1", b"hash1")
+
+        tracker.mark_seen("id3", b"hash3")
+
+        assert list(tracker.by_id) == ["id1", "id3"]
+        assert not tracker.has_hash(b"hash2")
+        assert tracker.get_stats()["total_hashes"] == 2
 
     def test_get_stats(self) -> None:
         """get_stats returns tracker statistics."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
-        tracker.mark_seen("id2", "hash2")
+        tracker.mark_seen("id1", b"hash1")
+        tracker.mark_seen("id2", b"hash2")
 
         stats = tracker.get_stats()
 
@@ -191,11 +220,28 @@ class TestDeduplicationTracker:
         assert stats["total_hashes"] == 2
         assert stats["oldest_entry"] is not None
 
+    def test_get_stats_oldest_entry_tracks_cleanup(self) -> None:
+        """oldest_entry follows the oldest remaining record after cleanup."""
+        tracker = DeduplicationTracker(ttl=timedelta(days=1))
+        old = tracker.mark_seen("id1", b"hash1")
+        new = tracker.mark_seen("id2", b"hash2")
+        old.last_seen_at = datetime.now(UTC) - timedelta(days=2)
+
+        assert tracker.get_stats()["oldest_entry"] == old.first_seen_at.isoformat()
+
+        tracker.cleanup_expired()
+
+        assert tracker.get_stats()["oldest_entry"] == new.first_seen_at.isoformat()
+
+        tracker.clear()
+
+        assert tracker.get_stats()["oldest_entry"] is None
+
     def test_clear(self) -> None:
         """clear removes all entries."""
         tracker = DeduplicationTracker()
-        tracker.mark_seen("id1", "hash1")
-        tracker.mark_seen("id2", "hash2")
+        tracker.mark_seen("id1", b"hash1")
+        tracker.mark_seen("id2", b"hash2")
 
         tracker.clear()
 
@@ -240,6 +286,95 @@ class TestDeduplicationFilter:
         assert new_posts[0]["id"] == "2"
         assert skipped == 1
 
+    def test_filter_new_skips_duplicates_within_batch(self) -> None:
+        """filter_new skips repeats of a post earlier in the same batch."""
+        filter = DeduplicationFilter()
+
+        post = {"id": "1", "agent_id": "a1", "title": "Post 1", "submolt": "test"}
+        new_posts, skipped = filter.filter_new([post, dict(post)])
+
+        assert new_posts == [post]
+        assert skipped == 1
+
+    def test_filter_new_falls_back_to_author_id(self) -> None:
+        """author_id and non-string IDs hash the same as agent_id strings."""
+        filter = DeduplicationFilter()
+        filter.filter_new([{"id": 1, "agent_id": "a1", "title": "T", "submolt": "s"}])
+
+        new_posts, skipped = filter.filter_new(
+            [{"id": "2", "author_id": "a1", "title": "T", "submolt": "s"}]
+        )
+
+        assert new_posts
+        assert skipped == 0
+        assert filter.tracker.has_id("1")
+        assert not filter.is_new({"id": "1", "author_id": "a1", "title": "T", "submolt": "s"})
+
+    def test_explicit_none_agent_id_does_not_use_author_id(self) -> None:
+        """author_id is used only when agent_id is absent, not when it is None."""
+        explicit_none = {"id": "1", "agent_id": None, "author_id": "a1", "title": "T"}
+        absent = {"id": "1", "author_id": "a1", "title": "T"}
+
+        assert _post_fields(explicit_none) == ("1", "None", "T", "")
+        assert _post_fields(absent) == ("1", "a1", "T", "")
+
+    def test_author_id_not_read_when_agent_id_present(self) -> None:
+        """A post with agent_id is read with a single agent lookup."""
+        keys: list[str] = []
+
+        class RecordingDict(dict[str, Any]):
+            def get(self, key: str, default: Any = None) -> Any:
+                keys.append(key)
+                return super().get(key, default)
+
+        _post_fields(RecordingDict(id="1", agent_id="a1", author_id="a2"))
+
+        assert "author_id" not in keys
+
+    def test_filter_new_accepts_missing_title(self) -> None:
+        """A post with a None title or non-string submolt does not abort the batch."""
+        filter = DeduplicationFilter()
+
+        new_posts, skipped = filter.filter_new(
+            [
+                {"id": "1", "agent_id": "a1", "title": None, "submolt": "s"},
+                {"id": "2", "agent_id": "a1", "title": "T", "submolt": 7},
+            ]
+        )
+
+        assert len(new_posts) == 2
+        assert skipped == 0
+
+    def test_filter_new_skips_hashing_known_ids(self) -> None:
+        """Posts whose ID is already tracked are skipped without hashing."""
+        filter = DeduplicationFilter()
+        post = {"id": "1", "agent_id": "a1", "title": "Post 1", "submolt": "test"}
+        filter.filter_new([post])
+
+        with patch("monitor.deduplication.calculate_content_hash") as mock_hash:
+            new_posts, skipped = filter.filter_new([post])
+            is_new = filter.is_new(post)
+
+        assert new_posts == []
+        assert skipped == 1
+        assert not is_new
+        mock_hash.assert_not_called()
+
+    def test_filter_new_shares_batch_timestamp(self) -> None:
+        """Posts marked in one batch share a single timestamp."""
+        filter = DeduplicationFilter()
+        posts = [
+            {"id": "1", "agent_id": "a1", "title": "Post 1", "submolt": "test"},
+            {"id": "2", "agent_id": "a1", "title": "Post 2", "submolt": "test"},
+        ]
+
+        filter.filter_new(posts)
+
+        first = filter.tracker.get_by_id("1")
+        second = filter.tracker.get_by_id("2")
+        assert first is not None and second is not None
+        assert first.first_seen_at == second.first_seen_at
+
     def test_filter_new_without_marking(self) -> None:
         """filter_new can skip marking posts as seen."""
         filter = DeduplicationFilter()
@@ -281,14 +416,25 @@ class TestDeduplicationFilter:
         assert record.post_id == "1"
         assert not filter.is_new(post)
 
+    def test_mark_post_seen_repeat_reuses_hash(self) -> None:
+        """Repeat sightings update the record without rehashing."""
+        filter = DeduplicationFilter()
+        post = {"id": "1", "agent_id": "a1", "title": "Post 1", "submolt": "test"}
+        first = filter.mark_post_seen(post)
+
+        with patch("monitor.deduplication.calculate_content_hash") as mock_hash:
+            record = filter.mark_post_seen(post)
+
+        assert record is first
+        assert record.seen_count == 2
+        mock_hash.assert_not_called()
+
     def test_cleanup(self) -> None:
         """cleanup removes expired entries."""
         filter = DeduplicationFilter()
         filter.tracker.ttl = timedelta(days=1)
 
         # Add old entry
-        from datetime import UTC, datetime
-
         post = {"id": "1", "agent_id": "a1", "title": "Post 1", "submolt": "test"}
         record = filter.mark_post_seen(post)
         record.last_seen_at = datetime.now(UTC) - timedelta(days=2)
@@ -332,3 +478,9 @@ class TestCreateDeduplicationFilter:
         filter = create_deduplication_filter(ttl_days=30)
 
         assert filter.tracker.ttl == timedelta(days=30)
+
+    def test_custom_max_entries(self) -> None:
+        """Factory accepts a custom size cap."""
+        filter = create_deduplication_filter(max_entries=10)
+
+        assert filter.tracker.max_entries == 10
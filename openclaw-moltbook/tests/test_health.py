@@ -7,12 +7,13 @@ Tests cover:
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import duckdb
 import httpx
 import pytest
 
-from monitor.health import HealthChecker
+from monitor.health import HealthChecker, _ssl_context
 
 
 class TestHealthChecker:
@@ -49,6 +50,19 @@ class TestDatabaseHealth:
         assert result["healthy"] is True
         assert "Connected to" in result["message"]
 
+    def test_database_not_locked_between_checks(self, temp_db_path: Path) -> None:
+        """A check releases the database, so a writer can open it afterwards."""
+        # An existing file is checked read-only
+        duckdb.connect(str(temp_db_path)).close()
+        checker = HealthChecker(db_path=str(temp_db_path))
+
+        assert checker.check_database()["healthy"] is True
+        assert checker.check_database()["healthy"] is True
+
+        # Fails with a configuration conflict if the checker still holds it open
+        writer = duckdb.connect(str(temp_db_path), read_only=False)
+        writer.close()
+
     def test_database_directory_missing(self) -> None:
         """Test database health check when directory doesn't exist."""
         checker = HealthChecker(db_path="/nonexistent/path/db.duckdb")
@@ -79,7 +93,7 @@ class TestProxyHealth:
         mock_response.status_code = 200
         mock_response.elapsed.total_seconds.return_value = 0.05
 
-        with patch.object(httpx.Client, "get", return_value=mock_response):
+        with patch.object(httpx.Client, "head", return_value=mock_response):
             result = checker.check_proxy()
 
         assert result["healthy"] is True
@@ -93,7 +107,7 @@ class TestProxyHealth:
         mock_response = MagicMock()
         mock_response.status_code = 503
 
-        with patch.object(httpx.Client, "get", return_value=mock_response):
+        with patch.object(httpx.Client, "head", return_value=mock_response):
             result = checker.check_proxy()
 
         assert result["healthy"] is False
@@ -103,7 +117,7 @@ class TestProxyHealth:
         """Test proxy health check when connection is refused."""
         checker = HealthChecker(proxy_url="http://test:8080/health")
 
-        with patch.object(httpx.Client, "get", side_effect=httpx.ConnectError("Connection refused")):
+        with patch.object(httpx.Client, "head", side_effect=httpx.ConnectError("Connection refused")):
             result = checker.check_proxy()
 
         assert result["healthy"] is False
@@ -113,12 +127,65 @@ class TestProxyHealth:
         """Test proxy health check when connection times out."""
         checker = HealthChecker(proxy_url="http://test:8080/health")
 
-        with patch.object(httpx.Client, "get", side_effect=httpx.TimeoutException("Timeout")):
+        with patch.object(httpx.Client, "head", side_effect=httpx.TimeoutException("Timeout")):
             result = checker.check_proxy()
 
         assert result["healthy"] is False
         assert "timed out" in result["message"]
 
+    def test_proxy_head_not_allowed_falls_back_to_get(self) -> None:
+        """Endpoints that reject HEAD are probed with GET instead."""
+        checker = HealthChecker(proxy_url="http://test:8080/health")
+
+        not_allowed = MagicMock()
+        not_allowed.status_code = 405
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.elapsed.total_seconds.return_value = 0.05
+
+        with (
+            patch.object(httpx.Client, "head", return_value=not_allowed),
+            patch.object(httpx.Client, "get", return_value=ok) as mock_get,
+        ):
+            result = checker.check_proxy()
+
+        assert result["healthy"] is True
+        mock_get.assert_called_once_with("http://test:8080/health")
+
+    def test_proxy_client_reused(self) -> None:
+        """Repeated probes share one HTTP client until closed."""
+        checker = HealthChecker(proxy_url="http://test:8080/health")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.elapsed.total_seconds.return_value = 0.05
+
+        with patch.object(httpx.Client, "head", return_value=mock_response):
+            checker.check_proxy()
+            client = checker._client
+            checker.check_proxy()
+
+        assert client is not None
+        assert checker._client is client
+
+        checker.close()
+
+        assert checker._client is None
+
+    async def test_clients_share_ssl_context(self) -> None:
+        """The CA bundle is loaded once for all checkers and clients."""
+        _ssl_context.cache_clear()
+
+        with patch(
+            "monitor.health.httpx.create_ssl_context", wraps=httpx.create_ssl_context
+        ) as mock_create:
+            for checker in (HealthChecker(), HealthChecker()):
+                checker._get_client()
+                checker._get_async_client()
+                await checker.aclose()
+
+        assert mock_create.call_count == 1
+
 
 class TestOverallHealth:
     """Tests for overall health status."""
@@ -135,7 +202,7 @@ class TestOverallHealth:
         mock_response.status_code = 200
         mock_response.elapsed.total_seconds.return_value = 0.01
 
-        with patch.object(httpx.Client, "get", return_value=mock_response):
+        with patch.object(httpx.Client, "head", return_value=mock_response):
             result = checker.check_all()
 
         assert "timestamp" in result
@@ -151,7 +218,7 @@ class TestOverallHealth:
         )
 
         # Proxy may fail but overall health depends on database
-        with patch.object(httpx.Client, "get", side_effect=httpx.ConnectError("No proxy")):
+        with patch.object(httpx.Client, "head", side_effect=httpx.ConnectError("No proxy")):
             result = checker.check_all()
 
         # Overall health is based on database
@@ -159,6 +226,41 @@ class TestOverallHealth:
         assert result["database"]["healthy"] is True
         assert result["proxy"]["healthy"] is False
 
+    async def test_check_all_async(self, temp_db_path: Path) -> None:
+        """check_all_async gathers database and proxy status."""
+        checker = HealthChecker(
+            db_path=str(temp_db_path),
+            proxy_url="http://test:8080/health",
+        )
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.elapsed.total_seconds.return_value = 0.01
+
+        with patch.object(httpx.AsyncClient, "head", new=AsyncMock(return_value=mock_response)):
+            result = await checker.check_all_async()
+        await checker.aclose()
+
+        assert result["healthy"] is True
+        assert result["database"]["healthy"] is True
+        assert result["proxy"]["healthy"] is True
+        assert checker._aclient is None
+
+    async def test_check_proxy_async_timeout(self) -> None:
+        """check_proxy_async maps timeouts like the sync check."""
+        checker = HealthChecker(proxy_url="http://test:8080/health")
+
+        with patch.object(
+            httpx.AsyncClient,
+            "head",
+            new=AsyncMock(side_effect=httpx.TimeoutException("Timeout")),
+        ):
+            result = await checker.check_proxy_async()
+        await checker.aclose()
+
+        assert result["healthy"] is False
+        assert "timed out" in result["message"]
+
     def test_to_json_response_format(self, temp_db_path: Path) -> None:
         """Test JSON response format for HTTP endpoint."""
         checker = HealthChecker(
@@ -166,7 +268,7 @@ class TestOverallHealth:
             proxy_url="http://test:8080/health",
         )
 
-        with patch.object(httpx.Client, "get", side_effect=httpx.ConnectError("No proxy")):
+        with patch.object(httpx.Client, "head", side_effect=httpx.ConnectError("No proxy")):
             result = checker.to_json_response()
 
         assert "status" in result
@@ -13,6 +13,7 @@ When run locally (outside Docker), they will be skipped with appropriate message
 """
 
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -34,6 +35,11 @@ def is_running_in_docker() -> bool:
         return False
 
 
+# Evaluated once at import; the skipif markers below would otherwise each
+# stat /.dockerenv and read /proc/1/cgroup during collection
+_IN_DOCKER = is_running_in_docker()
+
+
 class TestNetworkIsolation:
     """Tests for network isolation requirements.
 
@@ -42,7 +48,7 @@ class TestNetworkIsolation:
     """
 
     @pytest.mark.skipif(
-        not is_running_in_docker(),
+        not _IN_DOCKER,
         reason="Network isolation tests must run inside Docker container",
     )
     def test_direct_internet_blocked(self) -> None:
@@ -59,7 +65,7 @@ class TestNetworkIsolation:
                 client.get("https://example.com")
 
     @pytest.mark.skipif(
-        not is_running_in_docker(),
+        not _IN_DOCKER,
         reason="Network isolation tests must run inside Docker container",
     )
     def test_only_allowlisted_domains_via_proxy(self) -> None:
@@ -89,7 +95,7 @@ class TestNetworkIsolation:
             assert "domain_not_allowed" in response.text
 
     @pytest.mark.skipif(
-        not is_running_in_docker(),
+        not _IN_DOCKER,
         reason="Network isolation tests must run inside Docker container",
     )
     def test_read_only_filesystem(self) -> None:
@@ -116,6 +122,15 @@ class TestNetworkIsolation:
         os.remove(tmp_path)
 
 
+# Credential-related env var name fragments, matched in one regex pass per key
+_CREDENTIAL_RE = re.compile(
+    "PASSWORD|SECRET|API_KEY|TOKEN|CREDENTIAL|PRIVATE_KEY|AWS_ACCESS|AWS_SECRET"
+)
+
+# Specific non-sensitive vars allowed despite matching a pattern
+_ALLOWED_CREDENTIAL_VARS = frozenset({"ANTHROPIC_AUTH_TOKEN"})
+
+
 class TestCredentialSafety:
     """Tests for credential safety requirements."""
 
@@ -124,29 +139,12 @@ class TestCredentialSafety:
 
         Acceptance criteria: No credentials in image or runtime.
         """
-        # List of credential-related env var patterns
-        credential_patterns = [
-            "PASSWORD",
-            "SECRET",
-            "API_KEY",
-            "TOKEN",
-            "CREDENTIAL",
-            "PRIVATE_KEY",
-            "AWS_ACCESS",
-            "AWS_SECRET",
-        ]
-
         for key in os.environ:
-            key_upper = key.upper()
-            for pattern in credential_patterns:
-                if pattern in key_upper:
-                    # Allow specific non-sensitive vars
-                    if key in ["ANTHROPIC_AUTH_TOKEN"]:  # Example of allowed
-                        continue
-                    pytest.fail(f"Potential credential found in environment: {key}")
+            if key not in _ALLOWED_CREDENTIAL_VARS and _CREDENTIAL_RE.search(key.upper()):
+                pytest.fail(f"Potential credential found in environment: {key}")
 
     @pytest.mark.skipif(
-        not is_running_in_docker(),
+        not _IN_DOCKER,
         reason="Sensitive path mount test only meaningful inside Docker container",
     )
     def test_no_sensitive_paths_mounted(self) -> None:
@@ -157,23 +155,24 @@ class TestCredentialSafety:
         NOTE: This test only runs inside Docker. Outside Docker, the user's
         .ssh/.aws/.gnupg directories are expected to exist on their machine.
         """
-        # In Docker, the monitor user's home is /home/monitor
-        sensitive_paths = [
-            Path("/home/monitor/.ssh"),
-            Path("/home/monitor/.aws"),
-            Path("/home/monitor/.gnupg"),
-        ]
+        # In Docker, the monitor user's home is /home/monitor; one directory
+        # read covers every sensitive name instead of a stat per path
+        try:
+            with os.scandir("/home/monitor") as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return
 
-        for path in sensitive_paths:
-            if path.exists():
-                pytest.fail(f"Sensitive path should not be mounted: {path}")
+        mounted = sorted(names & {".ssh", ".aws", ".gnupg"})
+        if mounted:
+            pytest.fail(f"Sensitive paths should not be mounted: {mounted}")
 
 
 class TestProxyLogging:
     """Tests for proxy logging requirements."""
 
     @pytest.mark.skipif(
-        not is_running_in_docker(),
+        not _IN_DOCKER,
         reason="Proxy logging tests must run inside Docker container",
     )
     def test_requests_logged_with_timestamps(self) -> None:
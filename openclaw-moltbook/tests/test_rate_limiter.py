@@ -10,7 +10,9 @@ from monitor.rate_limiter import (
     RateLimitConfig,
     RateLimiter,
     RateLimitState,
+    RateLimitStatus,
     RequestBudget,
+    TokenBucket,
     create_rate_limiter,
 )
 
@@ -37,6 +39,23 @@ class TestRateLimitConfig:
         assert config.requests_per_minute == 50
         assert config.requests_per_hour == 1000
 
+    def test_budget_caps(self) -> None:
+        """Budget caps are derived from the minute limit."""
+        config = RateLimitConfig(requests_per_minute=50)
+
+        assert config.budget_caps[RequestBudget.NEW_POSTS] == 20
+        assert config.budget_caps[RequestBudget.RESERVE] == 5
+
+    def test_budget_caps_follow_limit_changes(self) -> None:
+        """Reassigning the minute limit rebuilds the budget caps."""
+        config = RateLimitConfig(requests_per_minute=50)
+        assert config.budget_caps[RequestBudget.NEW_POSTS] == 20
+
+        config.requests_per_minute = 10
+
+        assert config.budget_caps[RequestBudget.NEW_POSTS] == 4
+        assert config.budget_caps[RequestBudget.RESERVE] == 1
+
 
 class TestRateLimitState:
     """Tests for RateLimitState."""
@@ -61,6 +80,9 @@ class TestRateLimitState:
         assert state.limit == 100
         assert state.remaining == 50
         assert state.reset_at is not None
+        assert state.reset_at_mono == pytest.approx(
+            time.monotonic() + 1700000000.0 - time.time(), abs=1.0
+        )
         assert state.last_updated is not None
 
     def test_partial_update(self) -> None:
@@ -72,6 +94,43 @@ class TestRateLimitState:
         assert state.remaining is None
 
 
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_starts_full(self) -> None:
+        """New bucket has its full capacity available."""
+        bucket = TokenBucket(capacity=10, window=60)
+
+        assert bucket.tokens == 10.0
+        assert bucket.used() == 0
+        assert bucket.wait_time() == 0.0
+
+    def test_refills_at_capacity_per_window(self) -> None:
+        """Tokens refill at capacity/window per second, capped at capacity."""
+        bucket = TokenBucket(capacity=60, window=60, last_refill=1000.0)
+        bucket.tokens = 0.0
+
+        assert bucket.refill(1030.0) == 30.0
+        assert bucket.refill(2000.0) == 60.0
+
+    def test_wait_time_for_next_token(self) -> None:
+        """Empty bucket waits one refill interval for the next token."""
+        bucket = TokenBucket(capacity=60, window=60, last_refill=1000.0)
+        bucket.tokens = 0.0
+
+        assert bucket.wait_time() == 1.0
+
+    def test_resize_keeps_used_count(self) -> None:
+        """Changing the capacity keeps the requests already counted."""
+        bucket = TokenBucket(capacity=100, window=60, last_refill=1000.0)
+        bucket.tokens = 97.0
+
+        bucket.resize(2, 60)
+
+        assert bucket.used() == 3
+        assert bucket.tokens == -1.0
+
+
 class TestBudgetAllocation:
     """Tests for budget allocation constants."""
 
@@ -107,14 +166,26 @@ class TestRateLimiter:
         # Next request should be blocked
         assert not limiter.can_request()
 
+    def test_can_request_follows_limit_changes(self) -> None:
+        """Lowering the configured minute limit takes effect on the next check."""
+        limiter = RateLimiter()
+        for _ in range(3):
+            limiter.record_request()
+
+        limiter.config.requests_per_minute = 2
+
+        assert not limiter.can_request()
+        assert limiter.wait_time() > 0
+        assert limiter.get_status()["minute"]["remaining"] == -1
+
     def test_record_request_updates_all_windows(self) -> None:
         """Recording request updates all tracking windows."""
         limiter = RateLimiter()
         limiter.record_request()
 
-        assert len(limiter.minute_requests) == 1
-        assert len(limiter.hour_requests) == 1
-        assert len(limiter.day_requests) == 1
+        assert limiter.minute_bucket.used() == 1
+        assert limiter.hour_bucket.used() == 1
+        assert limiter.day_bucket.used() == 1
 
     def test_record_request_tracks_budget(self) -> None:
         """Recording request tracks budget category."""
@@ -126,6 +197,27 @@ class TestRateLimiter:
         assert limiter.budget_usage[RequestBudget.NEW_POSTS] == 2
         assert limiter.budget_usage[RequestBudget.TRENDING] == 1
 
+    def test_record_requests_batch(self) -> None:
+        """Recording a batch counts every request in it."""
+        limiter = RateLimiter()
+        limiter.record_requests(5, budget=RequestBudget.COMMENTS)
+
+        assert limiter.minute_bucket.used() == 5
+        assert limiter.day_bucket.used() == 5
+        assert limiter.budget_usage[RequestBudget.COMMENTS] == 5
+
+    def test_budget_exhaustion_falls_back_to_reserve(self) -> None:
+        """An exhausted budget may still use the reserve until it runs out."""
+        limiter = RateLimiter(config=RateLimitConfig(requests_per_minute=10))
+        limiter.record_request(budget=RequestBudget.AGENTS)
+
+        # AGENTS cap is 1; reserve (cap 1) is still unused
+        assert limiter.can_request(budget=RequestBudget.AGENTS)
+
+        limiter.record_request(budget=RequestBudget.RESERVE)
+
+        assert not limiter.can_request(budget=RequestBudget.AGENTS)
+
     def test_wait_time_zero_when_can_request(self) -> None:
         """Wait time is zero when requests are allowed."""
         limiter = RateLimiter()
@@ -155,6 +247,19 @@ class TestRateLimiter:
         assert limiter.api_state.limit == 100
         assert limiter.api_state.remaining == 42
 
+    def test_api_reported_exhaustion_blocks_until_reset(self) -> None:
+        """Zero API-reported remaining blocks requests until the reset time."""
+        limiter = RateLimiter()
+        limiter.update_from_response(limit=100, remaining=0, reset_timestamp=time.time() + 30)
+
+        assert not limiter.can_request()
+        assert 0 < limiter.wait_time() <= 30
+
+        limiter.update_from_response(reset_timestamp=time.time() - 1)
+
+        assert limiter.can_request()
+        assert limiter.wait_time() == 0.0
+
     def test_get_status(self) -> None:
         """Status returns comprehensive state."""
         limiter = RateLimiter()
@@ -173,6 +278,35 @@ class TestRateLimiter:
         assert status["minute"]["used"] == 1
         assert status["minute"]["limit"] == 100
         assert status["minute"]["remaining"] == 99
+        assert status["can_request"] is True
+        assert status["wait_time_seconds"] == 0.0
+
+    def test_get_status_when_limited(self) -> None:
+        """Status reports the blocked state computed under the same lock."""
+        limiter = RateLimiter(config=RateLimitConfig(requests_per_minute=1))
+        limiter.record_request()
+
+        status = limiter.get_status()
+
+        assert status["can_request"] is False
+        assert status["wait_time_seconds"] > 0
+
+    def test_snapshot(self) -> None:
+        """Snapshot exposes counts and the blocked state as attributes."""
+        limiter = RateLimiter(config=RateLimitConfig(requests_per_minute=2))
+        limiter.record_request()
+
+        status = limiter.snapshot()
+
+        assert status == RateLimitStatus(
+            minute_used=1, hour_used=1, day_used=1, can_request=True, wait_time=0.0
+        )
+
+        limiter.record_request()
+        status = limiter.snapshot()
+
+        assert status.can_request is False
+        assert status.wait_time > 0
 
     def test_reset_budget(self) -> None:
         """Reset budget clears per-minute usage."""
@@ -212,6 +346,30 @@ class TestRateLimiter:
         warnings = limiter.check_thresholds()
         assert len(warnings) == 0
 
+    def test_check_thresholds_exact_boundary(self) -> None:
+        """A count exactly at the threshold warns despite float rounding."""
+        # 10 * 0.7 is 7.000000000000001 in floating point
+        config = RateLimitConfig(requests_per_minute=10, warning_threshold=0.7)
+        limiter = RateLimiter(config=config)
+
+        for _ in range(6):
+            limiter.record_request()
+        assert limiter.check_thresholds() == []
+
+        limiter.record_request()
+        assert limiter.check_thresholds() == ["Minute limit at 70% (7/10)"]
+
+    def test_check_thresholds_follows_config_changes(self) -> None:
+        """Reassigning the threshold after construction takes effect."""
+        limiter = RateLimiter(config=RateLimitConfig(requests_per_minute=10))
+        for _ in range(5):
+            limiter.record_request()
+        assert limiter.check_thresholds() == []
+
+        limiter.config.warning_threshold = 0.5
+
+        assert limiter.check_thresholds() == ["Minute limit at 50% (5/10)"]
+
 
 class TestRateLimiterConcurrency:
     """Tests for thread safety."""
@@ -1,7 +1,7 @@
 """Tests for the robots.txt compliance module."""
 
-from datetime import timedelta
-from unittest.mock import MagicMock, patch
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -11,10 +11,32 @@ from monitor.robots import (
     RobotsChecker,
     RobotsDirectives,
     RobotsRule,
+    _glob_to_regex,
+    close_shared_clients,
     create_robots_checker,
 )
 
 
+class TestGlobToRegex:
+    """Tests for robots.txt pattern translation."""
+
+    def test_literal_path(self) -> None:
+        """Plain paths become anchored prefixes."""
+        assert _glob_to_regex("/admin/") == "^/admin/"
+
+    def test_wildcard_and_end_anchor(self) -> None:
+        """* becomes .* and a trailing $ stays an anchor."""
+        assert _glob_to_regex("/*.pdf$") == r"^/.*\.pdf$"
+
+    def test_repeated_wildcards_collapse(self) -> None:
+        """Runs of * produce a single .*."""
+        assert _glob_to_regex("/a**b") == "^/a.*b"
+
+    def test_metacharacters_escaped(self) -> None:
+        """Regex metacharacters, including a non-trailing $, are literal."""
+        assert _glob_to_regex("/x$y+(z)?") == r"^/x\$y\+\(z\)\?"
+
+
 class TestRobotsRule:
     """Tests for RobotsRule matching."""
 
@@ -49,6 +71,25 @@ class TestRobotsRule:
         assert rule.matches("/page")
         assert not rule.matches("/page/subpage")
 
+    def test_pattern_compiled_at_construction(self) -> None:
+        """Pattern is compiled once, not per matches() call."""
+        rule = RobotsRule(path="/*/private/", allow=False)
+
+        with patch("monitor.robots.re.compile") as mock_compile:
+            assert rule.matches("/user/private/")
+
+        mock_compile.assert_not_called()
+
+    def test_literal_path_skips_regex(self) -> None:
+        """Plain prefix paths match without running the regex."""
+        rule = RobotsRule(path="/admin/", allow=False)
+
+        with patch.object(rule, "_pattern") as mock_pattern:
+            assert rule.matches("/admin/users")
+            assert not rule.matches("/public")
+
+        mock_pattern.match.assert_not_called()
+
 
 class TestRobotsDirectives:
     """Tests for RobotsDirectives."""
@@ -86,6 +127,34 @@ class TestRobotsDirectives:
         assert directives.is_allowed("/admin/public/")
         assert not directives.is_allowed("/admin/settings")
 
+    def test_rules_added_after_first_check(self) -> None:
+        """Rules appended after a check are honored on the next check."""
+        directives = RobotsDirectives(
+            user_agent="*",
+            rules=[RobotsRule(path="/admin/", allow=False)],
+        )
+        assert directives.is_allowed("/private/")
+
+        directives.rules.append(RobotsRule(path="/private/", allow=False))
+
+        assert not directives.is_allowed("/private/")
+        assert not directives.is_allowed("/admin/")
+
+    def test_wildcard_and_anchor_rules_in_order(self) -> None:
+        """Combined matching keeps first-match-wins across pattern kinds."""
+        directives = RobotsDirectives(
+            user_agent="*",
+            rules=[
+                RobotsRule(path="/*.pdf$", allow=False),
+                RobotsRule(path="/docs/", allow=True),
+                RobotsRule(path="/", allow=False),
+            ],
+        )
+
+        assert not directives.is_allowed("/docs/guide.pdf")
+        assert directives.is_allowed("/docs/guide.html")
+        assert not directives.is_allowed("/other")
+
     def test_crawl_delay(self) -> None:
         """Directives can have crawl delay."""
         directives = RobotsDirectives(
@@ -96,6 +165,43 @@ class TestRobotsDirectives:
         assert directives.crawl_delay == 5.0
 
 
+class TestRobotsCache:
+    """Tests for RobotsCache expiry."""
+
+    def test_not_expired_before_deadline(self) -> None:
+        """Entry is live until expires_at."""
+        now = datetime.now(UTC)
+        entry = RobotsCache(content="", fetched_at=now, expires_at=now + timedelta(hours=1))
+
+        assert not entry.is_expired()
+
+    def test_expired_after_deadline(self) -> None:
+        """Entry with expires_at in the past is expired."""
+        now = datetime.now(UTC)
+        entry = RobotsCache(content="", fetched_at=now, expires_at=now - timedelta(seconds=1))
+
+        assert entry.is_expired()
+
+    def test_expiry_uses_monotonic_clock(self) -> None:
+        """Expiry is compared against time.monotonic, not the wall clock."""
+        now = datetime.now(UTC)
+        entry = RobotsCache(content="", fetched_at=now, expires_at=now + timedelta(hours=1))
+
+        with patch("monitor.robots.time.monotonic", return_value=entry.expires_at_ts + 1):
+            assert entry.is_expired()
+
+    def test_equality_ignores_memoized_decisions(self) -> None:
+        """Entries for the same content compare equal after one is used."""
+        now = datetime.now(UTC)
+        entry = RobotsCache(content="", fetched_at=now, expires_at=now + timedelta(hours=1))
+        other = RobotsCache(content="", fetched_at=now, expires_at=now + timedelta(hours=1))
+
+        entry.allow_decisions["/a"] = True
+        entry._matched = True
+
+        assert entry == other
+
+
 class TestRobotsChecker:
     """Tests for RobotsChecker."""
 
@@ -163,6 +269,31 @@ Disallow: /admin/  # Inline comment
         assert len(directives) == 1
         assert len(directives[0].rules) == 1
 
+    def test_parse_values_with_colons_and_no_spaces(self) -> None:
+        """Only the first colon splits key and value; spacing is optional."""
+        checker = RobotsChecker()
+
+        content = """
+USER-AGENT:*
+Disallow:/a:b/#comment
+Sitemap:https://example.com/sitemap.xml
+"""
+        directives = checker._parse_robots_txt(content)
+
+        assert directives[0].user_agent == "*"
+        assert directives[0].rules[0].path == "/a:b/"
+        assert directives[0].sitemaps == ["https://example.com/sitemap.xml"]
+
+    def test_parse_line_endings_and_unknown_keys(self) -> None:
+        """CR and CRLF line endings both work; indented keys count, unknown keys do not."""
+        checker = RobotsChecker()
+
+        content = "User-agent: *\r  Disallow : /a/\r\nHost: example.com\r\nNoindex: /b/\n"
+        directives = checker._parse_robots_txt(content)
+
+        assert len(directives) == 1
+        assert [rule.path for rule in directives[0].rules] == ["/a/"]
+
     def test_find_matching_directives_exact(self) -> None:
         """Find exact user-agent match."""
         checker = RobotsChecker(user_agent="OpenClawMonitor")
@@ -249,6 +380,38 @@ Disallow: /admin/
 
         assert cache is None
 
+    async def test_is_allowed_async(self) -> None:
+        """is_allowed_async fetches without blocking and then uses the cache."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = """
+User-agent: *
+Disallow: /admin/
+"""
+        mock_get = AsyncMock(return_value=mock_response)
+
+        checker = RobotsChecker()
+        with patch.object(httpx.AsyncClient, "get", new=mock_get):
+            assert not await checker.is_allowed_async("https://example.com/admin/")
+            assert await checker.is_allowed_async("https://example.com/public")
+        await checker.aclose()
+
+        mock_get.assert_awaited_once_with("https://example.com/robots.txt")
+        assert "https://example.com" in checker.cache
+        assert checker._aclient is None
+
+    async def test_fetch_robots_txt_async_timeout(self) -> None:
+        """Async fetch failures return None and are negative-cached."""
+        mock_get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+
+        checker = RobotsChecker()
+        with patch.object(httpx.AsyncClient, "get", new=mock_get):
+            assert await checker.fetch_robots_txt_async("https://example.com") is None
+            assert await checker.is_allowed_async("https://example.com/any")
+        await checker.aclose()
+
+        assert mock_get.await_count == 1
+
     @patch.object(httpx.Client, "get")
     def test_is_allowed_uses_cache(self, mock_get: MagicMock) -> None:
         """is_allowed uses cached robots.txt."""
@@ -272,6 +435,57 @@ Disallow: /admin/
         # Should only fetch once
         assert mock_get.call_count == 1
 
+    @patch.object(httpx.Client, "get")
+    def test_matching_directives_memoized_per_entry(self, mock_get: MagicMock) -> None:
+        """User-agent matching runs once per cached robots.txt."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = """
+User-agent: *
+Disallow: /admin/
+"""
+        mock_get.return_value = mock_response
+
+        checker = RobotsChecker()
+        with patch.object(
+            RobotsChecker,
+            "_find_matching_directives",
+            autospec=True,
+            side_effect=RobotsChecker._find_matching_directives,
+        ) as mock_find:
+            assert checker.is_allowed("https://example.com/public")
+            assert not checker.is_allowed("https://example.com/admin/")
+
+        assert mock_find.call_count == 1
+
+    @patch.object(httpx.Client, "get")
+    def test_allow_decisions_memoized_per_path(self, mock_get: MagicMock) -> None:
+        """Repeated checks of a path reuse the earlier decision."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = """
+User-agent: *
+Disallow: /admin/
+"""
+        mock_get.return_value = mock_response
+
+        checker = RobotsChecker()
+        with patch.object(
+            RobotsDirectives,
+            "is_allowed",
+            autospec=True,
+            side_effect=RobotsDirectives.is_allowed,
+        ) as mock_is_allowed:
+            assert not checker.is_allowed("https://example.com/admin/")
+            assert not checker.is_allowed("https://example.com/admin/")
+            assert checker.is_allowed("https://example.com/public")
+
+        assert mock_is_allowed.call_count == 2
+
+        # A refetch replaces the entry and its memoized decisions
+        mock_response.text = "User-agent: *\nAllow: /\n"
+        assert checker.is_allowed("https://example.com/admin/", refresh=True)
+
     @patch.object(httpx.Client, "get")
     def test_is_allowed_allows_on_error(self, mock_get: MagicMock) -> None:
         """Allow access if robots.txt cannot be fetched."""
@@ -282,6 +496,23 @@ Disallow: /admin/
 
         assert result is True
 
+    @patch.object(httpx.Client, "get")
+    def test_failed_fetch_is_negative_cached(self, mock_get: MagicMock) -> None:
+        """A failed fetch is not retried for every URL on the same site."""
+        mock_get.side_effect = httpx.ConnectError("Connection refused")
+
+        checker = RobotsChecker()
+
+        assert checker.is_allowed("https://example.com/a")
+        assert checker.is_allowed("https://example.com/b")
+        assert checker.get_crawl_delay("https://example.com") is None
+        assert checker.get_sitemaps("https://example.com") == []
+        assert mock_get.call_count == 1
+
+        # An explicit refresh bypasses the negative cache
+        checker.is_allowed("https://example.com/a", refresh=True)
+        assert mock_get.call_count == 2
+
     @patch.object(httpx.Client, "get")
     def test_get_crawl_delay(self, mock_get: MagicMock) -> None:
         """Get crawl delay from robots.txt."""
@@ -315,11 +546,55 @@ Crawl-delay: 10
 
         assert len(checker.cache) == 0
 
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Beyond max_entries the least recently used site is dropped."""
+        checker = RobotsChecker(max_entries=2)
+        for site in ("https://a.example", "https://b.example"):
+            checker._store_response(site, f"{site}/robots.txt", httpx.Response(404))
+
+        # A cache hit makes a.example the most recently used site
+        checker._lookup_cache("https://a.example", refresh=False)
+        checker._store_response(
+            "https://c.example", "https://c.example/robots.txt", httpx.Response(404)
+        )
+
+        assert list(checker.cache) == ["https://a.example", "https://c.example"]
+
     def test_context_manager(self) -> None:
         """Checker works as context manager."""
         with RobotsChecker() as checker:
             assert checker is not None
 
+    def test_checkers_share_client_pool(self) -> None:
+        """Checkers with the same user-agent reuse one httpx.Client."""
+        checker_a = RobotsChecker(user_agent="PoolTest")
+        checker_b = RobotsChecker(user_agent="PoolTest")
+        checker_c = RobotsChecker(user_agent="OtherAgent")
+
+        shared = checker_a._get_client()
+        assert checker_b._get_client() is shared
+        assert checker_c._get_client() is not shared
+
+        checker_a.close()
+        assert checker_a._client is None
+        assert not shared.is_closed
+
+        close_shared_clients()
+        assert shared.is_closed
+
+    def test_last_close_closes_pooled_client(self) -> None:
+        """The pooled client is closed when its last checker closes."""
+        checker_a = RobotsChecker(user_agent="PoolTest")
+        checker_b = RobotsChecker(user_agent="PoolTest")
+        shared = checker_a._get_client()
+        checker_b._get_client()
+
+        checker_a.close()
+        assert not shared.is_closed
+
+        checker_b.close()
+        assert shared.is_closed
+
 
 class TestCreateRobotsChecker:
     """Tests for create_robots_checker factory function."""
@@ -1,5 +1,6 @@
 """Tests for the polling scheduler module."""
 
+from collections import deque
 from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
@@ -13,6 +14,7 @@ from monitor.scheduler import (
     PollingScheduler,
     PollState,
     create_scheduler,
+    run_scheduler_async,
 )
 
 
@@ -59,6 +61,41 @@ class TestDefaultIntervals:
 
         assert config.default == timedelta(hours=6)
 
+    def test_custom_interval_is_clamped_per_activity(self) -> None:
+        """A custom PollingInterval precomputes its own clamped intervals."""
+        scheduler = PollingScheduler()
+        narrow = PollingInterval(
+            default=timedelta(minutes=10),
+            minimum=timedelta(minutes=8),
+            maximum=timedelta(minutes=12),
+        )
+
+        with patch.dict(DEFAULT_INTERVALS, {EndpointType.NEW_POSTS: narrow}):
+            high = scheduler._get_adaptive_interval(EndpointType.NEW_POSTS, (20.0, False))
+            low = scheduler._get_adaptive_interval(EndpointType.NEW_POSTS, (0.5, False))
+            normal = scheduler._get_adaptive_interval(EndpointType.NEW_POSTS, (5.0, False))
+
+        assert high == timedelta(minutes=8)
+        assert low == timedelta(minutes=12)
+        assert normal == timedelta(minutes=10)
+
+    def test_interval_is_frozen(self) -> None:
+        """Fields cannot be reassigned, so the clamped table cannot go stale."""
+        import dataclasses
+
+        config = DEFAULT_INTERVALS[EndpointType.NEW_POSTS]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.default = timedelta(minutes=1)  # type: ignore[misc]
+
+    def test_for_activity(self) -> None:
+        """for_activity halves, doubles or keeps the default within bounds."""
+        config = DEFAULT_INTERVALS[EndpointType.NEW_POSTS]
+
+        assert config.for_activity(high=True, low=False) == timedelta(minutes=2, seconds=30)
+        assert config.for_activity(high=False, low=True) == timedelta(minutes=10)
+        assert config.for_activity(high=False, low=False) == timedelta(minutes=5)
+
 
 class TestPollState:
     """Tests for PollState."""
@@ -108,6 +145,44 @@ class TestPollState:
         assert state.error_count == 1
         assert state.last_error == "Connection failed"
 
+    def test_to_status_cached_until_update(self) -> None:
+        """to_status reuses its dict until the state changes."""
+        state = PollState(endpoint=EndpointType.NEW_POSTS)
+
+        status = state.to_status()
+        assert state.to_status() is status
+        assert status["last_poll_at"] is None
+
+        state.record_poll(posts_fetched=3, interval=timedelta(minutes=5))
+        status = state.to_status()
+        assert status["posts_fetched_last"] == 3
+        assert status["current_interval"] == 300.0
+
+        state.record_error("boom")
+        assert state.to_status()["last_error"] == "boom"
+
+    def test_persisted_round_trip(self) -> None:
+        """restore() reads what to_persisted() writes."""
+        state = PollState(endpoint=EndpointType.NEW_POSTS)
+        state.record_poll(posts_fetched=7, last_post_id="post1")
+
+        restored = PollState(endpoint=EndpointType.NEW_POSTS)
+        restored.restore(state.to_persisted())
+
+        assert restored.last_post_id == "post1"
+        assert restored.last_poll_at == state.last_poll_at
+        assert restored.total_posts_fetched == 7
+        assert restored.to_persisted() == state.to_persisted()
+
+    def test_restore_accepts_iso_timestamps(self) -> None:
+        """State saved with ISO last_poll_at strings still restores."""
+        state = PollState(endpoint=EndpointType.NEW_POSTS)
+        state.restore({"last_poll_at": "2024-01-01T00:00:00+00:00"})
+
+        assert state.last_poll_at is not None
+        assert state.last_poll_at.year == 2024
+        assert isinstance(state.to_persisted()["last_poll_at"], float)
+
 
 class TestActivityTracker:
     """Tests for ActivityTracker."""
@@ -119,6 +194,16 @@ class TestActivityTracker:
         assert len(tracker.samples) == 0
         assert tracker.get_rate() == 0.0
 
+    def test_equality_ignores_memoized_snapshot(self) -> None:
+        """Taking a snapshot does not change how trackers compare."""
+        tracker = ActivityTracker(samples=deque([(1.0, 5)]))
+        other = ActivityTracker(samples=deque([(1.0, 5)]))
+
+        tracker._snapshot_key = (1, 1.0)
+        tracker._snapshot = (5.0, False)
+
+        assert tracker == other
+
     def test_record_activity(self) -> None:
         """record_activity adds samples."""
         tracker = ActivityTracker()
@@ -160,19 +245,89 @@ class TestActivityTracker:
 
     def test_cleanup_old_samples(self) -> None:
         """Old samples are cleaned up."""
-        from datetime import UTC, datetime
-
         tracker = ActivityTracker(window_size=timedelta(minutes=1))
 
         # Add old sample
-        old_time = datetime.now(UTC) - timedelta(hours=1)
-        tracker.samples.append((old_time, 10))
+        with patch("monitor.scheduler.time.monotonic", return_value=1000.0):
+            tracker.record_activity(10)
 
-        # Add new sample
-        tracker.record_activity(5)
+        # Add new sample an hour later
+        with patch("monitor.scheduler.time.monotonic", return_value=1000.0 + 3600):
+            tracker.record_activity(5)
 
-        # Only new sample should remain
+        # Only new sample should remain, and the running total follows it
         assert len(tracker.samples) == 1
+        assert tracker._total_count == 5
+
+    def test_record_activity_batch(self) -> None:
+        """record_activity_batch adds every sample and trims the window once."""
+        tracker = ActivityTracker(window_size=timedelta(minutes=1))
+
+        with patch("monitor.scheduler.time.monotonic", return_value=1000.0):
+            tracker.record_activity(10)
+
+        with patch("monitor.scheduler.time.monotonic", return_value=1000.0 + 3600):
+            tracker.record_activity_batch([1, 2, 3])
+
+        assert list(tracker.samples) == [(4600.0, 1), (4600.0, 2), (4600.0, 3)]
+        assert tracker._total_count == 6
+
+    def test_concurrent_recording_keeps_total(self) -> None:
+        """The running total matches the samples under concurrent use."""
+        import sys
+        import threading
+
+        tracker = ActivityTracker(window_size=timedelta(milliseconds=1))
+
+        def record() -> None:
+            for i in range(2000):
+                tracker.record_activity(i % 7)
+                tracker.snapshot()
+
+        threads = [threading.Thread(target=record) for _ in range(5)]
+        # Switch threads often so unguarded updates would interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert tracker._total_count == sum(count for _, count in tracker.samples)
+
+    def test_is_spiking(self) -> None:
+        """A burst well above the historical rate is a spike."""
+        tracker = ActivityTracker()
+
+        with patch("monitor.scheduler.time.monotonic") as mock_monotonic:
+            for minute, count in enumerate([5, 5, 5, 100]):
+                mock_monotonic.return_value = 1000.0 + minute * 60
+                tracker.record_activity(count)
+
+            assert tracker.get_rate() == pytest.approx(115 / 3)
+            assert tracker.is_spiking()
+
+    def test_snapshot_memoized_between_samples(self) -> None:
+        """snapshot recomputes only after the window changes."""
+        tracker = ActivityTracker()
+        tracker.record_activity(10)
+        tracker.record_activity(20)
+
+        with patch.object(ActivityTracker, "_rate", autospec=True, return_value=5.0) as mock_rate:
+            assert tracker.snapshot() == (5.0, False)
+            assert tracker.snapshot() == (5.0, False)
+            assert mock_rate.call_count == 1
+
+            tracker.record_activity(30)
+            tracker.snapshot()
+            assert mock_rate.call_count == 2
+
+    def test_snapshot_empty(self) -> None:
+        """An empty window reports no activity."""
+        assert ActivityTracker().snapshot() == (0.0, False)
 
 
 class TestPollingScheduler:
@@ -196,6 +351,22 @@ class TestPollingScheduler:
         expected = min(config.default * 2, config.maximum)
         assert interval == expected
 
+    def test_get_adaptive_interval_by_activity(self) -> None:
+        """Snapshots pick the minimum, halved, default or doubled interval."""
+        scheduler = PollingScheduler()
+        config = DEFAULT_INTERVALS[EndpointType.HOT_POSTS]
+        interval = scheduler._get_adaptive_interval
+
+        assert interval(EndpointType.HOT_POSTS, (0.0, True)) == config.minimum
+        assert interval(EndpointType.HOT_POSTS, (50.0, False)) == max(
+            config.default * 0.5, config.minimum
+        )
+        assert interval(EndpointType.HOT_POSTS, (5.0, False)) == config.default
+        assert interval(EndpointType.HOT_POSTS, (0.5, False)) == min(
+            config.default * 2, config.maximum
+        )
+        assert interval(EndpointType.COMMENTS, (5.0, False)) == timedelta(minutes=5)
+
     def test_record_poll_result(self) -> None:
         """record_poll_result updates state."""
         scheduler = PollingScheduler()
@@ -209,6 +380,23 @@ class TestPollingScheduler:
         assert state.last_post_id == "post123"
         assert state.posts_fetched_last == 10
 
+    def test_record_poll_results(self) -> None:
+        """record_poll_results updates each polled endpoint and the tracker."""
+        scheduler = PollingScheduler()
+        scheduler.record_poll_results(
+            [
+                (EndpointType.NEW_POSTS, 10, "post123"),
+                (EndpointType.HOT_POSTS, 4, None),
+            ]
+        )
+
+        new_state = scheduler.poll_states[EndpointType.NEW_POSTS]
+        hot_state = scheduler.poll_states[EndpointType.HOT_POSTS]
+        assert new_state.last_post_id == "post123"
+        assert new_state.posts_fetched_last == 10
+        assert hot_state.posts_fetched_last == 4
+        assert len(scheduler.activity_tracker.samples) == 2
+
     def test_record_poll_error(self) -> None:
         """record_poll_error updates state."""
         scheduler = PollingScheduler()
@@ -231,6 +419,30 @@ class TestPollingScheduler:
 
         callback.assert_called_once_with(EndpointType.NEW_POSTS)
 
+    def test_poll_job_runs_current_callback(self) -> None:
+        """Poll jobs call the callback set at run time and record its errors."""
+        scheduler = PollingScheduler()
+        job = scheduler._create_poll_job(EndpointType.NEW_POSTS)
+
+        scheduler.poll_callback = MagicMock(side_effect=RuntimeError("boom"))
+        job()
+
+        scheduler.poll_callback.assert_called_once_with(EndpointType.NEW_POSTS)
+        state = scheduler.poll_states[EndpointType.NEW_POSTS]
+        assert state.error_count == 1
+        assert state.last_error == "boom"
+
+    def test_poll_job_skipped_after_shutdown(self) -> None:
+        """Poll jobs do nothing once shutdown is signalled."""
+        scheduler = PollingScheduler()
+        scheduler.poll_callback = MagicMock()
+        job = scheduler._create_poll_job(EndpointType.NEW_POSTS)
+
+        scheduler.shutdown_event.set()
+        job()
+
+        scheduler.poll_callback.assert_not_called()
+
     def test_get_status(self) -> None:
         """get_status returns comprehensive status."""
         scheduler = PollingScheduler()
@@ -292,11 +504,102 @@ class TestPollingScheduler:
         assert not scheduler._running
         assert scheduler.scheduler is None
 
+    def test_update_job_interval_reschedules_only_on_change(self) -> None:
+        """The APScheduler job is rescheduled only when its interval changes."""
+        scheduler = PollingScheduler()
+        scheduler.start(MagicMock())
+        try:
+            assert scheduler.scheduler is not None
+            with patch.object(scheduler.scheduler, "reschedule_job") as mock_reschedule:
+                # No activity doubles the interval once, then it stays put
+                scheduler._update_job_interval(EndpointType.NEW_POSTS)
+                scheduler._update_job_interval(EndpointType.NEW_POSTS)
+
+            mock_reschedule.assert_called_once()
+        finally:
+            scheduler.stop(wait=False)
+
+    def test_signal_requests_shutdown_only(self) -> None:
+        """Signals set shutdown_event and leave teardown to stop()."""
+        scheduler = PollingScheduler()
+        scheduler.start(MagicMock())
+        try:
+            scheduler._handle_signal(15, None)
+
+            assert scheduler.shutdown_event.is_set()
+            assert scheduler._running
+            assert scheduler.scheduler is not None
+        finally:
+            scheduler.stop(wait=False)
+
+        assert not scheduler._running
+
+    def test_stop_restores_signal_handlers(self) -> None:
+        """stop() hands SIGINT and SIGTERM back to their previous handlers."""
+        import signal
+
+        before = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+        scheduler = PollingScheduler()
+        scheduler.start(MagicMock())
+        try:
+            assert signal.getsignal(signal.SIGINT) == scheduler._handle_signal
+        finally:
+            scheduler.stop(wait=False)
+
+        assert {sig: signal.getsignal(sig) for sig in before} == before
+
     def test_stop_when_not_running(self) -> None:
         """Stop when not running does nothing."""
         scheduler = PollingScheduler()
         scheduler.stop()  # Should not raise
 
+    async def test_run_async_polls_until_stopped(self) -> None:
+        """run_scheduler_async polls on asyncio tasks and returns on stop()."""
+        scheduler = PollingScheduler()
+        polled: list[EndpointType] = []
+
+        def callback(endpoint_type: EndpointType) -> None:
+            polled.append(endpoint_type)
+            scheduler.stop()
+
+        fast = PollingInterval(
+            default=timedelta(milliseconds=10),
+            minimum=timedelta(milliseconds=10),
+            maximum=timedelta(milliseconds=10),
+        )
+        with patch.dict(DEFAULT_INTERVALS, {EndpointType.NEW_POSTS: fast}):
+            await run_scheduler_async(scheduler, callback)
+
+        assert polled == [EndpointType.NEW_POSTS]
+        assert scheduler.scheduler is None
+        assert not scheduler._running
+        state = scheduler.poll_states[EndpointType.NEW_POSTS]
+        assert state.current_interval == timedelta(milliseconds=10)
+
+    async def test_run_async_survives_job_errors(self) -> None:
+        """An error outside the poll callback does not stop the polling loops."""
+        scheduler = PollingScheduler()
+        polled: list[EndpointType] = []
+
+        def callback(endpoint_type: EndpointType) -> None:
+            polled.append(endpoint_type)
+            if len(polled) == 2:
+                scheduler.stop()
+
+        fast = PollingInterval(
+            default=timedelta(milliseconds=10),
+            minimum=timedelta(milliseconds=10),
+            maximum=timedelta(milliseconds=10),
+        )
+        with (
+            patch.dict(DEFAULT_INTERVALS, {EndpointType.NEW_POSTS: fast}),
+            patch.object(scheduler, "_update_job_interval", side_effect=[IndexError("boom"), None]),
+        ):
+            await run_scheduler_async(scheduler, callback)
+
+        assert polled == [EndpointType.NEW_POSTS, EndpointType.NEW_POSTS]
+        assert not scheduler._running
+
 
 class TestCreateScheduler:
     """Tests for create_scheduler factory function."""
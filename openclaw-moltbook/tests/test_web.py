@@ -6,26 +6,74 @@ Tests cover:
 - CORS and middleware
 """
 
+import json
+from collections.abc import AsyncGenerator, Callable
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
+import duckdb
+import httpx
 import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
+from monitor import web
+from monitor.health import HealthChecker
 from monitor.web import app
 
-client = TestClient(app)
+
+@pytest.fixture(autouse=True)
+def reset_health_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without a cached health result or shared checker."""
+    monkeypatch.setattr(app.state, "health_cache", None, raising=False)
+    monkeypatch.setattr(app.state, "health", None, raising=False)
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(app: FastAPI) -> dict[str, Any]:
+    """The app's OpenAPI schema, as served at /openapi.json."""
+    return app.openapi()
+
+
+@pytest.fixture
+async def checker() -> AsyncGenerator[HealthChecker, None]:
+    """HealthChecker for calling the endpoint handlers directly."""
+    health_checker = HealthChecker()
+    try:
+        yield health_checker
+    finally:
+        await health_checker.aclose()
+
+
+def response_json(response: JSONResponse) -> Any:
+    """Decode the body a handler rendered, without an HTTP round trip."""
+    return json.loads(response.body)
+
+
+def count_proxy_checks(monkeypatch: pytest.MonkeyPatch) -> list[None]:
+    """Make HealthChecker's proxy check succeed and record each call.
+
+    Returns:
+        List that gains one entry per proxy check
+    """
+    calls: list[None] = []
+
+    async def check_proxy_async(self: HealthChecker) -> dict[str, Any]:
+        calls.append(None)
+        return {"healthy": True, "message": "OK"}
+
+    monkeypatch.setattr(HealthChecker, "check_proxy_async", check_proxy_async)
+    return calls
 
 
 class TestRootEndpoint:
     """Tests for root endpoint."""
 
-    def test_root_returns_api_info(self) -> None:
+    async def test_root_returns_api_info(self) -> None:
         """Test root endpoint returns API information."""
-        response = client.get("/")
-        assert response.status_code == 200
+        data = await web.root()
 
-        data = response.json()
         assert data["name"] == "OpenClaw Moltbook Monitor"
         assert data["version"] == "0.1.0"
         assert data["docs"] == "/docs"
@@ -35,81 +83,125 @@ class TestRootEndpoint:
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_returns_200_when_healthy(self, temp_db_path: Path) -> None:
-        """Test health endpoint returns 200 when system is healthy."""
-        with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-            mock_proxy.return_value = {"healthy": True, "message": "OK"}
+    @pytest.mark.parametrize(
+        ("db_ok", "proxy_ok", "expected_status"),
+        # Overall health follows the database; the proxy is reported but not required
+        [(True, True, 200), (True, False, 200), (False, True, 503), (False, False, 503)],
+    )
+    async def test_health_status_and_components(
+        self,
+        checker: HealthChecker,
+        stub_health: Callable[..., None],
+        db_ok: bool,
+        proxy_ok: bool,
+        expected_status: int,
+    ) -> None:
+        """Both health endpoints report the component results and overall status."""
+        stub_health(
+            check_database={"healthy": db_ok, "message": "DB"},
+            check_proxy_async={"healthy": proxy_ok, "message": "Proxy"},
+        )
+
+        cache = web.HealthCache()
+        response = await web.health_check(checker, cache)
+
+        assert response.status_code == expected_status
+        data = response_json(response)
+        assert data["status"] == ("healthy" if expected_status == 200 else "unhealthy")
+        assert "timestamp" in data
+
+        response = await web.detailed_health(checker, cache)
+
+        assert response.status_code == 200
+        data = response_json(response)
+        assert "status" in data
+        assert "timestamp" in data
+        assert data["components"]["database"]["healthy"] is db_ok
+        assert data["components"]["proxy"]["healthy"] is proxy_ok
 
-            response = client.get("/health")
+    async def test_health_result_cached_briefly(
+        self, aclient: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Probes within the cache TTL reuse one round of checks."""
+        proxy_calls = count_proxy_checks(monkeypatch)
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert "timestamp" in data
+        assert (await aclient.get("/health")).status_code == 200
+        assert (await aclient.get("/api/health")).status_code == 200
 
-    def test_health_returns_503_when_unhealthy(self) -> None:
-        """Test health endpoint returns 503 when system is unhealthy."""
-        with patch("monitor.health.HealthChecker.check_database") as mock_db:
-            mock_db.return_value = {"healthy": False, "message": "DB error"}
+        assert len(proxy_calls) == 1
 
-            with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-                mock_proxy.return_value = {"healthy": False, "message": "Proxy error"}
+    async def test_health_cache_expires(
+        self, aclient: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Checks run again once the cached result is older than the TTL."""
+        proxy_calls = count_proxy_checks(monkeypatch)
 
-                response = client.get("/health")
+        await aclient.get("/health")
+        monkeypatch.setattr(web, "HEALTH_CACHE_TTL", 0.0)
+        await aclient.get("/health")
 
-                assert response.status_code == 503
-                data = response.json()
-                assert data["status"] == "unhealthy"
+        assert len(proxy_calls) == 2
 
+    def test_checker_shared_across_requests(self, stub_health: Callable[..., None]) -> None:
+        """Requests reuse one HealthChecker created at startup."""
+        stub_health(check_proxy_async={"healthy": True, "message": "OK"})
 
-class TestDetailedHealthEndpoint:
-    """Tests for detailed health API endpoint."""
+        with TestClient(app) as lifespan_client:
+            checker = app.state.health
+            assert checker is not None
 
-    def test_detailed_health_returns_components(self, temp_db_path: Path) -> None:
-        """Test detailed health endpoint returns component status."""
-        with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-            mock_proxy.return_value = {"healthy": True, "message": "OK"}
+            lifespan_client.get("/health")
+            app.state.health_cache.status = None
+            lifespan_client.get("/api/health")
 
-            response = client.get("/api/health")
+            assert app.state.health is checker
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "status" in data
-            assert "timestamp" in data
-            assert "components" in data
-            assert "database" in data["components"]
-            assert "proxy" in data["components"]
+        # Shutdown closes and drops the shared checker and cache
+        assert app.state.health is None
+        assert app.state.health_cache is None
 
-    def test_detailed_health_shows_unhealthy_components(self) -> None:
-        """Test detailed health shows which components are unhealthy."""
-        with patch("monitor.health.HealthChecker.check_database") as mock_db:
-            mock_db.return_value = {"healthy": True, "message": "DB OK"}
+    def test_shared_checker_does_not_lock_database(
+        self, stub_health: Callable[..., None], temp_db_path: Path
+    ) -> None:
+        """The lifespan checker releases the database between requests."""
+        stub_health(check_proxy_async={"healthy": True, "message": "OK"})
+        # An existing file is checked read-only
+        duckdb.connect(str(temp_db_path)).close()
 
-            with patch("monitor.health.HealthChecker.check_proxy") as mock_proxy:
-                mock_proxy.return_value = {"healthy": False, "message": "Proxy down"}
+        with TestClient(app) as lifespan_client:
+            assert lifespan_client.get("/health").status_code == 200
 
-                response = client.get("/api/health")
+            # Fails with a configuration conflict if the checker holds the file
+            writer = duckdb.connect(str(temp_db_path), read_only=False)
+            writer.close()
 
-                data = response.json()
-                assert data["components"]["database"]["healthy"] is True
-                assert data["components"]["proxy"]["healthy"] is False
+    def test_each_startup_gets_its_own_cache(self, stub_health: Callable[..., None]) -> None:
+        """A cached result and its lock live on the app, not across event loops."""
+        stub_health(check_proxy_async={"healthy": True, "message": "OK"})
+
+        with TestClient(app) as first_client:
+            first_client.get("/health")
+            first = app.state.health_cache
+        with TestClient(app):
+            second = app.state.health_cache
+
+        assert first.status is not None
+        assert second is not first
+        assert second.status is None
 
 
 class TestOpenAPIDocumentation:
     """Tests for OpenAPI documentation."""
 
-    def test_openapi_schema_available(self) -> None:
+    def test_openapi_schema_available(self, openapi_schema: dict[str, Any]) -> None:
         """Test OpenAPI schema is accessible."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["info"]["title"] == "OpenClaw Moltbook Monitor"
-        assert "paths" in data
-        assert "/health" in data["paths"]
+        assert openapi_schema["info"]["title"] == "OpenClaw Moltbook Monitor"
+        assert "paths" in openapi_schema
+        assert "/health" in openapi_schema["paths"]
 
-    def test_docs_endpoint_available(self) -> None:
+    async def test_docs_endpoint_available(self, aclient: httpx.AsyncClient) -> None:
         """Test Swagger UI docs endpoint is accessible."""
-        response = client.get("/docs")
+        # HEAD returns the headers without transferring the Swagger UI page
+        response = await aclient.head("/docs")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]